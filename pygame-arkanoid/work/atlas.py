@@ -0,0 +1,127 @@
+import pygame
+
+from game_objects import Ball, Firework, Laser, Paddle, PowerUp
+
+
+class SpriteAtlas:
+    """
+    Pre-rendered sprites, packed side by side on two sheets converted to the
+    display format once: an opaque one for the rectangular sprites and a
+    per-pixel alpha one for the round ball. Each tile is a subsurface of its
+    sheet, so frames draw sprites with Surface.blits instead of rendering text
+    and calling pygame.draw for every object.
+    """
+    PADDING = 1 # Pixels between tiles, so nothing bleeds into its neighbour
+
+    def __init__(self, tiles):
+        """tiles maps names to surfaces; surfaces with SRCALPHA go on the alpha sheet."""
+        self._tiles = {}
+        groups = {False: [], True: []}
+        for name, surface in tiles.items():
+            groups[bool(surface.get_flags() & pygame.SRCALPHA)].append((name, surface))
+        for has_alpha, group in groups.items():
+            if not group:
+                continue
+            width = sum(surface.get_width() + self.PADDING for _, surface in group)
+            height = max(surface.get_height() for _, surface in group)
+            sheet = pygame.Surface((width, height), pygame.SRCALPHA if has_alpha else 0)
+            x = 0
+            areas = []
+            for name, surface in group:
+                sheet.blit(surface, (x, 0))
+                areas.append((name, pygame.Rect(x, 0, surface.get_width(), surface.get_height())))
+                x += surface.get_width() + self.PADDING
+            if pygame.display.get_surface() is not None:
+                sheet = sheet.convert_alpha() if has_alpha else sheet.convert()
+            for name, area in areas:
+                self._tiles[name] = sheet.subsurface(area)
+
+    def get(self, name):
+        """Returns the tile called name, or None if the atlas has none."""
+        return self._tiles.get(name)
+
+    def names(self):
+        """Names of every tile."""
+        return list(self._tiles)
+
+
+class GlyphAtlas:
+    """
+    Bitmap font for changing numbers: the digits, separators and a few fixed labels
+    rasterized once for one font and colour and packed on a SpriteAtlas. A string is
+    drawn by blitting one cell per label or character, so a new score costs a few
+    blits and never reaches FreeType. Digits share the widest digit's advance, so a
+    counter doesn't shift sideways as it changes.
+    """
+    CHARACTERS = "0123456789,.:+-/ "
+
+    def __init__(self, font, color, labels=()):
+        self.labels = sorted(labels, key=len, reverse=True) # Longest first, so no label hides a longer one
+        texts = list(self.CHARACTERS) + self.labels
+        self._atlas = SpriteAtlas({text: font.render(text, True, color) for text in texts})
+        self.height = font.get_height()
+        digit_advance = max(font.size(digit)[0] for digit in "0123456789")
+        self._advances = {text: digit_advance if text.isdigit() else font.size(text)[0] for text in texts}
+
+    def _tokens(self, text):
+        """Splits text into labels and single characters; raises ValueError if a character has no glyph."""
+        tokens = []
+        index = 0
+        while index < len(text):
+            for label in self.labels:
+                if text.startswith(label, index):
+                    break
+            else:
+                label = text[index]
+                if label not in self._advances:
+                    raise ValueError(f"no glyph for {label!r}")
+            tokens.append(label)
+            index += len(label)
+        return tokens
+
+    def size(self, text):
+        """Width and height of text drawn with cells()."""
+        return sum(self._advances[token] for token in self._tokens(text)), self.height
+
+    def cells(self, text, position):
+        """Blit commands ((surface, position) pairs) drawing text with its top-left at position."""
+        x, y = position
+        commands = []
+        for token in self._tokens(text):
+            cell = self._atlas.get(token)
+            advance = self._advances[token]
+            commands.append((cell, (x + (advance - cell.get_width()) // 2, y))) # Narrow digits centred in their advance
+            x += advance
+        return commands
+
+
+def render_game_tiles(font):
+    """
+    Renders every game sprite once: one tile per power-up type, the ball, both paddle
+    widths, the laser and the firework rocket. font is the power-up letter font (POWERUP_FONT_SIZE).
+    """
+    tiles = {}
+    for type, properties in PowerUp.PROPERTIES.items():
+        tile = pygame.Surface((PowerUp.width, PowerUp.height))
+        tile.fill(properties['color'])
+        text = font.render(properties['char'], True, (255, 255, 255)) # White letter, as PowerUp.draw
+        tile.blit(text, text.get_rect(center=tile.get_rect().center))
+        tiles['power_up', type] = tile # Same key as PowerUp.tile_name
+
+    ball = pygame.Surface((Ball.radius * 2, Ball.radius * 2), pygame.SRCALPHA)
+    pygame.draw.ellipse(ball, Ball.color, ball.get_rect())
+    tiles[Ball.tile_name] = ball
+
+    for width in (Paddle.original_width, Paddle.grown_width):
+        paddle = pygame.Surface((width, Paddle.height))
+        paddle.fill(Paddle.color)
+        tiles['paddle', width] = paddle # Same key as Paddle.tile_name
+
+    laser = pygame.Surface((Laser.width, Laser.height))
+    laser.fill(Laser.color)
+    tiles[Laser.tile_name] = laser
+
+    rocket = pygame.Surface((Firework.radius * 2, Firework.radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(rocket, Firework.color, (Firework.radius, Firework.radius), Firework.radius)
+    tiles[Firework.tile_name] = rocket
+    return tiles
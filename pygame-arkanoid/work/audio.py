@@ -0,0 +1,131 @@
+import pygame
+
+
+class SoundManager:
+    """
+    Plays the game's sound effects on a fixed set of mixer channels.
+    Each category of sound (impacts, weapons, events...) gets its own reserved
+    channels, so a storm of bounces can't take the channel the game-over jingle
+    needs. Within a tick, repeated plays of one sound are merged into one; a sound
+    replayed sooner than its min_interval is dropped; and when every channel of
+    its category is busy, the voice that started longest ago is cut off for it.
+    Time is game time, passed to begin_tick(), so headless runs behave the same.
+
+    It is also the volume bus: a master volume scales the sfx group (every
+    effect channel) and the music group (pygame.mixer.music). Mute and volume
+    changes set the channel volumes once, whatever the number of sounds, and
+    fades are left to the mixer's audio thread.
+    """
+    GROUPS = ('master', 'sfx', 'music')
+
+    def __init__(self, categories):
+        """categories maps category names to the number of channels reserved for them."""
+        total = sum(categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total) # Sound.play() never picks these
+        self._channels = {} # category -> [Channel]
+        index = 0
+        for category, count in categories.items():
+            self._channels[category] = [pygame.mixer.Channel(index + offset) for offset in range(count)]
+            index += count
+        self._started = {} # Channel -> game time its current voice started
+        self._sounds = {} # Sound -> (category, min_interval)
+        self._last_played = {} # Sound -> game time it last started
+        self._this_tick = set() # Sounds requested during the current tick
+        self._now = 0.0
+        self.volumes = dict.fromkeys(self.GROUPS, 1.0)
+        self.muted = False
+        self._apply_volumes() # The mixer's channels may keep the volumes of an earlier manager
+
+        # Statistics
+        self.played = 0
+        self.merged = 0 # Plays folded into the same sound's play in the same tick
+        self.dropped = 0 # Plays within a sound's min_interval
+        self.stolen = 0 # Voices cut off to make room
+
+    def register(self, sound, category, min_interval=0.0):
+        """Adds a sound, played on category's channels at most once every min_interval seconds."""
+        if category not in self._channels:
+            raise ValueError(f"unknown sound category {category!r}")
+        self._sounds[sound] = (category, min_interval)
+
+    def begin_tick(self, now):
+        """Starts a new tick at game time now (seconds)."""
+        self._now = now
+        self._this_tick.clear()
+
+    def play(self, sound, fade_ms=0):
+        """
+        Requests sound, faded in over fade_ms if given. Returns the Channel it plays on,
+        or None if muted, merged, dropped or not registered.
+        """
+        entry = self._sounds.get(sound)
+        if entry is None or self.muted:
+            return None # Muted, or not registered (e.g. a file that failed to load)
+        if sound in self._this_tick:
+            self.merged += 1
+            return None
+        self._this_tick.add(sound)
+        category, min_interval = entry
+        last = self._last_played.get(sound)
+        if last is not None and self._now - last < min_interval:
+            self.dropped += 1
+            return None
+
+        channels = self._channels[category]
+        channel = next((channel for channel in channels if not channel.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda channel: self._started.get(channel, 0.0))
+            self.stolen += 1
+        channel.play(sound, fade_ms=fade_ms) # Replaces whatever the channel was playing; keeps its volume
+        self._started[channel] = self._now
+        self._last_played[sound] = self._now
+        self.played += 1
+        return channel
+
+    def set_volume(self, group, volume):
+        """Sets the volume (0.0-1.0) of 'master', 'sfx' or 'music'."""
+        if group not in self.volumes:
+            raise ValueError(f"unknown volume group {group!r}")
+        self.volumes[group] = volume
+        self._apply_volumes()
+
+    def set_muted(self, muted):
+        """Silences (or restores) every channel and the music, including what is playing now."""
+        self.muted = muted
+        self._apply_volumes()
+
+    def _apply_volumes(self):
+        """Pushes the bus volumes to the effect channels and the music stream."""
+        master = 0.0 if self.muted else self.volumes['master']
+        sfx = master * self.volumes['sfx']
+        for channels in self._channels.values():
+            for channel in channels:
+                channel.set_volume(sfx)
+        pygame.mixer.music.set_volume(master * self.volumes['music'])
+
+    def fade_out(self, group, ms):
+        """
+        Fades out whatever 'sfx' or 'music' is playing over ms milliseconds; the mixer runs
+        the fade. SDL_mixer skips channels that are still fading in.
+        """
+        if group == 'sfx':
+            for channels in self._channels.values():
+                for channel in channels:
+                    channel.fadeout(ms)
+        elif group == 'music':
+            pygame.mixer.music.fadeout(ms)
+        else:
+            raise ValueError(f"cannot fade volume group {group!r}")
+
+    def play_music(self, path, loops=-1, fade_ms=0):
+        """Streams a music file at the music group's volume, looping forever by default."""
+        pygame.mixer.music.load(path)
+        self._apply_volumes()
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+
+    def summary(self):
+        """One line of statistics, for the profiler overlay."""
+        return (f"sound: {self.played} played, {self.merged} merged, {self.dropped} dropped, "
+                f"{self.stolen} stolen")
@@ -0,0 +1,95 @@
+import numpy as np
+
+
+class BallCollider:
+    """
+    Elastic collisions between balls (all the same size and mass).
+    Pairs are found with a sort-and-sweep broadphase along x: with the balls sorted
+    by left edge, only the balls starting less than a diameter further right can
+    overlap a ball. The sorted order is kept from tick to tick; balls move a few
+    pixels per tick, so it is almost sorted already and the stable sort (timsort,
+    which walks the existing runs) fixes it in close to linear time.
+    """
+    def __init__(self):
+        self.order = np.zeros(0, dtype=np.int64) # Ball indices by left edge, as of the last tick
+
+        # Statistics
+        self.candidates = 0 # Pairs overlapping along x (tested exactly)
+        self.collisions = 0 # Pairs bounced
+
+    def _sort(self, x):
+        """Brings the kept order up to date with the current left edges and returns it."""
+        n = x.size
+        order = self.order
+        if order.size != n:
+            # Balls were added or removed: keep the indices that still exist, new ones go last
+            order = order[order < n]
+            if order.size < n:
+                order = np.concatenate((order, np.arange(order.size, n)))
+        order = order[np.argsort(x[order], kind='stable')]
+        self.order = order
+        return order
+
+    def candidate_pairs(self, x, diameter):
+        """Returns the index arrays (first, second) of the pairs whose x extents overlap."""
+        order = self._sort(x)
+        left = x[order]
+        # Balls sorted after i that start before i's right edge
+        ends = np.searchsorted(left, left + diameter, side='left')
+        counts = ends - np.arange(left.size) - 1
+        total = int(counts.sum())
+        if total == 0:
+            return order[:0], order[:0]
+        first = np.repeat(np.arange(left.size), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + offsets
+        return order[first], order[second]
+
+    def resolve(self, x, y, speed_x, speed_y, diameter, active=None, width=None):
+        """
+        Bounces every pair of touching balls that are moving towards each other.
+        x and y are the balls' top-left corners; all four arrays are updated in place.
+        Balls flagged False in active (glued to the paddle, say) are left alone, and
+        if width is given, balls pushed apart are kept between the side walls.
+        Returns the number of collisions.
+        """
+        first, second = self.candidate_pairs(x, diameter)
+        if active is not None:
+            keep = active[first] & active[second]
+            first, second = first[keep], second[keep]
+        self.candidates += first.size
+        offset_x = x[second] - x[first]
+        offset_y = y[second] - y[first]
+        closing = (speed_x[first] - speed_x[second]) * offset_x + (speed_y[first] - speed_y[second]) * offset_y
+        # Touching and moving towards each other (balls released together fly apart untouched)
+        hits = (offset_x * offset_x + offset_y * offset_y < diameter * diameter) & (closing > 0)
+        collisions = 0
+        # Few pairs collide at once; resolve them one by one so a ball in two pairs sees the first bounce
+        for a, b in zip(first[hits].tolist(), second[hits].tolist()):
+            offset_x = x[b] - x[a]
+            offset_y = y[b] - y[a]
+            distance = np.hypot(offset_x, offset_y)
+            if distance == 0:
+                continue # Exactly on top of each other: no direction to bounce in
+            normal_x = offset_x / distance
+            normal_y = offset_y / distance
+            closing = (speed_x[a] - speed_x[b]) * normal_x + (speed_y[a] - speed_y[b]) * normal_y
+            if closing <= 0:
+                continue # Already separating
+            # Equal masses: the balls swap their speeds along the line between the centres
+            speed_x[a] -= closing * normal_x
+            speed_y[a] -= closing * normal_y
+            speed_x[b] += closing * normal_x
+            speed_y[b] += closing * normal_y
+            # Push them apart so they do not stick together
+            push = (diameter - distance) / 2
+            x[a] -= push * normal_x
+            y[a] -= push * normal_y
+            x[b] += push * normal_x
+            y[b] += push * normal_y
+            if width is not None:
+                x[a] = min(max(x[a], 0), width - diameter)
+                x[b] = min(max(x[b], 0), width - diameter)
+            collisions += 1
+        self.collisions += collisions
+        return collisions
@@ -0,0 +1,346 @@
+import math
+import random
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+from collision import swept_circle_aabb, swept_circle_walls
+
+# What happened to the balls during one BallSet.update: bounces is a list of
+# (kind, centre x, centre y) with kind 'wall' or 'paddle', lost the number of
+# balls that fell off the screen (already removed), launched the number of
+# glued balls that were launched and bricks_hit the bricks hit, in order.
+BallEvents = namedtuple('BallEvents', ['bounces', 'lost', 'launched', 'bricks_hit'])
+
+_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'speed_x', 'speed_y', 'base_speed', 'slow_timer', 'glued', 'slowed')
+
+
+class BallView:
+    """
+    A ball of a BallSet, seen through the attributes of a Ball.
+    Views refer to a slot, so they are only valid until the set next changes size.
+    """
+    def __init__(self, balls, index):
+        self._balls = balls
+        self._index = index
+
+    def _get(name):
+        def get(self):
+            value = getattr(self._balls, name)[self._index]
+            return value.item()
+        def set(self, value):
+            getattr(self._balls, name)[self._index] = value
+        return property(get, set)
+
+    x = _get('x')
+    y = _get('y')
+    speed_x = _get('speed_x')
+    speed_y = _get('speed_y')
+    base_speed = _get('base_speed')
+    slow_timer = _get('slow_timer')
+    is_glued = _get('glued')
+    is_slowed = _get('slowed')
+    del _get
+
+    @property
+    def rect(self):
+        """A copy of the ball's rect (edits do not move the ball)."""
+        return pygame.Rect(round(self.x), round(self.y), self._balls.diameter, self._balls.diameter)
+
+    def activate_power_up(self, type):
+        """Activates a power-up effect on the ball (see Ball.activate_power_up)."""
+        self._balls.activate_power_up(type, self._index)
+
+
+class BallSet:
+    """
+    Struct-of-arrays storage and batch physics for many balls (mega multi-ball).
+    Position, speed, glue and slow state of every ball live in NumPy arrays with
+    the live balls in slots [0, count). Each tick, walls are handled for all balls
+    with a few vectorized operations; only balls whose path crosses an occupied
+    cell of the brick wall (found in O(1) each from a summed-area table of the
+    grid) or reaches the paddle are resolved one by one with the same sweeps as
+    Ball.update, so brick and paddle hits (sides and corners included) match it.
+    Iterating yields BallView objects so code written for a list of Ball keeps working.
+    """
+    def __init__(self, screen_width, screen_height, rng=random, capacity=64, color=(200, 200, 200)):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rng = rng # Source of launch directions, like Ball.rng
+        self.radius = 10
+        self.diameter = self.radius * 2
+        self.color = color
+        self.capacity = capacity
+        self.count = 0
+        for name in _FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool if name in ('glued', 'slowed') else float))
+        self._sprite = None # Pre-rendered ball
+        self._occupancy_key = None # (id, version) of the BrickField the table was built for
+        self._occupied_sums = None # Summed-area table of occupied brick cells
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return (BallView(self, index) for index in range(self.count))
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError("BallSet index out of range")
+        return BallView(self, index % self.count)
+
+    def add(self, x, y, speed_x, speed_y, glued=False, base_speed=6):
+        """Adds a ball with its top-left corner at (x, y)."""
+        if self.count == self.capacity:
+            self._grow(self.count + 1)
+        index = self.count
+        for name, value in (('x', x), ('y', y), ('prev_x', x), ('prev_y', y), ('speed_x', speed_x),
+                            ('speed_y', speed_y), ('base_speed', base_speed), ('slow_timer', 0),
+                            ('glued', glued), ('slowed', False)):
+            getattr(self, name)[index] = value
+        self.count += 1
+
+    def append(self, ball):
+        """Adds a copy of a Ball (so code building Ball objects can fill the set)."""
+        self.add(ball.rect.x, ball.rect.y, ball.speed_x, ball.speed_y, ball.is_glued, ball.base_speed)
+        if ball.is_slowed:
+            self.slowed[self.count - 1] = True
+            self.slow_timer[self.count - 1] = ball.slow_timer
+
+    def _grow(self, needed):
+        """Reallocates every array with at least needed slots (doubling)."""
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in _FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def _remove(self, dead):
+        """Removes the balls flagged in the boolean array dead, keeping the rest in order."""
+        keep = np.flatnonzero(~dead)
+        for name in _FIELDS:
+            array = getattr(self, name)
+            array[:keep.size] = array[keep]
+        self.count = keep.size
+
+    def save_previous(self):
+        """Records every position as the start of the next tick."""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def activate_power_up(self, type, index=None):
+        """Applies a ball power-up to one ball, or to all of them if index is None (see Ball.activate_power_up)."""
+        if type != 'slow':
+            return
+        affected = np.zeros(self.count, dtype=bool)
+        affected[slice(None) if index is None else index] = True
+        affected &= ~self.slowed[:self.count]
+        self.speed_x[:self.count][affected] /= 2
+        self.speed_y[:self.count][affected] /= 2
+        self.slowed[:self.count][affected] = True
+        self.slow_timer[:self.count][affected] = 600 # 10 seconds duration
+
+    def update(self, paddle, launch_ball=False, dt=1.0, bricks=None):
+        """
+        Advances every ball by one tick and returns the BallEvents of the tick.
+        Lost balls are removed; bricks hit are reported, removing them is up to the caller.
+        """
+        n = self.count
+        radius = self.radius
+        x, y = self.x[:n], self.y[:n]
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+        glued = self.glued[:n]
+        bounces = []
+        bricks_hit = []
+
+        # Glued balls follow the paddle's centre, and are launched (without moving this tick) by SPACE
+        held = np.flatnonzero(glued)
+        x[held] = paddle.rect.centerx - radius
+        y[held] = paddle.rect.top - self.diameter
+        launched = 0
+        if launch_ball and held.size:
+            for index in held.tolist(): # One draw per ball in slot order, like Ball.update
+                speed_x[index] = self.base_speed[index] * self.rng.choice((1, -1))
+            speed_y[held] = -self.base_speed[held]
+            glued[held] = False
+            launched = held.size
+        free = np.ones(n, dtype=bool)
+        free[held] = False
+
+        # Slow power-up running out restores the speed
+        slowed = self.slowed[:n]
+        ticking = free & slowed
+        self.slow_timer[:n][ticking] -= dt
+        expired = ticking & (self.slow_timer[:n] <= 0)
+        speed_x[expired] *= 2
+        speed_y[expired] *= 2
+        slowed[expired] = False
+
+        dx = speed_x * dt
+        dy = speed_y * dt
+        swept = free & (self._crosses_bricks(bricks, dx, dy) | self._reaches_paddle(paddle, dx, dy))
+        for index in np.flatnonzero(swept).tolist():
+            self._sweep_one(index, dt, paddle, bricks, bounces, bricks_hit)
+
+        flying = free & ~swept
+        old_cx = x + radius
+        old_cy = y + radius
+        cx = old_cx + dx
+        cy = old_cy + dy
+
+        # Walls: mirror the part of the step that went through them
+        hit_left = flying & (cx < radius)
+        hit_right = flying & (cx > self.screen_width - radius)
+        hit_top = flying & (cy < radius)
+        cx[hit_left] = 2 * radius - cx[hit_left]
+        cx[hit_right] = 2 * (self.screen_width - radius) - cx[hit_right]
+        cy[hit_top] = 2 * radius - cy[hit_top]
+        speed_x[hit_left | hit_right] *= -1
+        speed_y[hit_top] *= -1
+        hit_wall = hit_left | hit_right | hit_top
+
+        x[flying] = cx[flying] - radius
+        y[flying] = cy[flying] - radius
+
+        for index in np.flatnonzero(hit_wall).tolist():
+            bounces.append(('wall', x[index] + radius, y[index] + radius))
+
+        lost = np.round(y) > self.screen_height # rect.top below the screen
+        lost_count = int(np.count_nonzero(lost))
+        if lost_count:
+            self._remove(lost)
+        return BallEvents(bounces, lost_count, launched, bricks_hit)
+
+    def _crosses_bricks(self, bricks, dx, dy):
+        """Flags the balls whose path this tick touches a cell holding a brick."""
+        n = self.count
+        if bricks is None or not len(bricks):
+            return np.zeros(n, dtype=bool)
+        sums = self._occupancy(bricks)
+        x, y = self.x[:n], self.y[:n]
+        left = np.minimum(x, x + dx) - 1
+        top = np.minimum(y, y + dy) - 1
+        right = np.maximum(x, x + dx) + self.diameter + 1
+        bottom = np.maximum(y, y + dy) + self.diameter + 1
+        first_col = np.clip((left - bricks.origin_x) // bricks.cell_width, 0, bricks.cols).astype(np.int64)
+        first_row = np.clip((top - bricks.origin_y) // bricks.cell_height, 0, bricks.rows).astype(np.int64)
+        end_col = np.clip((right - bricks.origin_x) // bricks.cell_width + 1, 0, bricks.cols).astype(np.int64)
+        end_row = np.clip((bottom - bricks.origin_y) // bricks.cell_height + 1, 0, bricks.rows).astype(np.int64)
+        occupied = (sums[end_row, end_col] - sums[first_row, end_col]
+                    - sums[end_row, first_col] + sums[first_row, first_col])
+        return occupied > 0
+
+    def _reaches_paddle(self, paddle, dx, dy):
+        """Flags the falling balls whose path this tick touches the paddle (Ball.update only lets those hit it)."""
+        x, y = self.x[:self.count], self.y[:self.count]
+        rect = paddle.rect
+        return ((dy > 0)
+                & (np.minimum(x, x + dx) - 1 <= rect.right) & (np.maximum(x, x + dx) + self.diameter + 1 >= rect.left)
+                & (np.minimum(y, y + dy) - 1 <= rect.bottom) & (np.maximum(y, y + dy) + self.diameter + 1 >= rect.top))
+
+    def _occupancy(self, bricks):
+        """Summed-area table of the brick grid, rebuilt when the wall changes."""
+        key = (id(bricks), bricks.version)
+        if key != self._occupancy_key:
+            grid = np.zeros((bricks.rows, bricks.cols), dtype=np.int32)
+            for brick in bricks:
+                row, col = bricks.cell_of(brick.rect.x, brick.rect.y)
+                grid[row, col] = 1
+            sums = np.zeros((bricks.rows + 1, bricks.cols + 1), dtype=np.int32)
+            sums[1:, 1:] = grid.cumsum(axis=0).cumsum(axis=1)
+            self._occupied_sums = sums
+            self._occupancy_key = key
+        return self._occupied_sums
+
+    def _sweep_one(self, index, dt, paddle, bricks, bounces, bricks_hit):
+        """
+        Moves one ball near the bricks or the paddle with the sweeps Ball.update uses:
+        walls and bricks reflect on the dominant axis, the paddle bounces it as
+        Ball.bounce_off_paddle does (and catches it if the paddle has glue).
+        """
+        radius = self.radius
+        remaining = 1.0
+        hit = []
+        kind = None # Reported bounce: 'paddle' wins over 'wall', as in Ball.update
+        for _ in range(8): # Ball.MAX_CONTACTS_PER_TICK
+            cx = self.x[index] + radius
+            cy = self.y[index] + radius
+            step_x = self.speed_x[index] * dt * remaining
+            step_y = self.speed_y[index] * dt * remaining
+            first = swept_circle_walls(cx, cy, radius, step_x, step_y, self.screen_width)
+            obstacle = 'wall' if first is not None else None
+            if step_y > 0: # The paddle only catches a falling ball
+                contact = swept_circle_aabb(cx, cy, radius, step_x, step_y, paddle.rect)
+                if contact is not None and (first is None or contact.time < first.time):
+                    first, obstacle = contact, paddle
+            if bricks is not None:
+                x, y = self.x[index], self.y[index]
+                swept = pygame.Rect(math.floor(min(x, x + step_x)) - 1, math.floor(min(y, y + step_y)) - 1,
+                                    math.ceil(abs(step_x)) + self.diameter + 3,
+                                    math.ceil(abs(step_y)) + self.diameter + 3)
+                for brick in bricks.bricks_overlapping(swept):
+                    if brick in hit:
+                        continue
+                    contact = swept_circle_aabb(cx, cy, radius, step_x, step_y, brick.rect)
+                    if contact is not None and (first is None or contact.time < first.time):
+                        first, obstacle = contact, brick
+            if first is None:
+                self.x[index] += step_x
+                self.y[index] += step_y
+                break
+            self.x[index] += step_x * first.time
+            self.y[index] += step_y * first.time
+            remaining *= 1 - first.time
+            if obstacle is paddle:
+                self._bounce_off_paddle(index, paddle)
+                kind = 'paddle'
+                if self.glued[index]:
+                    break # Caught: the ball rides the paddle from now on
+                continue
+            if abs(first.normal_x) > abs(first.normal_y) + 1e-9: # Same rule as Ball.reflect
+                self.speed_x[index] *= -1
+            else:
+                self.speed_y[index] *= -1
+            if obstacle == 'wall':
+                kind = kind or 'wall'
+            else:
+                hit.append(obstacle)
+        if kind is not None:
+            bounces.append((kind, self.x[index] + radius, self.y[index] + radius))
+        bricks_hit.extend(hit)
+
+    def _bounce_off_paddle(self, index, paddle):
+        """Ball.bounce_off_paddle for one ball of the set."""
+        if paddle.has_glue:
+            self.glued[index] = True
+        centerx = round(self.x[index]) + self.radius # The ball's rect.centerx
+        angle = (centerx - paddle.rect.centerx) / (paddle.width / 2) * (math.pi / 3)
+        self.speed_x[index] = self.base_speed[index] * math.sin(angle)
+        self.speed_y[index] = -self.base_speed[index] * math.cos(angle)
+        top = paddle.rect.top - self.diameter # Ball sets rect.bottom to the paddle top; x and y follow a moved rect
+        if round(self.y[index]) != top:
+            self.y[index] = top
+
+    def draw(self, screen, alpha=1.0, sprite=None):
+        """
+        Draws every ball interpolated between the last two ticks with one blits call; returns the areas drawn.
+        sprite is the ball image to use (a SpriteAtlas tile, say); by default one is rendered once.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        if sprite is not None:
+            self._sprite = sprite
+        elif self._sprite is None:
+            self._sprite = pygame.Surface((self.diameter, self.diameter), pygame.SRCALPHA)
+            pygame.draw.ellipse(self._sprite, self.color, self._sprite.get_rect())
+        x = np.round(self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(np.int64)
+        y = np.round(self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha).astype(np.int64)
+        sprite = self._sprite
+        return screen.blits([(sprite, position) for position in zip(x.tolist(), y.tolist())])
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Batch simulator for balancing runs.
+
+Plays N seeded games headlessly in parallel, one process per core, with a
+scripted paddle policy, and reports level clear times, lives lost, power-up
+pickup rates and the score distribution. Balancing settings can be overridden
+from the command line, e.g.
+
+    python batch_sim.py --games 2000 --power-up-chance 0.25 --gap-chance 0.15
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1') # One banner per worker process is just noise
+import pygame
+
+# Game attributes that may be overridden per batch (see "Balancing" in Game.__init__)
+TUNABLES = ('brick_gap_chance', 'power_up_chance', 'power_up_chance_per_level',
+            'power_up_chance_max', 'ball_speed_per_level', 'ball_speed_max')
+
+
+class TrackingPolicy:
+    """
+    Scripted player: keeps the paddle under the lowest descending ball, chases
+    falling power-ups when no ball is coming down, fires lasers when it can and
+    launches glued balls. skill (0..1) scales how precisely it aims.
+    """
+    AIM_INTERVAL = 60 # Ticks between re-rolls of the aiming error
+    FIRE_INTERVAL = 20 # Ticks between laser shots
+
+    def __init__(self, seed, skill):
+        self.rng = random.Random(f"{seed}/policy")
+        self.skill = skill
+        self.aim_error = 0.0
+
+    def inputs(self, game):
+        """Returns (held keys, presses) for the next tick."""
+        if game.game_state == game.GAME_STATE_TITLE:
+            return set(), [pygame.K_SPACE]
+        if game.game_state != game.GAME_STATE_PLAYING:
+            return set(), [] # Sit out the level complete pause
+
+        held = set()
+        presses = []
+        paddle = game.paddle
+        if any(ball.is_glued for ball in game.balls):
+            held.add(pygame.K_SPACE)
+        if paddle.has_laser and game.tick_count % self.FIRE_INTERVAL == 0:
+            presses.append(pygame.K_f)
+
+        if game.tick_count % self.AIM_INTERVAL == 0:
+            self.aim_error = self.rng.uniform(-1, 1) * (1 - self.skill) * paddle.width
+
+        target = self._target(game)
+        if target is not None:
+            offset = target + self.aim_error - paddle.rect.centerx
+            if offset < -paddle.speed:
+                held.add(pygame.K_LEFT)
+            elif offset > paddle.speed:
+                held.add(pygame.K_RIGHT)
+        return held, presses
+
+    @staticmethod
+    def _target(game):
+        """x coordinate to steer towards, or None to stay put."""
+        falling = [ball for ball in game.balls if not ball.is_glued and ball.speed_y > 0]
+        if falling:
+            return max(falling, key=lambda ball: ball.rect.bottom).rect.centerx
+        if game.power_ups:
+            return max(game.power_ups, key=lambda power_up: power_up.rect.bottom).rect.centerx
+        free = [ball for ball in game.balls if not ball.is_glued]
+        if free:
+            return max(free, key=lambda ball: ball.rect.bottom).rect.centerx
+        return None
+
+
+def play_game(seed, skill, max_minutes, settings, event_physics=False):
+    """
+    Plays one game to its end (or the time limit) and returns its statistics.
+    event_physics selects the event-driven ball physics core (see scheduler.py).
+    """
+    from main import Game # Imported in the worker so each process sets up its own headless pygame
+
+    game = Game(headless=True, render=False, seed=seed, event_physics=event_physics)
+    for name, value in settings.items():
+        setattr(game, name, value)
+    policy = TrackingPolicy(seed, skill)
+    max_ticks = int(max_minutes * 60 * game.sim_rate)
+
+    level, lives = game.level, game.lives
+    level_ticks = 0 # Ticks spent playing the current level
+    level_clear_ticks = []
+    lives_lost = 0
+    while game.tick_count < max_ticks:
+        was_playing = game.game_state == game.GAME_STATE_PLAYING
+        held, presses = policy.inputs(game)
+        game.step(held, presses)
+        if was_playing:
+            level_ticks += 1
+        if game.level > level: # _next_level ran this tick
+            level_clear_ticks.append(level_ticks)
+            level, level_ticks = game.level, 0
+        if game.lives < lives:
+            lives_lost += lives - game.lives
+        lives = game.lives
+        if game.game_state in [game.GAME_STATE_GAME_OVER, game.GAME_STATE_WIN]:
+            break
+
+    outcomes = {game.GAME_STATE_WIN: 'win', game.GAME_STATE_GAME_OVER: 'game_over'}
+    return {
+        'seed': seed,
+        'outcome': outcomes.get(game.game_state, 'timeout'),
+        'score': game.score,
+        'levels_cleared': len(level_clear_ticks),
+        'level_clear_seconds': [ticks / game.sim_rate for ticks in level_clear_ticks],
+        'lives_lost': lives_lost,
+        'power_ups_dropped': game.power_ups_dropped,
+        'power_ups_collected': game.power_ups_collected,
+        'ticks': game.tick_count,
+    }
+
+
+def _play_game_args(args):
+    """Unpacks one work item for ProcessPoolExecutor.map."""
+    return play_game(*args)
+
+
+def run_batch(games, base_seed, skill, max_minutes, settings, jobs=None, event_physics=False):
+    """
+    Plays games seeded base_seed, base_seed + 1, ... across a process pool.
+    Results come back in seed order.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    work = [(base_seed + index, skill, max_minutes, settings, event_physics) for index in range(games)]
+    if jobs == 1:
+        return [play_game(*item) for item in work]
+    # Several games per task keeps scheduling overhead negligible next to the simulation
+    chunksize = max(1, games // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_play_game_args, work, chunksize=chunksize))
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _distribution(values):
+    """Summary statistics for a list of numbers (empty dict if there are none)."""
+    if not values:
+        return {}
+    return {
+        'count': len(values),
+        'mean': statistics.fmean(values),
+        'stdev': statistics.pstdev(values),
+        'min': min(values),
+        'p10': _percentile(values, 0.10),
+        'median': statistics.median(values),
+        'p90': _percentile(values, 0.90),
+        'max': max(values),
+    }
+
+
+def summarize(results):
+    """Aggregates per-game results into the balancing report."""
+    outcomes = [result['outcome'] for result in results]
+    dropped = sum(result['power_ups_dropped'] for result in results)
+    collected = sum(result['power_ups_collected'] for result in results)
+    max_levels = max((len(result['level_clear_seconds']) for result in results), default=0)
+    return {
+        'games': len(results),
+        'outcomes': {outcome: outcomes.count(outcome) for outcome in sorted(set(outcomes))},
+        'score': _distribution([result['score'] for result in results]),
+        'lives_lost': _distribution([result['lives_lost'] for result in results]),
+        'levels_cleared': _distribution([result['levels_cleared'] for result in results]),
+        'level_clear_seconds': {
+            level + 1: _distribution([result['level_clear_seconds'][level] for result in results
+                                      if len(result['level_clear_seconds']) > level])
+            for level in range(max_levels)
+        },
+        'power_ups': {
+            'dropped': dropped,
+            'collected': collected,
+            'pickup_rate': collected / dropped if dropped else 0.0,
+        },
+    }
+
+
+def format_report(summary, settings, elapsed, jobs):
+    """Renders the summary as a human-readable text report."""
+    def row(label, stats, unit=''):
+        if not stats:
+            return f"  {label:<18} -"
+        return (f"  {label:<18} mean {stats['mean']:8.1f}{unit}  median {stats['median']:8.1f}{unit}  "
+                f"p10 {stats['p10']:8.1f}{unit}  p90 {stats['p90']:8.1f}{unit}  (n={stats['count']})")
+
+    lines = [
+        f"Arkanoid balancing report: {summary['games']} games on {jobs} processes in {elapsed:.1f} s",
+        "Settings: " + (", ".join(f"{name}={value}" for name, value in sorted(settings.items())) or "defaults"),
+        "Outcomes: " + ", ".join(f"{outcome} {count}" for outcome, count in summary['outcomes'].items()),
+        "",
+        row("Score", summary['score']),
+        row("Lives lost", summary['lives_lost']),
+        row("Levels cleared", summary['levels_cleared']),
+        "",
+        "Level clear time:",
+    ]
+    for level, stats in summary['level_clear_seconds'].items():
+        lines.append(row(f"Level {level}", stats, 's'))
+    power_ups = summary['power_ups']
+    lines += [
+        "",
+        f"Power-ups: {power_ups['collected']} of {power_ups['dropped']} collected "
+        f"({power_ups['pickup_rate']:.1%} pickup rate)",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many seeded Arkanoid games in parallel and report balancing statistics.")
+    parser.add_argument('--games', type=int, default=200, help="number of games to play (default: 200)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game; game i uses seed + i (default: 0)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--skill', type=float, default=0.8, help="policy aiming precision from 0 to 1 (default: 0.8)")
+    parser.add_argument('--max-minutes', type=float, default=20, help="game-time limit per game (default: 20)")
+    parser.add_argument('--json', metavar='PATH', help="also write the summary and per-game results as JSON")
+    parser.add_argument('--event-physics', action='store_true',
+                        help="move balls from impact to impact instead of sweeping them every tick")
+    for name in TUNABLES:
+        parser.add_argument('--' + name.replace('_', '-'), dest=name, type=float, metavar='VALUE',
+                            help=f"override Game.{name}")
+    parser.add_argument('--gap-chance', dest='brick_gap_chance', type=float, metavar='VALUE',
+                        help="alias for --brick-gap-chance")
+    args = parser.parse_args()
+
+    settings = {name: getattr(args, name) for name in TUNABLES if getattr(args, name) is not None}
+    jobs = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = run_batch(args.games, args.seed, args.skill, args.max_minutes, settings, jobs, args.event_physics)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print(format_report(summary, settings, elapsed, jobs))
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'settings': settings, 'summary': summary, 'games': results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
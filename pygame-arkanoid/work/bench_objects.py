@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the game object classes: memory per instance and attribute access speed.
+--compare REV also measures the classes of game_objects.py at a git revision, so a
+change to their layout can be checked before and after:
+
+    python bench_objects.py --compare HEAD~1
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import game_objects
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RNG = random.Random(1) # Shared, so its state is not counted as part of every instance
+
+# Class name -> (constructor, attribute read and written per access test)
+CASES = {
+    'Paddle': (lambda module: module.Paddle(800, 600), 'has_laser'),
+    'Ball': (lambda module: module.Ball(800, 600, RNG), 'speed_x'),
+    'Brick': (lambda module: module.Brick(0, 0, 75, 20, (255, 0, 0)), 'color'),
+    'PowerUp': (lambda module: module.PowerUp(0, 0, 'grow'), 'type'),
+    'Laser': (lambda module: module.Laser(0, 0), 'x'),
+    'Firework': (lambda module: module.Firework(800, 600, None, RNG), 'y'),
+}
+
+
+def load_revision(revision):
+    """Imports game_objects.py as it was at a git revision."""
+    source = subprocess.run(['git', 'show', f'{revision}:./game_objects.py'], cwd=HERE,
+                            capture_output=True, text=True, check=True).stdout
+    path = os.path.join(tempfile.mkdtemp(), 'game_objects_old.py')
+    with open(path, 'w') as file:
+        file.write(source)
+    spec = importlib.util.spec_from_file_location('game_objects_old', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bytes_per_instance(make, count):
+    """Memory allocated per instance (including its rect and containers) over count instances."""
+    instances = [None] * count
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(count):
+        instances[index] = make()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def access_ns(obj, attribute, number):
+    """Nanoseconds per read and per write of obj.attribute."""
+    namespace = {'obj': obj, 'value': getattr(obj, attribute)}
+    read = min(timeit.repeat(f'obj.{attribute}', globals=namespace, number=number, repeat=5))
+    write = min(timeit.repeat(f'obj.{attribute} = value', globals=namespace, number=number, repeat=5))
+    return read / number * 1e9, write / number * 1e9
+
+
+def measure(module, count, number):
+    """Returns {class name: (bytes per instance, read ns, write ns)} for a game_objects module."""
+    results = {}
+    for name, (make, attribute) in CASES.items():
+        obj = make(module)
+        results[name] = (bytes_per_instance(lambda: make(module), count),) + access_ns(obj, attribute, number)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and attribute speed of the game object classes")
+    parser.add_argument('--compare', metavar='REV', help="also measure game_objects.py at this git revision")
+    parser.add_argument('--count', type=int, default=20000, help="instances per memory measurement")
+    parser.add_argument('--number', type=int, default=1_000_000, help="attribute accesses per timing")
+    args = parser.parse_args()
+
+    columns = [('now', measure(game_objects, args.count, args.number))]
+    if args.compare:
+        columns.insert(0, (args.compare, measure(load_revision(args.compare), args.count, args.number)))
+    header = f"{'class':<10}" + ''.join(f"{label:>30}" for label, _ in columns)
+    print(header)
+    print(f"{'':<10}" + ''.join(f"{'bytes':>10}{'read ns':>10}{'write ns':>10}" for _ in columns))
+    for name in CASES:
+        row = f"{name:<10}"
+        for _, results in columns:
+            size, read, write = results[name]
+            row += f"{size:10.0f}{read:10.1f}{write:10.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
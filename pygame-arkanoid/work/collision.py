@@ -0,0 +1,102 @@
+import math
+from collections import namedtuple
+
+# First point of contact along a sweep: time is the fraction of the displacement
+# travelled when the surfaces touch (0..1), normal the unit vector pointing from
+# the obstacle towards the moving circle.
+Contact = namedtuple('Contact', ['time', 'normal_x', 'normal_y'])
+
+
+def swept_circle_aabb(cx, cy, radius, dx, dy, rect):
+    """
+    Sweeps a circle centred at (cx, cy) along (dx, dy) against an axis-aligned rect.
+    Returns the Contact where it first touches the rect, or None if it never does
+    or is moving away. A circle that already overlaps the rect and moves further
+    in touches at time 0, with the normal pointing out of the shallowest side.
+    """
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+    # Already overlapping: push out along the closest point (or the shallowest side if the centre is inside)
+    nearest_x = min(max(cx, left), right)
+    nearest_y = min(max(cy, top), bottom)
+    offset_x = cx - nearest_x
+    offset_y = cy - nearest_y
+    distance_squared = offset_x * offset_x + offset_y * offset_y
+    if distance_squared < radius * radius:
+        if distance_squared > 0:
+            distance = math.sqrt(distance_squared)
+            normal_x, normal_y = offset_x / distance, offset_y / distance
+        else:
+            normal_x, normal_y = min(((cx - left, -1, 0), (right - cx, 1, 0),
+                                      (cy - top, 0, -1), (bottom - cy, 0, 1)))[1:]
+        if dx * normal_x + dy * normal_y < 0:
+            return Contact(0.0, normal_x, normal_y)
+        return None
+
+    # Ray (the circle's centre) against the rect grown by the radius on every side
+    t_enter, t_exit = -math.inf, math.inf
+    normal_x = normal_y = 0
+    for start, delta, low, high, axis in ((cx, dx, left, right, 0), (cy, dy, top, bottom, 1)):
+        low -= radius
+        high += radius
+        if delta == 0:
+            if start < low or start > high:
+                return None
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > t_enter:
+            t_enter = t_low
+            normal_x, normal_y = ((-1 if delta > 0 else 1), 0) if axis == 0 else (0, (-1 if delta > 0 else 1))
+        t_exit = min(t_exit, t_high)
+    if normal_x == 0 and normal_y == 0:
+        return None # Not moving
+    t_enter = max(t_enter, 0.0) # Starting inside the grown rect (in a corner region or just touching)
+    if t_enter >= t_exit or t_enter > 1:
+        return None
+
+    hit_x = cx + dx * t_enter
+    hit_y = cy + dy * t_enter
+    if left <= hit_x <= right or top <= hit_y <= bottom:
+        return Contact(t_enter, normal_x, normal_y) # Flat side of the grown rect
+
+    # Rounded corner: the circle meets the corner point itself
+    corner_x = left if hit_x < left else right
+    corner_y = top if hit_y < top else bottom
+    mx = cx - corner_x
+    my = cy - corner_y
+    a = dx * dx + dy * dy
+    b = mx * dx + my * dy
+    c = mx * mx + my * my - radius * radius
+    discriminant = b * b - a * c
+    if b >= 0 or discriminant < 0:
+        return None
+    time = (-b - math.sqrt(discriminant)) / a
+    if time > 1:
+        return None
+    time = max(time, 0.0)
+    return Contact(time, (mx + dx * time) / radius, (my + dy * time) / radius)
+
+
+def swept_circle_walls(cx, cy, radius, dx, dy, width):
+    """
+    Sweeps a circle against the left (x=0), right (x=width) and top (y=0) walls
+    of the playfield; the bottom is open. Returns the first Contact or None.
+    """
+    contact = None
+    if dx < 0:
+        contact = _earliest(contact, (radius - cx) / dx, 1, 0)
+    elif dx > 0:
+        contact = _earliest(contact, (width - radius - cx) / dx, -1, 0)
+    if dy < 0:
+        contact = _earliest(contact, (radius - cy) / dy, 0, 1)
+    return contact
+
+
+def _earliest(contact, time, normal_x, normal_y):
+    """Keeps the earlier of contact and a wall hit at time (ignored past the end of the sweep)."""
+    if time > 1 or (contact is not None and contact.time <= time):
+        return contact
+    return Contact(max(time, 0.0), normal_x, normal_y) # A circle already past the wall bounces at once
@@ -2,26 +2,129 @@ import pygame
 import random
 import math
 
+from collision import swept_circle_aabb, swept_circle_walls
+
 # Initialize the font module for the power-up letters
 # This initialization is placed here because PowerUp class uses it.
 # In a larger project, font initialization might be centralized.
 pygame.font.init()
-POWERUP_FONT = pygame.font.Font(None, 20)
+POWERUP_FONT_SIZE = 20
+POWERUP_FONT = pygame.font.Font(None, POWERUP_FONT_SIZE)
+
+# Gameplay speeds and durations are tuned per tick of a 60 Hz simulation.
+# update() methods take dt, the length of the current tick measured in these
+# reference ticks (1.0 at 60 Hz, 0.5 at 120 Hz), so the game plays the same at any rate.
+REFERENCE_TICK_RATE = 60
+
 
-class Paddle(pygame.sprite.Sprite):
+class World:
     """
-    Represents the player's paddle. Handles movement, power-up effects,
-    and drawing.
+    Settings shared by every game object in a screen of one size.
+    Objects keep a reference to the single World for their screen size instead
+    of a copy of each setting; get one with World.of(screen_width, screen_height).
     """
+    __slots__ = ('screen_width', 'screen_height')
+    _instances = {}
+
     def __init__(self, screen_width, screen_height):
-        super().__init__()
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.original_width = 100
-        self.height = 10
-        self.speed = 7
-        self.color = (200, 200, 200) # Light grey
 
+    @classmethod
+    def of(cls, screen_width, screen_height):
+        """Returns the shared World for a screen size."""
+        world = cls._instances.get((screen_width, screen_height))
+        if world is None:
+            world = cls._instances[screen_width, screen_height] = cls(screen_width, screen_height)
+        return world
+
+
+class _InWorld:
+    """Mixin reading the screen size from the object's shared World."""
+    __slots__ = ()
+
+    @property
+    def screen_width(self):
+        return self.world.screen_width
+
+    @property
+    def screen_height(self):
+        return self.world.screen_height
+
+
+class MovingSprite:
+    """
+    Base class for sprites that move every tick.
+    Keeps a float position mirrored into the integer rect (so fractional speeds
+    do not get lost to rounding) and the position from the previous tick for
+    render interpolation.
+    Game objects use __slots__: they are plain attribute holders (no sprite groups),
+    and without a per-instance __dict__ they are smaller and quicker to access.
+    """
+    __slots__ = ('rect', 'x', 'y', 'prev_x', 'prev_y')
+
+    def __init__(self, rect):
+        self.rect = rect
+        self.x = float(rect.x)
+        self.y = float(rect.y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def save_previous(self):
+        """Records the current position as the start of the next tick."""
+        self._sync_from_rect()
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def move(self, dx, dy):
+        """Moves by a fractional amount, keeping rect in sync."""
+        self._sync_from_rect()
+        self.x += dx
+        self.y += dy
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+    def move_to(self, x, y):
+        """Places the top-left corner at a fractional position, keeping rect in sync."""
+        self.x = x
+        self.y = y
+        self.rect.x = round(x)
+        self.rect.y = round(y)
+
+    def position(self):
+        """Returns the fractional top-left position, picking up direct edits to rect."""
+        self._sync_from_rect()
+        return self.x, self.y
+
+    def _sync_from_rect(self):
+        """Picks up direct edits to rect (clamping, snapping to the paddle, ...)."""
+        if self.rect.x != round(self.x):
+            self.x = float(self.rect.x)
+        if self.rect.y != round(self.y):
+            self.y = float(self.rect.y)
+
+    def interpolated_rect(self, alpha):
+        """Returns the rect placed alpha of the way from the previous to the current tick."""
+        self._sync_from_rect()
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return pygame.Rect(round(x), round(y), self.rect.width, self.rect.height)
+
+
+class Paddle(_InWorld, MovingSprite):
+    """
+    Represents the player's paddle. Handles movement, power-up effects,
+    and drawing.
+    """
+    __slots__ = ('world', 'width', 'power_up_timers', 'has_laser', 'has_glue', 'power_up_version')
+    original_width = 100
+    grown_width = 150 # With the grow power-up
+    height = 10
+    speed = 7
+    color = (200, 200, 200) # Light grey
+
+    def __init__(self, screen_width, screen_height):
+        self.world = World.of(screen_width, screen_height)
         self.width = self.original_width
         
         # Dictionary to manage power-up timers (in frames)
@@ -32,14 +135,15 @@ class Paddle(pygame.sprite.Sprite):
         }
         self.has_laser = False
         self.has_glue = False
+        self.power_up_version = 0 # Bumped whenever a power-up starts or ends (the HUD redraws on change)
 
         # Create the paddle's rectangle for position and collision
-        self.rect = pygame.Rect(
+        super().__init__(pygame.Rect(
             self.screen_width // 2 - self.width // 2,
             self.screen_height - 30,
             self.width,
             self.height
-        )
+        ))
 
     def reset(self):
         """Resets the paddle to its initial state."""
@@ -50,14 +154,18 @@ class Paddle(pygame.sprite.Sprite):
         self.has_glue = False
         for power_up in self.power_up_timers:
             self.power_up_timers[power_up] = 0
+        self.power_up_version += 1
+        self.save_previous() # Don't interpolate the jump back to the centre
 
-    def update(self):
-        """Updates the paddle's position based on keyboard input and power-up timers."""
-        keys = pygame.key.get_pressed()
+    def update(self, keys, dt=1.0):
+        """
+        Updates the paddle's position based on keyboard input and power-up timers.
+        keys is anything indexable by key constant (pygame.key.get_pressed() or a KeyState).
+        """
         if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
+            self.move(-self.speed * dt, 0)
         if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
+            self.move(self.speed * dt, 0)
 
         # Keep paddle within screen bounds
         if self.rect.left < 0:
@@ -65,23 +173,28 @@ class Paddle(pygame.sprite.Sprite):
         if self.rect.right > self.screen_width:
             self.rect.right = self.screen_width
             
-        self._update_power_ups()
+        self._update_power_ups(dt)
 
-    def draw(self, screen):
-        """Draws the paddle on the screen."""
-        pygame.draw.rect(screen, self.color, self.rect)
+    @property
+    def tile_name(self):
+        """Name of the paddle's pre-rendered tile in the SpriteAtlas."""
+        return 'paddle', self.rect.width
+
+    def draw(self, screen, alpha=1.0):
+        """Draws the paddle on the screen, interpolated between the last two ticks. Returns the area drawn."""
+        return pygame.draw.rect(screen, self.color, self.interpolated_rect(alpha))
         
     def activate_power_up(self, type):
         """
         Activates a specific power-up for a set duration.
-        Duration is in frames (600 frames = 10 seconds at 60 FPS).
+        Duration is in reference ticks (600 ticks = 10 seconds).
         """
         duration = 600 
         if type == 'grow':
             # Only apply grow effect if not already active to prevent multiple resizing
             if self.power_up_timers['grow'] <= 0:
                 current_center = self.rect.centerx
-                self.width = 150 # Wider paddle
+                self.width = self.grown_width # Wider paddle
                 self.rect.width = self.width
                 self.rect.centerx = current_center # Maintain center position
             self.power_up_timers['grow'] = duration
@@ -91,39 +204,46 @@ class Paddle(pygame.sprite.Sprite):
         elif type == 'glue':
             self.has_glue = True
             self.power_up_timers['glue'] = duration
+        self.power_up_version += 1
             
-    def _update_power_ups(self):
+    def _update_power_ups(self, dt):
         """Decrements power-up timers and deactivates effects when timers run out."""
         if self.power_up_timers['grow'] > 0:
-            self.power_up_timers['grow'] -= 1
+            self.power_up_timers['grow'] -= dt
             if self.power_up_timers['grow'] <= 0:
                 # Revert to original width when timer expires
                 current_center = self.rect.centerx
                 self.width = self.original_width
                 self.rect.width = self.width
                 self.rect.centerx = current_center
+                self.power_up_version += 1
         if self.power_up_timers['laser'] > 0:
-            self.power_up_timers['laser'] -= 1
+            self.power_up_timers['laser'] -= dt
             if self.power_up_timers['laser'] <= 0:
                 self.has_laser = False
+                self.power_up_version += 1
         if self.power_up_timers['glue'] > 0:
-            self.power_up_timers['glue'] -= 1
+            self.power_up_timers['glue'] -= dt
             if self.power_up_timers['glue'] <= 0:
                 self.has_glue = False
+                self.power_up_version += 1
 
 
-class Ball(pygame.sprite.Sprite):
+class Ball(_InWorld, MovingSprite):
     """
     Represents the game ball. Handles movement, collisions with walls/paddle,
     and power-up effects (slow).
     """
-    def __init__(self, screen_width, screen_height):
-        super().__init__()
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.radius = 10
-        self.color = (200, 200, 200) # Light grey
-        self.rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
+    __slots__ = ('world', 'rng', 'speed_x', 'speed_y', 'is_glued', 'is_slowed', 'slow_timer', 'base_speed')
+    MAX_CONTACTS_PER_TICK = 8 # Bounces resolved per tick before the rest of the motion is dropped
+    radius = 10
+    color = (200, 200, 200) # Light grey
+    tile_name = 'ball' # Pre-rendered tile in the SpriteAtlas
+
+    def __init__(self, screen_width, screen_height, rng=random):
+        self.world = World.of(screen_width, screen_height)
+        self.rng = rng # Source of launch directions (a random.Random stream, or the random module)
+        super().__init__(pygame.Rect(0, 0, self.radius * 2, self.radius * 2))
         
         self.is_glued = False # True if ball is stuck to paddle (from glue power-up)
         self.is_slowed = False # True if ball speed is reduced (from slow power-up)
@@ -133,20 +253,27 @@ class Ball(pygame.sprite.Sprite):
         self.reset()
 
     def reset(self):
-        """Resets the ball to its initial position and speed."""
+        """Resets the ball to its initial position and speed (also used to recycle a pooled ball)."""
         self.rect.center = (self.screen_width // 2, self.screen_height // 2 + 100) # Start slightly lower
-        self.speed_x = self.base_speed * random.choice((1, -1)) # Random horizontal direction
+        self.base_speed = 6 # A recycled ball may have been sped up by a later level
+        self.speed_x = self.base_speed * self.rng.choice((1, -1)) # Random horizontal direction
         self.speed_y = -self.base_speed # Always start moving upwards
         self.is_glued = True # Ball starts glued to the paddle
         self.is_slowed = False
         self.slow_timer = 0
+        self.save_previous()
 
-    def update(self, paddle, launch_ball=False):
+    def update(self, paddle, launch_ball=False, dt=1.0, bricks=None):
         """
         Updates the ball's position and handles collisions.
-        Returns game status ('playing', 'lost') and collision object ('wall', 'paddle', None).
+        The path travelled this tick is swept against the walls, the paddle and the
+        bricks of a BrickField (if given), so the ball bounces off whatever it reaches
+        first however long the step is, and may bounce several times in one tick.
+        Returns game status ('playing', 'lost'), collision object ('wall', 'paddle', None)
+        and the list of bricks hit (removing them is up to the caller).
         """
         collision_object = None
+        bricks_hit = []
 
         if self.is_glued:
             # If glued, follow the paddle's center
@@ -155,66 +282,112 @@ class Ball(pygame.sprite.Sprite):
             if launch_ball: # If spacebar is pressed while glued
                 self.is_glued = False
                 # Re-initialize speed to ensure consistent launch angle
-                self.speed_x = self.base_speed * random.choice((1, -1))
+                self.speed_x = self.base_speed * self.rng.choice((1, -1))
                 self.speed_y = -self.base_speed
-            return 'playing', None # No further movement or collision if glued
+            return 'playing', None, bricks_hit # No further movement or collision if glued
+
+        self.update_slow_timer(dt)
+
+        remaining = 1.0 # Fraction of this tick's motion still to travel
+        for _ in range(self.MAX_CONTACTS_PER_TICK):
+            dx = self.speed_x * dt * remaining
+            dy = self.speed_y * dt * remaining
+            contact, obstacle = self._first_contact(dx, dy, paddle, bricks, bricks_hit)
+            if contact is None:
+                self.move(dx, dy)
+                break
+            self.move(dx * contact.time, dy * contact.time)
+            remaining *= 1 - contact.time
+
+            if obstacle is paddle:
+                self.bounce_off_paddle(paddle)
+                collision_object = 'paddle'
+                if self.is_glued:
+                    break # Caught: the ball rides the paddle from now on
+                continue
+            self.reflect(contact)
+            if obstacle == 'wall':
+                collision_object = collision_object or 'wall'
+            else:
+                bricks_hit.append(obstacle)
+        
+        # Check if ball falls below the screen (lose condition)
+        if self.rect.top > self.screen_height:
+            return 'lost', None, bricks_hit
+        
+        return 'playing', collision_object, bricks_hit
 
+    def _first_contact(self, dx, dy, paddle, bricks, ignored):
+        """
+        Returns (Contact, obstacle) for the first thing the ball touches moving by
+        (dx, dy): 'wall', the paddle or a brick not in ignored; (None, None) if nothing.
+        """
+        self._sync_from_rect()
+        radius = self.radius
+        cx = self.x + radius
+        cy = self.y + radius
+        first = swept_circle_walls(cx, cy, radius, dx, dy, self.screen_width)
+        obstacle = 'wall' if first is not None else None
+
+        # The paddle only catches a falling ball
+        if dy > 0:
+            contact = swept_circle_aabb(cx, cy, radius, dx, dy, paddle.rect)
+            if contact is not None and (first is None or contact.time < first.time):
+                first, obstacle = contact, paddle
+
+        if bricks is not None:
+            # Only the bricks in the cells the swept path covers are candidates
+            swept = pygame.Rect(math.floor(min(self.x, self.x + dx)) - 1, math.floor(min(self.y, self.y + dy)) - 1,
+                                math.ceil(abs(dx)) + 2 * radius + 3, math.ceil(abs(dy)) + 2 * radius + 3)
+            for brick in bricks.bricks_overlapping(swept):
+                if brick in ignored:
+                    continue
+                contact = swept_circle_aabb(cx, cy, radius, dx, dy, brick.rect)
+                if contact is not None and (first is None or contact.time < first.time):
+                    first, obstacle = contact, brick
+        return first, obstacle
+
+    def update_slow_timer(self, dt):
+        """Counts down the slow power-up; returns True if it ran out and the speed was restored."""
         if self.is_slowed:
-            self.slow_timer -= 1
+            self.slow_timer -= dt
             if self.slow_timer <= 0:
                 # Revert to normal speed when slow timer expires
                 self.speed_x = self.speed_x * 2
                 self.speed_y = self.speed_y * 2
                 self.is_slowed = False
+                return True
+        return False
 
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # Wall collisions
-        if self.rect.top <= 0:
-            self.speed_y *= -1
-            self.rect.top = 0 # Prevent sticking
-            collision_object = 'wall'
-        if self.rect.left <= 0:
-            self.speed_x *= -1
-            self.rect.left = 0 # Prevent sticking
-            collision_object = 'wall'
-        if self.rect.right >= self.screen_width:
+    def reflect(self, contact):
+        """
+        Bounces off a wall or brick along the dominant axis of the contact normal.
+        A square corner hit (a 45 degree normal, up to rounding) flips the vertical speed.
+        """
+        if abs(contact.normal_x) > abs(contact.normal_y) + 1e-9:
             self.speed_x *= -1
-            self.rect.right = self.screen_width # Prevent sticking
-            collision_object = 'wall'
-
-        # Paddle collision
-        # Check if ball collides with paddle and is moving downwards
-        if self.rect.colliderect(paddle.rect) and self.speed_y > 0:
-            if paddle.has_glue:
-                self.is_glued = True
-            self.speed_y *= -1 # Reverse vertical direction
-
-            # Calculate bounce angle based on hit position on paddle
-            # This makes the game more dynamic and skill-based
-            relative_intersect_x = self.rect.centerx - paddle.rect.centerx
-            normalized_intersect_x = relative_intersect_x / (paddle.width / 2)
-            bounce_angle = normalized_intersect_x * (math.pi / 3) # Max 60 degrees from vertical
-            
-            # Ensure minimum speed to prevent horizontal stalling
-            min_speed = 0.5 
-            self.speed_x = self.base_speed * math.sin(bounce_angle)
-            self.speed_y = -self.base_speed * math.cos(bounce_angle)
-            
-            # Prevent ball from getting stuck in paddle
-            self.rect.bottom = paddle.rect.top 
-            collision_object = 'paddle'
-        
-        # Check if ball falls below the screen (lose condition)
-        if self.rect.top > self.screen_height:
-            return 'lost', None
+        else:
+            self.speed_y *= -1
+
+    def bounce_off_paddle(self, paddle):
+        """Sends the ball back up at an angle set by where it hit the paddle."""
+        if paddle.has_glue:
+            self.is_glued = True
+
+        # Calculate bounce angle based on hit position on paddle
+        # This makes the game more dynamic and skill-based
+        relative_intersect_x = self.rect.centerx - paddle.rect.centerx
+        normalized_intersect_x = relative_intersect_x / (paddle.width / 2)
+        bounce_angle = normalized_intersect_x * (math.pi / 3) # Max 60 degrees from vertical
+        self.speed_x = self.base_speed * math.sin(bounce_angle)
+        self.speed_y = -self.base_speed * math.cos(bounce_angle)
         
-        return 'playing', collision_object
+        # Prevent ball from getting stuck in paddle
+        self.rect.bottom = paddle.rect.top 
 
-    def draw(self, screen):
-        """Draws the ball on the screen."""
-        pygame.draw.ellipse(screen, self.color, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Draws the ball on the screen, interpolated between the last two ticks. Returns the area drawn."""
+        return pygame.draw.ellipse(screen, self.color, self.interpolated_rect(alpha))
         
     def activate_power_up(self, type):
         """Activates a power-up effect on the ball."""
@@ -225,12 +398,13 @@ class Ball(pygame.sprite.Sprite):
             self.slow_timer = 600 # 10 seconds duration
 
 
-class Brick(pygame.sprite.Sprite):
+class Brick:
     """
     Represents a single brick.
     """
+    __slots__ = ('rect', 'color')
+
     def __init__(self, x, y, width, height, color):
-        super().__init__()
         self.rect = pygame.Rect(x, y, width, height)
         self.color = color
 
@@ -239,7 +413,135 @@ class Brick(pygame.sprite.Sprite):
         pygame.draw.rect(screen, self.color, self.rect)
 
 
-class PowerUp(pygame.sprite.Sprite):
+class BrickField:
+    """
+    Uniform-grid spatial index for the brick wall.
+    Bricks are stored by (row, col) cell so overlap queries only look at the
+    handful of cells a rect touches instead of scanning every brick.
+    Once build_layer() has run, the wall is also kept pre-rendered on one
+    surface: removing a brick only erases its cell, and drawing the wall is
+    a single blit however many bricks it has.
+    Each column also remembers its lowest brick, the one a shot travelling
+    straight up meets first (see lowest_overlapping).
+    """
+    def __init__(self, rows, cols, cell_width, cell_height, origin_x, origin_y):
+        self.rows = rows
+        self.cols = cols
+        self.cell_width = cell_width # Horizontal pitch (brick width + padding)
+        self.cell_height = cell_height # Vertical pitch (brick height + padding)
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self._cells = [None] * (rows * cols) # Row-major, None marks an empty cell
+        self._count = 0
+        self._lowest_rows = [-1] * cols # Row of the lowest brick in each column, -1 when empty
+        self.version = 0 # Bumped on every add/remove so cached drawings of the wall can be invalidated
+        self.layer = None # Pre-rendered wall covering the whole grid (see build_layer)
+        self.background_color = None
+
+    def cell_of(self, x, y):
+        """Returns the (row, col) cell containing the point, unclamped."""
+        return (y - self.origin_y) // self.cell_height, (x - self.origin_x) // self.cell_width
+
+    def add(self, brick):
+        """Places a brick in the cell under its top-left corner."""
+        row, col = self.cell_of(brick.rect.x, brick.rect.y)
+        index = row * self.cols + col
+        if self._cells[index] is None:
+            self._count += 1
+        self._cells[index] = brick
+        self._lowest_rows[col] = max(self._lowest_rows[col], row)
+        self.version += 1
+        if self.layer is not None:
+            self.layer.fill(brick.color, self._layer_rect(brick))
+
+    def remove(self, brick):
+        """Removes a brick from its cell."""
+        row, col = self.cell_of(brick.rect.x, brick.rect.y)
+        index = row * self.cols + col
+        if self._cells[index] is not brick:
+            raise ValueError("BrickField.remove(brick): brick not in field")
+        self._cells[index] = None
+        self._count -= 1
+        if self._lowest_rows[col] == row:
+            # The column's bottom brick is gone: the next one up (if any) is now the lowest
+            while row >= 0 and self._cells[row * self.cols + col] is None:
+                row -= 1
+            self._lowest_rows[col] = row
+        self.version += 1
+        if self.layer is not None:
+            self.layer.fill(self.background_color, self._layer_rect(brick)) # Erase just this cell
+
+    def build_layer(self, background_color):
+        """Pre-renders every brick onto a background-filled surface the size of the grid."""
+        self.background_color = background_color
+        self.layer = pygame.Surface((self.cols * self.cell_width, self.rows * self.cell_height))
+        self.layer.fill(background_color)
+        for brick in self:
+            self.layer.fill(brick.color, self._layer_rect(brick))
+
+    def _layer_rect(self, brick):
+        """Returns the brick's rect in layer coordinates."""
+        return brick.rect.move(-self.origin_x, -self.origin_y)
+
+    def draw(self, screen):
+        """Draws the wall: one blit of the layer if built, otherwise brick by brick."""
+        if self.layer is not None:
+            screen.blit(self.layer, (self.origin_x, self.origin_y))
+        else:
+            for brick in self:
+                brick.draw(screen)
+
+    def bricks_overlapping(self, rect):
+        """
+        Returns the bricks colliding with rect, in row-major order.
+        Only the cells covered by rect are visited.
+        """
+        first_row, first_col = self.cell_of(rect.left, rect.top)
+        last_row, last_col = self.cell_of(rect.right - 1, rect.bottom - 1)
+        first_row = max(first_row, 0)
+        first_col = max(first_col, 0)
+        last_row = min(last_row, self.rows - 1)
+        last_col = min(last_col, self.cols - 1)
+
+        hits = []
+        for row in range(first_row, last_row + 1):
+            row_start = row * self.cols
+            for col in range(first_col, last_col + 1):
+                brick = self._cells[row_start + col]
+                if brick is not None and rect.colliderect(brick.rect):
+                    hits.append(brick)
+        return hits
+
+    def lowest_overlapping(self, left, right):
+        """
+        Returns the lowest brick spanning any x in [left, right), or None.
+        Only the bottom brick of each column the span touches is looked at.
+        """
+        first_col = max((left - self.origin_x) // self.cell_width, 0)
+        last_col = min((right - 1 - self.origin_x) // self.cell_width, self.cols - 1)
+        lowest = None
+        for col in range(first_col, last_col + 1):
+            row = self._lowest_rows[col]
+            if row < 0:
+                continue
+            brick = self._cells[row * self.cols + col]
+            if brick.rect.left < right and brick.rect.right > left and (
+                    lowest is None or brick.rect.bottom > lowest.rect.bottom):
+                lowest = brick
+        return lowest
+
+    def __contains__(self, brick):
+        row, col = self.cell_of(brick.rect.x, brick.rect.y)
+        return 0 <= row < self.rows and 0 <= col < self.cols and self._cells[row * self.cols + col] is brick
+
+    def __iter__(self):
+        return (brick for brick in self._cells if brick is not None)
+
+    def __len__(self):
+        return self._count
+
+
+class PowerUp(MovingSprite):
     """
     Represents a power-up item that drops from destroyed bricks.
     """
@@ -253,125 +555,120 @@ class PowerUp(pygame.sprite.Sprite):
         'shield': {'color': (60, 255, 255), 'char': 'H', 'message': 'SHIELD (+1 LIFE)'},
     }
     
+    __slots__ = ('type', 'color', 'char')
+    width = 30
+    height = 15
+    speed_y = 3 # Speed at which power-up drops
+
     def __init__(self, x, y, type):
-        super().__init__()
-        self.width = 30
-        self.height = 15
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.speed_y = 3 # Speed at which power-up drops
+        super().__init__(pygame.Rect(x, y, self.width, self.height))
         self.type = type # Type of power-up (e.g., 'grow', 'laser')
         self.color = self.PROPERTIES[type]['color']
         self.char = self.PROPERTIES[type]['char'] # Character to display on the power-up
 
-    def update(self):
+    def reset(self, x, y, type):
+        """Turns a pooled power-up into a new one dropping from (x, y)."""
+        self.move_to(float(x), float(y))
+        self.save_previous()
+        self.type = type
+        self.color = self.PROPERTIES[type]['color']
+        self.char = self.PROPERTIES[type]['char']
+
+    def update(self, dt=1.0):
         """Updates the power-up's vertical position."""
-        self.rect.y += self.speed_y
+        self.move(0, self.speed_y * dt)
 
-    def draw(self, screen):
+    @property
+    def tile_name(self):
+        """Name of the power-up's pre-rendered tile in the SpriteAtlas."""
+        return 'power_up', self.type
+
+    def draw(self, screen, alpha=1.0):
         """Draws the power-up and its character on the screen."""
-        pygame.draw.rect(screen, self.color, self.rect)
+        rect = self.interpolated_rect(alpha)
+        pygame.draw.rect(screen, self.color, rect)
         text_surf = POWERUP_FONT.render(self.char, True, (255, 255, 255)) # White text
-        text_rect = text_surf.get_rect(center=self.rect.center)
+        text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
+        return rect
 
 
-class Laser(pygame.sprite.Sprite):
+class Laser(MovingSprite):
     """
     Represents a laser beam fired by the paddle.
     """
+    __slots__ = ('target', 'wall_version')
+    width = 5
+    height = 15
+    color = (255, 255, 0) # Yellow laser
+    speed_y = -8 # Laser moves upwards
+    tile_name = 'laser' # Pre-rendered tile in the SpriteAtlas
+
     def __init__(self, x, y):
-        super().__init__()
-        self.width = 5
-        self.height = 15
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.color = (255, 255, 0) # Yellow laser
-        self.speed_y = -8 # Laser moves upwards
-
-    def update(self):
+        super().__init__(pygame.Rect(x, y, self.width, self.height))
+        self.target = None # Brick in its path (looked up by the game from the brick wall's column index)
+        self.wall_version = None # BrickField.version the target was looked up at
+
+    def reset(self, x, y):
+        """Fires a pooled laser again from (x, y)."""
+        self.move_to(float(x), float(y))
+        self.save_previous()
+        self.target = None
+        self.wall_version = None
+
+    def update(self, dt=1.0):
         """Updates the laser's vertical position."""
-        self.rect.y += self.speed_y
+        self.move(0, self.speed_y * dt)
 
-    def draw(self, screen):
-        """Draws the laser on the screen."""
-        pygame.draw.rect(screen, self.color, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Draws the laser on the screen, interpolated between the last two ticks. Returns the area drawn."""
+        return pygame.draw.rect(screen, self.color, self.interpolated_rect(alpha))
 
 
-class Particle:
-    """
-    Represents a single particle for visual effects (explosions, sparks).
-    """
-    def __init__(self, x, y, color, min_size, max_size, min_speed, max_speed, gravity):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(min_size, max_size)
-        self.gravity = gravity # Affects vertical movement over time
-        
-        # Random initial velocity and angle for explosion effect
-        angle = random.uniform(0, 360)
-        speed = random.uniform(min_speed, max_speed)
-        self.vx = speed * math.cos(math.radians(angle))
-        self.vy = speed * math.sin(math.radians(angle))
-
-    def update(self):
-        """Updates the particle's position and size."""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity # Apply gravity
-        self.size -= 0.1 # Particles shrink over time, eventually disappearing
-
-    def draw(self, screen):
-        """Draws the particle on the screen."""
-        if self.size > 0: # Only draw if visible
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
-
-
-class Firework:
+class Firework(_InWorld):
     """
     Represents a firework effect for the 'YOU WIN!' screen.
-    Consists of a rocket phase and an explosion phase with particles.
+    Consists of a rocket phase and an explosion, which is emitted into the
+    shared ParticleSystem so its particles are simulated and drawn in batch.
     """
-    def __init__(self, screen_width, screen_height):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.x = random.randint(0, screen_width) # Random horizontal starting position
+    __slots__ = ('world', 'particles', 'rng', 'x', 'y', 'vy', 'exploded', 'explosion_y')
+    color = (255, 255, 255) # White rocket
+    radius = 3
+    tile_name = 'firework' # Pre-rendered rocket in the SpriteAtlas
+
+    def __init__(self, screen_width, screen_height, particles, rng=random):
+        self.world = World.of(screen_width, screen_height)
+        self.particles = particles # ParticleSystem the explosion is spawned into
+        self.rng = rng # Source of launch position, speed and colour
+        self.x = rng.randint(0, screen_width) # Random horizontal starting position
         self.y = screen_height # Start from bottom of the screen
-        self.vy = -random.uniform(8, 12) # Initial upward speed of the rocket
-        self.color = (255, 255, 255) # White rocket
+        self.vy = -rng.uniform(8, 12) # Initial upward speed of the rocket
         self.exploded = False
-        self.particles = [] # Particles for the explosion
         
         # Random height for explosion to occur
-        self.explosion_y = random.uniform(screen_height * 0.2, screen_height * 0.5)
+        self.explosion_y = rng.uniform(screen_height * 0.2, screen_height * 0.5)
 
-    def update(self):
+    def update(self, dt=1.0):
         """Updates the firework's state (rocket flight or particle explosion)."""
         if not self.exploded:
-            self.y += self.vy
+            self.y += self.vy * dt
             if self.y <= self.explosion_y:
                 self.exploded = True
                 # Generate explosion particles with a random color
-                explosion_color = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
-                for _ in range(50): # Create 50 particles on explosion
-                    self.particles.append(Particle(self.x, self.y, explosion_color, 2, 4, 1, 4, 0.1))
-        else:
-            # Update and remove dead particles
-            for particle in self.particles[:]:
-                particle.update()
-                if particle.size <= 0:
-                    self.particles.remove(particle)
+                explosion_color = (self.rng.randint(50, 255), self.rng.randint(50, 255), self.rng.randint(50, 255))
+                self.particles.spawn(self.x, self.y, explosion_color, 50, 2, 4, 1, 4, 0.1) # 50 particles
 
     def draw(self, screen):
-        """Draws the firework (rocket or explosion particles) on the screen."""
+        """
+        Draws the firework rocket; explosion particles are drawn by the ParticleSystem.
+        Returns the area drawn, or None once exploded.
+        """
         if not self.exploded:
             # Draw the rocket as a small circle
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 3)
-        else:
-            # Draw all explosion particles
-            for particle in self.particles:
-                particle.draw(screen)
+            return pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+        return None
 
     def is_dead(self):
-        """Checks if the firework has exploded and all its particles have disappeared."""
-        return self.exploded and not self.particles
+        """Checks if the firework has exploded (its particles then live on in the ParticleSystem)."""
+        return self.exploded
 
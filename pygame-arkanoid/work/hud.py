@@ -0,0 +1,114 @@
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+
+class Hud:
+    """
+    The in-game score bar and power-up indicators, composed onto cached surfaces.
+    Score, level and lives share one surface across the top of the screen; the ball
+    count and the laser/catch/grow indicators share another down the right edge.
+    Both are rebuilt only when key() changes - the game's stats version, the ball
+    count and the paddle's power-up version - so a normal frame formats no text and
+    costs two blits. Each surface is cropped to its labels: transparent pixels are
+    not free to blit, and the indicators sit over the brick wall. The counters are
+    drawn from glyph atlases, so a rebuild for a new score rasterizes nothing.
+    Given a SurfaceFactory, the composed surfaces are prepared by it for blitting.
+    """
+    MARGIN = 15 # Distance of the labels from the screen edges
+    TOP = 15 # Y of the score bar
+
+    def __init__(self, text_cache, font, small_font, screen_width, surfaces=None):
+        self.text_cache = text_cache
+        self.surfaces = surfaces
+        self.font = font # Score, level and lives
+        self.small_font = small_font # Ball count and power-up indicators
+        self.screen_width = screen_width
+        self.counters = text_cache.glyphs(font, (255, 255, 255), ("SCORE: ", "LEVEL: ", "LIVES: "))
+        self.ball_counter = text_cache.glyphs(small_font, (255, 255, 0), ("BALLS: ",))
+        self._key = None # key() the surfaces were built for
+        self._commands = [] # (surface, position) of each composed surface
+
+        # Statistics
+        self.rebuilds = 0
+        self._rebuild_times = deque() # perf_counter() of the rebuilds in the last second
+
+    @staticmethod
+    def key(game):
+        """Changes whenever anything the HUD shows changes."""
+        return game.stats_version, len(game.balls), game.paddle.power_up_version
+
+    def draw(self, screen, game):
+        """Blits the HUD of game, rebuilding it first if its values changed."""
+        key = self.key(game)
+        if key != self._key:
+            self._rebuild(game)
+            self._key = key
+        screen.blits(self._commands, doreturn=False)
+
+    def invalidate(self):
+        """Forces a rebuild on the next draw (e.g. after a resize)."""
+        self._key = None
+
+    def rebuilds_per_second(self):
+        """Rebuilds during the last second of wall-clock time."""
+        horizon = perf_counter() - 1.0
+        times = self._rebuild_times
+        while times and times[0] < horizon:
+            times.popleft()
+        return len(times)
+
+    def summary(self):
+        """One line of statistics, for the profiler overlay."""
+        return f"hud: {self.rebuilds} rebuilds, {self.rebuilds_per_second()}/s"
+
+    def _rebuild(self, game):
+        """Lays the labels out and composes each group onto its own surface."""
+        right = self.screen_width - self.MARGIN
+        bar = [self._counter(self.counters, f"SCORE: {game.score:,}", topleft=(self.MARGIN, self.TOP)),
+               self._counter(self.counters, f"LEVEL: {game.level}", centerx=self.screen_width // 2, y=self.TOP),
+               self._counter(self.counters, f"LIVES: {game.lives}", topright=(right, self.TOP))]
+
+        panel = []
+        if len(game.balls) > 1:
+            panel.append(self._counter(self.ball_counter, f"BALLS: {len(game.balls)}",
+                                       topright=(right, self.TOP + 40)))
+        indicator_y = self.TOP + 70
+        paddle = game.paddle
+        for active, text, color in ((paddle.has_laser, "⚡ LASER", (255, 60, 60)),
+                                    (paddle.has_glue, "🔗 CATCH", (60, 255, 60)),
+                                    (paddle.power_up_timers['grow'] > 0, "📏 GROW", (60, 60, 255))):
+            if active:
+                indicator = self.text_cache.render(self.small_font, text, color) # Fixed text, cached for good
+                rect = indicator.get_rect(topright=(right, indicator_y))
+                panel.append((rect, [(indicator, rect.topleft)]))
+                indicator_y += 25
+
+        self._commands = [self._compose(labels) for labels in (bar, panel) if labels]
+        if self.surfaces is not None:
+            self._commands = [(self.surfaces.prepare(surface), position) for surface, position in self._commands]
+        self.rebuilds += 1
+        self._rebuild_times.append(perf_counter())
+
+    @staticmethod
+    def _counter(glyphs, text, **position):
+        """Places text drawn from a glyph atlas; position takes Rect attributes, as get_rect()."""
+        rect = pygame.Rect((0, 0), glyphs.size(text))
+        for name, value in position.items():
+            setattr(rect, name, value)
+        return rect, glyphs.cells(text, rect.topleft)
+
+    @staticmethod
+    def _compose(labels):
+        """
+        Copies (rect, blit commands) labels onto one transparent surface covering them all
+        and returns it with its screen position. Neither labels nor glyph cells overlap,
+        so BLEND_RGBA_MAX onto the empty surface keeps each pixel's exact colour and alpha
+        (a plain blit of an RLE-accelerated label would darken its antialiased edges).
+        """
+        bounds = labels[0][0].unionall([rect for rect, _ in labels[1:]])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        surface.blits([(cell, (x - bounds.x, y - bounds.y), None, pygame.BLEND_RGBA_MAX)
+                       for _, commands in labels for cell, (x, y) in commands], doreturn=False)
+        return surface, bounds.topleft
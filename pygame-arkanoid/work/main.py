@@ -1,18 +1,78 @@
+import argparse
+import os
 import pygame
 import sys
 import random
-import math # Not directly used here, but good to keep if game_objects needs it
+import time
+import math
+import numpy as np
 
 # Import all game object classes from the separate file
-from game_objects import Paddle, Ball, Brick, PowerUp, Laser, Particle, Firework
+from game_objects import (Paddle, Ball, Brick, BrickField, PowerUp, Laser, Firework, REFERENCE_TICK_RATE,
+                          POWERUP_FONT_SIZE)
+from ball_set import BallSet
+from particles import ParticleSystem
+from text_cache import TextCache
+from rendering import DirtyRectRenderer, RenderQueue
+from scheduler import CollisionScheduler
+from ball_pairs import BallCollider
+from profiler import FrameProfiler
+from pools import ObjectPool
+from atlas import SpriteAtlas, render_game_tiles
+from hud import Hud
+from surfaces import SurfaceFactory
+from audio import SoundManager
+
+
+# Keys the simulation reads while they are held, and keys that act on a fresh press.
+# Only these are fed into a tick, which is what makes a session recordable and replayable.
+HELD_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+PRESS_KEYS = (pygame.K_SPACE, pygame.K_f, pygame.K_m)
+
+
+class KeyState(frozenset):
+    """
+    Set of held key constants that can be indexed like pygame.key.get_pressed().
+    Used to drive the game from scripted input instead of the keyboard.
+    """
+    def __getitem__(self, key):
+        return key in self
+
 
 class Game:
     """
     The main Game class, orchestrating all game logic, states, and rendering.
     This is the core of the advanced application architecture.
     """
-    def __init__(self):
-        """Initializes Pygame, screen, fonts, sounds, and game objects."""
+    def __init__(self, headless=False, render=True, sim_rate=REFERENCE_TICK_RATE, fps=60, dirty_rects=False,
+                 seed=None, event_physics=False, mega_balls=0, ball_collisions=False):
+        """
+        Initializes Pygame, screen, fonts, sounds, and game objects.
+        headless selects the SDL dummy video/audio drivers and removes the frame cap;
+        render=False additionally skips all drawing (for simulation runs).
+        sim_rate is the fixed simulation rate in ticks per second and fps the render cap;
+        the two are independent, frames in between ticks are interpolated.
+        dirty_rects presents only the changed parts of the screen instead of flipping every frame.
+        seed fixes every random stream of the session (a random one is picked and kept in self.seed if None).
+        event_physics moves the balls from impact to impact with a CollisionScheduler instead of
+        sweeping each ball every tick (cheaper for long headless simulation runs).
+        mega_balls > 0 is the mega multi-ball stress mode: balls live in a vectorized BallSet and
+        launching or a multi-ball power-up releases that many balls at once.
+        ball_collisions makes the balls bounce off each other instead of passing through.
+        """
+        if event_physics and mega_balls:
+            raise ValueError("event_physics and mega_balls cannot be combined")
+        self.headless = headless
+        self.render = render
+        self.sim_rate = sim_rate
+        self.sim_dt = 1.0 / sim_rate # Seconds of game time per tick
+        self.tick_scale = REFERENCE_TICK_RATE / sim_rate # Tick length in 60 Hz reference ticks
+        self.max_frame_time = 0.25 # Longest frame the accumulator catches up on (avoids spiralling)
+        self._seed_random_streams(random.randrange(2 ** 63) if seed is None else seed)
+        if headless:
+            # Must be set before pygame.init() so SDL never opens a window or audio device
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
         pygame.init()
         pygame.mixer.init() # Initialize mixer for sounds
 
@@ -21,22 +81,39 @@ class Game:
         self.screen_height = 600
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("PyGame Arkanoid")
+        self.renderer = DirtyRectRenderer(self.screen) if dirty_rects else None
+        self.surfaces = SurfaceFactory() # Converts generated surfaces to the display format
+        self.render_queue = RenderQueue(self.screen) # Blits of a frame, batched per layer
+        self.render_queue.surfaces = self.surfaces # Audits the blits while debugging
         self.clock = pygame.time.Clock() # To control frame rate
+        self.fps_cap = 0 if headless else fps # 0 means uncapped for Clock.tick
+        self.idle_fps = 10 # Frame rate while nothing on screen moves (title, game over, level complete)
+        self.background_fps = 5 # Frame rate while the window does not have the focus
 
         # Colors
         self.BG_COLOR = pygame.Color('grey12') # Dark grey background
         self.BRICK_COLORS = [(178, 34, 34), (255, 165, 0), (255, 215, 0), (50, 205, 50)] # Red, Orange, Gold, Green
 
-        # Font Setup
-        self.title_font = pygame.font.Font(None, 70) # For title screen
-        self.game_font = pygame.font.Font(None, 40) # For score, lives, and game over/win messages
-        self.message_font = pygame.font.Font(None, 30) # For power-up messages
+        # Font Setup - fonts are loaded once and rendered labels reused through the text cache
+        self.text_cache = TextCache(surfaces=self.surfaces)
+        self.title_font = self.text_cache.font(None, 70) # For title screen
+        self.game_font = self.text_cache.font(None, 40) # For score, lives, and game over/win messages
+        self.message_font = self.text_cache.font(None, 30) # For power-up messages
+        self.hud_font = self.text_cache.font(None, 32) # For the in-game score/level/lives bar
+        self.controls_font = self.text_cache.font(None, 24) # For the title screen control list
+        self.button_font = self.text_cache.font(None, 18) # For the mute button label
+        # Every sprite pre-rendered in the display format
+        self.atlas = SpriteAtlas(render_game_tiles(self.text_cache.font(None, POWERUP_FONT_SIZE)))
+        self.hud = Hud(self.text_cache, self.hud_font, self.message_font, self.screen_width,
+                       self.surfaces) # Cached score bar
 
         # Sound Setup - Robust loading with dummy sound fallback
-        self.bounce_sound = self._load_sound('bounce.wav')
-        self.brick_break_sound = self._load_sound('brick_break.wav')
-        self.game_over_sound = self._load_sound('game_over.wav')
-        self.laser_sound = self._load_sound('laser.wav')
+        # Reserved channels per category; bursts are merged per tick and rate limited per sound
+        self.sounds = SoundManager({'impacts': 5, 'lasers': 2, 'events': 1})
+        self.bounce_sound = self._load_sound('bounce.wav', 'impacts', min_interval=0.05)
+        self.brick_break_sound = self._load_sound('brick_break.wav', 'impacts', min_interval=0.05)
+        self.game_over_sound = self._load_sound('game_over.wav', 'events')
+        self.laser_sound = self._load_sound('laser.wav', 'lasers', min_interval=0.1)
 
         # Game State Management
         # Define game states as class attributes for clarity
@@ -50,13 +127,22 @@ class Game:
         # Game Objects (initialized in _reset_game or _initialize_game_elements)
         self.paddle = Paddle(self.screen_width, self.screen_height)
         self.balls = [] # List to hold multiple balls for multi-ball feature
-        self.bricks = [] # List to hold brick objects
+        self.bricks = BrickField(0, 0, 1, 1, 0, 0) # Grid-indexed brick wall (filled per level)
         self.power_ups = [] # List to hold active power-ups
         self.lasers = [] # List to hold active laser beams
-        self.particles = [] # List to hold particles for explosions/sparks
+        self.particles = ParticleSystem(rng=self.rng_particles) # Array-backed particles for explosions/sparks/fireworks
         self.fireworks = [] # List to hold fireworks for win screen
+        self.scheduler = CollisionScheduler() if event_physics else None # Event-driven ball physics, if enabled
+        self.mega_balls = mega_balls # Balls released at once in mega multi-ball mode (0 when off)
+        self.swarm_pending = False # Mega mode: the next launch is a serve and releases the swarm
+        self.ball_collider = BallCollider() if ball_collisions else None # Ball-to-ball bounces, if enabled
+        # Recycled game objects, so long sessions stop allocating once the pools are warm
+        self.ball_pool = ObjectPool('ball', lambda: Ball(self.screen_width, self.screen_height, self.rng_balls))
+        self.power_up_pool = ObjectPool('power-up', PowerUp)
+        self.laser_pool = ObjectPool('laser', Laser)
 
         # Game Variables
+        self.stats_version = 0 # Bumped whenever score, lives or level change (the HUD redraws on change)
         self.score = 0
         self.lives = 3
         self.level = 1
@@ -65,55 +151,175 @@ class Game:
         self.message_timer = 0 # Timer for displaying messages
         self.firework_timer = 0 # Timer for spawning fireworks on win screen
         self.level_complete_timer = 0 # Timer for level complete screen
+        self.power_ups_dropped = 0 # Power-ups released from bricks this game
+        self.power_ups_collected = 0 # Power-ups caught by the paddle this game
+
+        # Balancing (tuned with batch_sim.py)
+        self.brick_gap_chance = 0.1 # Chance each brick is left out of the wall from level 3 on
+        self.power_up_chance = 0.3 # Drop chance per destroyed brick at level 0...
+        self.power_up_chance_per_level = 0.05 # ...plus this much per level...
+        self.power_up_chance_max = 0.6 # ...up to this cap
+        self.ball_speed_per_level = 0.5 # Launch speed gained per level on top of the ball's base speed of 6
+        self.ball_speed_max = 10 # Cap for the per-level ball speed
         
         # Sound control
         self.sound_enabled = True
         self.mute_button_rect = pygame.Rect(10, self.screen_height - 40, 80, 30)
+        self._mute_button_surfaces = {} # sound_enabled -> pre-rendered button
+        self._screen_cache = None # Composed level-complete or end screen
+        self._screen_cache_key = None # What _screen_cache shows (None when it must be composed again)
+        self._overlay_tint = None # Translucent tint of the level-complete screen
 
         # Flag to control the main game loop
         self.running = True
+        self.tick_count = 0 # Number of simulation ticks advanced so far
+        self._held_keys = KeyState() # Keys held during the previous tick
+        self._pending_presses = [] # Key presses waiting for the next tick (in arrival order)
+        self.recorder = None # InputRecorder logging every tick's input, if recording
+        self.has_focus = True # Whether the window has the keyboard focus
+        self._redraw = True # Draw the next frame even if the idle screen did not change (window exposed)
+        self._drawn_key = None # Static layer key of the last frame drawn while idle
+        self._wake_events = [] # Event that ended an idle wait, handled with the next batch
+        self._last_wake = 0 # pygame.time.get_ticks() when the last frame wait ended
+        self.frames_drawn = 0
+        self.frames_skipped = 0 # Idle frames that would have drawn exactly what the screen showed
+        self.profiler = FrameProfiler() # Per-subsystem frame timings (F3 toggles the overlay)
+        self.profiler_font = self.text_cache.font(None, 20) # For the profiler overlay
+
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, value):
+        self._score = value
+        self.stats_version += 1
+
+    @property
+    def lives(self):
+        return self._lives
+
+    @lives.setter
+    def lives(self, value):
+        self._lives = value
+        self.stats_version += 1
+
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, value):
+        self._level = value
+        self.stats_version += 1
+
+    def _seed_random_streams(self, seed):
+        """
+        Creates one independent random stream per subsystem, all derived from seed,
+        so a session replays identically and subsystems don't disturb each other's draws.
+        """
+        self.seed = seed
+        self.rng_bricks = random.Random(f"{seed}/bricks") # Gaps in the brick wall
+        self.rng_balls = random.Random(f"{seed}/balls") # Launch and multi-ball directions
+        self.rng_power_ups = random.Random(f"{seed}/power_ups") # Drop rolls and types
+        self.rng_fireworks = random.Random(f"{seed}/fireworks") # Win screen fireworks
+        self.rng_particles = np.random.default_rng(random.Random(f"{seed}/particles").getrandbits(64))
+
+    def _new_ball(self):
+        """Takes a ball from the pool, glued to the start position, drawing directions from the ball stream."""
+        return self.ball_pool.acquire()
+
+    def _collide_balls(self):
+        """Bounces the free balls off each other."""
+        if self.mega_balls:
+            balls = self.balls
+            n = len(balls)
+            collisions = self.ball_collider.resolve(balls.x[:n], balls.y[:n], balls.speed_x[:n], balls.speed_y[:n],
+                                                    balls.diameter, ~balls.glued[:n], self.screen_width)
+        else:
+            positions = [ball.position() for ball in self.balls]
+            x = np.array([position[0] for position in positions])
+            y = np.array([position[1] for position in positions])
+            speed_x = np.array([ball.speed_x for ball in self.balls], dtype=float)
+            speed_y = np.array([ball.speed_y for ball in self.balls], dtype=float)
+            active = np.array([not ball.is_glued for ball in self.balls])
+            collisions = self.ball_collider.resolve(x, y, speed_x, speed_y, self.balls[0].radius * 2, active,
+                                                    self.screen_width)
+            if collisions:
+                for index, ball in enumerate(self.balls):
+                    if (x[index], y[index]) != positions[index]:
+                        ball.move_to(x[index].item(), y[index].item())
+                    if (speed_x[index], speed_y[index]) != (ball.speed_x, ball.speed_y):
+                        ball.speed_x, ball.speed_y = speed_x[index].item(), speed_y[index].item()
+        if collisions:
+            self._play_sound(self.bounce_sound)
+
+    def _new_balls(self):
+        """Creates the balls for a new life or level: one ball glued to the start position."""
+        if not self.mega_balls:
+            self.ball_pool.release_all(self.balls) # Whatever was still in play goes back to the pool
+            return [self._new_ball()]
+        balls = BallSet(self.screen_width, self.screen_height, self.rng_balls)
+        ball = self._new_ball()
+        balls.append(ball) # The set copies the ball, so it can go straight back to the pool
+        self.ball_pool.release(ball)
+        self.swarm_pending = True
+        return balls
+
+    def _launch_swarm(self):
+        """Mega mode: releases the swarm on the serve of a life or level, not on relaunches of caught balls."""
+        if self.swarm_pending:
+            self.swarm_pending = False
+            self._spawn_multi_ball(self.mega_balls)
+
+    def _spawn_multi_ball(self, count):
+        """Releases count extra balls from the first ball's position."""
+        if self.balls:  # Only if there are existing balls
+            main_ball = self.balls[0]
+            for _ in range(count):
+                new_ball = self._new_ball()
+                new_ball.rect.center = main_ball.rect.center
+                if self.mega_balls:
+                    # Fan the swarm out over the paddle's bounce angles so it spreads across the field
+                    angle = self.rng_balls.uniform(-math.pi / 3, math.pi / 3)
+                    new_ball.speed_x = 6 * math.sin(angle)
+                    new_ball.speed_y = -6 * math.cos(angle)
+                else:
+                    new_ball.speed_x = self.rng_balls.choice([-6, 6])
+                    new_ball.speed_y = -6
+                new_ball.is_glued = False
+                self.balls.append(new_ball)
+                if self.mega_balls:
+                    self.ball_pool.release(new_ball) # Copied into the BallSet
 
-    def _load_sound(self, path):
-        """Helper to load sound files with error handling."""
+    def _load_sound(self, path, category, min_interval=0.0):
+        """
+        Helper to load sound files with error handling.
+        The sound is registered with the SoundManager under category, played at most once every min_interval seconds.
+        """
         try:
-            # Try loading from current directory first
-            return pygame.mixer.Sound(path)
-        except pygame.error:
-            try:
-                # Try loading from script directory
-                import os
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                full_path = os.path.join(script_dir, path)
-                return pygame.mixer.Sound(full_path)
-            except pygame.error as e:
-                print(f"Warning: Sound file '{path}' not found or could not be loaded. {e}")
-                class DummySound: # Dummy class if sound fails to load
-                    def play(self): pass
-                    def set_volume(self, volume): pass
-                return DummySound()
+            # Resolve against the script directory, so it loads from any working directory
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            sound = pygame.mixer.Sound(os.path.join(script_dir, path))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Warning: Sound file '{path}' not found or could not be loaded. {e}")
+            class DummySound: # Dummy class if sound fails to load
+                def play(self): pass
+            return DummySound()
+        self.sounds.register(sound, category, min_interval)
+        return sound
 
     def _play_sound(self, sound):
-        """Play sound only if sound is enabled."""
-        if self.sound_enabled:
-            sound.play()
+        """Plays sound through the SoundManager's channels (nothing while muted)."""
+        self.sounds.play(sound)
 
     def _toggle_mute(self):
         """Toggle sound on/off."""
         self.sound_enabled = not self.sound_enabled
-        # Set volume for all individual sound objects
-        volume = 1.0 if self.sound_enabled else 0.0
-        try:
-            self.bounce_sound.set_volume(volume)
-            self.brick_break_sound.set_volume(volume)
-            self.game_over_sound.set_volume(volume)
-            self.laser_sound.set_volume(volume)
-        except AttributeError:
-            # Handle case where sounds are DummySound objects
-            pass
+        self.sounds.set_muted(not self.sound_enabled) # Channel volumes, so every registered sound follows
 
     def _create_brick_wall(self):
-        """Generates a new set of bricks for a level."""
-        bricks = []
+        """Generates a new set of bricks for a level, indexed on a uniform grid."""
         brick_rows = min(4 + self.level // 2, 8)  # More rows in higher levels
         brick_cols = 10
         brick_width = 75
@@ -124,30 +330,35 @@ class Game:
         # Calculate horizontal offset to center the brick wall
         total_brick_wall_width = brick_cols * (brick_width + brick_padding) - brick_padding
         start_x_offset = (self.screen_width - total_brick_wall_width) // 2
+        bricks = BrickField(brick_rows, brick_cols, brick_width + brick_padding,
+                            brick_height + brick_padding, start_x_offset, wall_start_y)
 
         for row in range(brick_rows):
             for col in range(brick_cols):
                 # Create some gaps in higher levels for more challenge
-                if self.level > 2 and random.random() < 0.1:
+                if self.level > 2 and self.rng_bricks.random() < self.brick_gap_chance:
                     continue
                     
                 x = start_x_offset + col * (brick_width + brick_padding)
                 y = row * (brick_height + brick_padding) + wall_start_y
                 color = self.BRICK_COLORS[row % len(self.BRICK_COLORS)] # Cycle through colors per row
-                bricks.append(Brick(x, y, brick_width, brick_height, color))
+                bricks.add(Brick(x, y, brick_width, brick_height, color))
+        bricks.build_layer(self.BG_COLOR) # Render the wall once; destroyed bricks just erase their cell
         return bricks
 
     def _reset_game(self):
         """Resets all game elements and variables for a new game."""
         self.paddle.reset()
         # Initialize with one ball
-        self.balls = [Ball(self.screen_width, self.screen_height)]
+        self.balls = self._new_balls()
         self.bricks = self._create_brick_wall() # Recreate the brick wall
         self.score = 0
         self.lives = 3
         self.level = 1
-        self.power_ups.clear()
-        self.lasers.clear()
+        self.power_ups_dropped = 0
+        self.power_ups_collected = 0
+        self.power_up_pool.release_all(self.power_ups)
+        self.laser_pool.release_all(self.lasers)
         self.particles.clear()
         self.fireworks.clear()
         self.display_message = ""
@@ -166,70 +377,136 @@ class Game:
             self.level_complete_timer = 180  # 3 seconds
             self.paddle.reset()
             # Reset to single ball for new level
-            self.balls = [Ball(self.screen_width, self.screen_height)]
+            self.balls = self._new_balls()
             self.bricks = self._create_brick_wall()
-            self.power_ups.clear()
-            self.lasers.clear()
+            self.power_up_pool.release_all(self.power_ups)
+            self.laser_pool.release_all(self.lasers)
             # Increase ball speed slightly each level
             for ball in self.balls:
-                ball.base_speed = min(6 + self.level * 0.5, 10)
+                ball.base_speed = min(6 + self.level * self.ball_speed_per_level, self.ball_speed_max)
 
     def _handle_input(self):
         """Processes user input events."""
-        for event in pygame.event.get():
+        events = self._wake_events + pygame.event.get()
+        self._wake_events = []
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.has_focus = False # Throttled to background_fps until the focus comes back
+            if event.type == pygame.WINDOWFOCUSGAINED:
+                self.has_focus = True
+                self._redraw = True
+            if event.type == pygame.WINDOWEXPOSED:
+                self._redraw = True # Uncovered: a skipped idle frame must be drawn again
+            if event.type == pygame.WINDOWSIZECHANGED:
+                self._invalidate_screen_caches()
             if event.type == pygame.MOUSEBUTTONDOWN:
-                # Check mute button click
+                # Check mute button click (acts exactly like pressing M)
                 if self.mute_button_rect.collidepoint(event.pos):
-                    self._toggle_mute()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_m:  # M key to toggle mute
-                    self._toggle_mute()
-                if event.key == pygame.K_SPACE:
-                    if self.game_state == self.GAME_STATE_TITLE:
-                        self._reset_game() # Start game from title screen
-                    elif self.game_state in [self.GAME_STATE_GAME_OVER, self.GAME_STATE_WIN]:
-                        # After game over or win, pressing space returns to title screen
-                        self.game_state = self.GAME_STATE_TITLE 
-                        self._reset_game() # Reset game state for next play, but stay on title
-                        for ball in self.balls:
-                            ball.is_glued = True # Ensure balls are stuck on title screen
-                    elif self.game_state == self.GAME_STATE_LEVEL_COMPLETE:
-                        self.game_state = self.GAME_STATE_PLAYING
-                        self.level_complete_timer = 0
-                    elif self.game_state == self.GAME_STATE_PLAYING:
-                        # Launch all glued balls
-                        for ball in self.balls:
-                            if ball.is_glued:
-                                ball.is_glued = False 
-                
-                # Laser firing only in playing state with laser power-up
-                if self.game_state == self.GAME_STATE_PLAYING and event.key == pygame.K_f and self.paddle.has_laser:
-                    self.lasers.append(Laser(self.paddle.rect.centerx - 30, self.paddle.rect.top))
-                    self.lasers.append(Laser(self.paddle.rect.centerx + 30, self.paddle.rect.top))
-                    self._play_sound(self.laser_sound)
-
-    def _update_game_logic(self):
-        """Updates the state of all game objects and checks for game conditions."""
+                    self._pending_presses.append(pygame.K_m)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # Debug display only, so it never reaches the simulation (or a recording)
+                self.profiler.toggle_overlay()
+                self.surfaces.debug = self.profiler.overlay_visible # Count unconverted blits while shown
+            if event.type == pygame.KEYDOWN and event.key in PRESS_KEYS:
+                # Applied at the start of the next tick, so every press belongs to a tick
+                self._pending_presses.append(event.key)
+
+    def _take_pending_presses(self):
+        """
+        Removes and returns the presses for the next tick, one per key in PRESS_KEYS order.
+        A key pressed twice before a tick keeps its second press for the tick after.
+        """
+        presses = sorted(set(self._pending_presses))
+        for key in presses:
+            self._pending_presses.remove(key)
+        return presses
+
+    def _handle_key_down(self, key):
+        """Reacts to a single key press at the start of a tick."""
+        if key == pygame.K_m:  # M key to toggle mute
+            self._toggle_mute()
+        if key == pygame.K_SPACE:
+            if self.game_state == self.GAME_STATE_TITLE:
+                self._reset_game() # Start game from title screen
+            elif self.game_state in [self.GAME_STATE_GAME_OVER, self.GAME_STATE_WIN]:
+                # After game over or win, pressing space returns to title screen
+                self.game_state = self.GAME_STATE_TITLE 
+                self._reset_game() # Reset game state for next play, but stay on title
+                for ball in self.balls:
+                    ball.is_glued = True # Ensure balls are stuck on title screen
+            elif self.game_state == self.GAME_STATE_LEVEL_COMPLETE:
+                self.game_state = self.GAME_STATE_PLAYING
+                self.level_complete_timer = 0
+            elif self.game_state == self.GAME_STATE_PLAYING:
+                # Launch all glued balls
+                launched = False
+                for ball in self.balls:
+                    if ball.is_glued:
+                        ball.is_glued = False 
+                        launched = True
+                if launched and self.mega_balls:
+                    self._launch_swarm()
+
+        # Laser firing only in playing state with laser power-up
+        if self.game_state == self.GAME_STATE_PLAYING and key == pygame.K_f and self.paddle.has_laser:
+            self.lasers.append(self.laser_pool.acquire(self.paddle.rect.centerx - 30, self.paddle.rect.top))
+            self.lasers.append(self.laser_pool.acquire(self.paddle.rect.centerx + 30, self.paddle.rect.top))
+            self._play_sound(self.laser_sound)
+
+    def _update_game_logic(self, keys):
+        """
+        Updates the state of all game objects and checks for game conditions.
+        keys holds the keys pressed this tick (pygame.key.get_pressed() or a KeyState).
+        """
+        dt = self.tick_scale
+        profiler = self.profiler
         if self.game_state == self.GAME_STATE_PLAYING:
-            self.paddle.update()
-            keys = pygame.key.get_pressed() # Check keys for ball launch if glued
+            # Remember where everything was so rendering can interpolate into this tick
+            self.paddle.save_previous()
+            if self.mega_balls:
+                self.balls.save_previous()
+            else:
+                for ball in self.balls:
+                    ball.save_previous()
+            for sprite in self.power_ups + self.lasers:
+                sprite.save_previous()
+
+            self.paddle.update(keys, dt)
             
-            # Update all balls
+            # Update all balls (each ball's path is swept against walls, paddle and bricks)
             balls_lost = 0
-            for ball in self.balls[:]:  # Iterate over copy to allow removal
-                ball_status, collision_object = ball.update(self.paddle, keys[pygame.K_SPACE])
+            bricks_hit = [] # Bricks hit this tick, in the order the balls reached them
+            if self.mega_balls:
+                # Vectorized: the BallSet reports what happened instead of one result per ball
+                events = self.balls.update(self.paddle, keys[pygame.K_SPACE], dt, self.bricks)
+                balls_lost = events.lost
+                bricks_hit = events.bricks_hit
+                for kind, x, y in events.bounces:
+                    self._play_sound(self.bounce_sound)
+                    self.particles.spawn(int(x), int(y), (255, 255, 0), 5, 1, 3, 1, 3, 0)
+                if events.launched:
+                    self._launch_swarm()
+                ball_results = []
+            elif self.scheduler is not None:
+                ball_results = self.scheduler.update(self.balls, self.paddle, self.bricks, keys[pygame.K_SPACE], dt)
+            else:
+                ball_results = [ball.update(self.paddle, keys[pygame.K_SPACE], dt, self.bricks) for ball in self.balls]
+            for ball, (ball_status, collision_object, ball_bricks_hit) in list(zip(self.balls, ball_results)): # Copy to allow removal
+                bricks_hit.extend(ball_bricks_hit)
                 
                 # Handle ball status (lost life)
                 if ball_status == 'lost':
                     self.balls.remove(ball)
+                    self.ball_pool.release(ball)
                     balls_lost += 1
                 elif collision_object in ['wall', 'paddle']:
                     self._play_sound(self.bounce_sound)
                     # Generate sparks on ball collision with wall/paddle
-                    for _ in range(5):
-                        self.particles.append(Particle(ball.rect.centerx, ball.rect.centery, (255, 255, 0), 1, 3, 1, 3, 0))
+                    self.particles.spawn(ball.rect.centerx, ball.rect.centery, (255, 255, 0), 5, 1, 3, 1, 3, 0)
+            if self.ball_collider is not None and len(self.balls) > 1:
+                self._collide_balls()
 
             # Check if all balls are lost
             if not self.balls:
@@ -239,155 +516,262 @@ class Game:
                     self._play_sound(self.game_over_sound)
                 else:
                     # Reset with new ball if lives remain
-                    self.balls = [Ball(self.screen_width, self.screen_height)]
+                    self.balls = self._new_balls()
                     self.paddle.reset() # Reset paddle size/powerups on losing a life
+            profiler.lap('update.ball_physics')
 
-            # Ball and Brick Collision
-            for ball in self.balls:
-                for brick in self.bricks[:]: # Iterate over a copy to allow removal
-                    if ball.rect.colliderect(brick.rect):
-                        ball.speed_y *= -1 # Reverse ball direction
-                        # Generate brick explosion particles
-                        for _ in range(15):
-                            self.particles.append(Particle(brick.rect.centerx, brick.rect.centery, brick.color, 1, 4, 1, 4, 0.05))
-                        self.bricks.remove(brick) # Remove the hit brick
-                        self.score += 10 * self.level # Score increases with level
-                        self._play_sound(self.brick_break_sound)
-                        
-                        # Increased power-up chance in higher levels
-                        power_up_chance = min(0.3 + self.level * 0.05, 0.6)
-                        if random.random() < power_up_chance:
-                            power_up_types = list(PowerUp.PROPERTIES.keys())
-                            # Add new power-ups for higher levels
-                            if self.level >= 3:
-                                power_up_types.extend(['multi_ball', 'shield'])
-                            power_up_type = random.choice(power_up_types)
-                            power_up = PowerUp(brick.rect.centerx, brick.rect.centery, power_up_type)
-                            self.power_ups.append(power_up)
-                        break # Only hit one brick per ball update
+            # Ball and Brick Collision (the balls already bounced off them)
+            for brick in bricks_hit:
+                if brick not in self.bricks:
+                    continue # Another ball broke it earlier this tick
+                # Generate brick explosion particles
+                self.particles.spawn(brick.rect.centerx, brick.rect.centery, brick.color, 15, 1, 4, 1, 4, 0.05)
+                self.bricks.remove(brick) # Remove the hit brick
+                self.score += 10 * self.level # Score increases with level
+                self._play_sound(self.brick_break_sound)
+                
+                # Increased power-up chance in higher levels
+                power_up_chance = min(self.power_up_chance + self.level * self.power_up_chance_per_level,
+                                      self.power_up_chance_max)
+                if self.rng_power_ups.random() < power_up_chance:
+                    power_up_types = list(PowerUp.PROPERTIES.keys())
+                    # Add new power-ups for higher levels
+                    if self.level >= 3:
+                        power_up_types.extend(['multi_ball', 'shield'])
+                    power_up_type = self.rng_power_ups.choice(power_up_types)
+                    power_up = self.power_up_pool.acquire(brick.rect.centerx, brick.rect.centery, power_up_type)
+                    self.power_ups.append(power_up)
+                    self.power_ups_dropped += 1
+            profiler.lap('update.brick_collision')
 
             # Power-Up Logic
             for power_up in self.power_ups[:]:
-                power_up.update()
+                power_up.update(dt)
                 if power_up.rect.top > self.screen_height: # Remove if falls off screen
                     self.power_ups.remove(power_up)
+                    self.power_up_pool.release(power_up)
                 elif self.paddle.rect.colliderect(power_up.rect): # If paddle collects power-up
+                    self.power_ups_collected += 1
                     if power_up.type in PowerUp.PROPERTIES:
                         self.display_message = power_up.PROPERTIES[power_up.type]['message']
-                        self.message_timer = 120 # Display message for 2 seconds (120 frames)
+                        self.message_timer = 120 # Display message for 2 seconds (120 reference ticks)
                         if power_up.type in ['grow', 'laser', 'glue']:
                             self.paddle.activate_power_up(power_up.type)
                         elif power_up.type == 'slow':
                             # Apply slow to all balls
-                            for ball in self.balls:
-                                ball.activate_power_up(power_up.type)
+                            if self.mega_balls:
+                                self.balls.activate_power_up(power_up.type) # One batch update of the BallSet
+                            else:
+                                for ball in self.balls:
+                                    ball.activate_power_up(power_up.type)
                         elif power_up.type == 'multi_ball':
                             self.display_message = 'MULTI BALL!'
-                            # Add extra balls (proper implementation)
-                            if self.balls:  # Only if there are existing balls
-                                main_ball = self.balls[0]
-                                for _ in range(2):
-                                    new_ball = Ball(self.screen_width, self.screen_height)
-                                    new_ball.rect.center = main_ball.rect.center
-                                    new_ball.speed_x = random.choice([-6, 6])
-                                    new_ball.speed_y = -6
-                                    new_ball.is_glued = False
-                                    self.balls.append(new_ball)
+                            self._spawn_multi_ball(self.mega_balls or 2) # Add extra balls
                         elif power_up.type == 'shield':
                             self.display_message = 'SHIELD ACTIVATED!'
                             # Shield power-up gives an extra life
                             self.lives = min(self.lives + 1, 5)
                     self.power_ups.remove(power_up)
+                    self.power_up_pool.release(power_up)
+            profiler.lap('update.power_ups')
 
             # Laser Logic
             for laser in self.lasers[:]:
-                laser.update()
-                if laser.rect.bottom < 0: # Remove if goes off screen
+                laser.update(dt)
+                # Lasers fly straight up, so the first brick they meet is the lowest one in their column;
+                # it only needs looking up again once a brick has broken
+                if laser.wall_version != self.bricks.version:
+                    laser.target = self.bricks.lowest_overlapping(laser.rect.left, laser.rect.right)
+                    laser.wall_version = self.bricks.version
+                brick = laser.target
+                # Checked before leaving the screen: at low tick rates one step can carry a laser
+                # from below the top row to above the screen
+                if brick is not None and laser.rect.top < brick.rect.bottom:
+                    # Generate brick explosion particles for laser hits
+                    self.particles.spawn(brick.rect.centerx, brick.rect.centery, brick.color, 10, 1, 3, 1, 3, 0.05)
+                    self.bricks.remove(brick)
+                    self.lasers.remove(laser) # Laser disappears after hitting a brick
+                    self.laser_pool.release(laser)
+                    self.score += 10 * self.level
+                    self._play_sound(self.brick_break_sound)
+                elif laser.rect.bottom < 0: # Remove if goes off screen
                     self.lasers.remove(laser)
-                else:
-                    for brick in self.bricks[:]:
-                        if laser.rect.colliderect(brick.rect):
-                            # Generate brick explosion particles for laser hits
-                            for _ in range(10):
-                                self.particles.append(Particle(brick.rect.centerx, brick.rect.centery, brick.color, 1, 3, 1, 3, 0.05))
-                            self.bricks.remove(brick)
-                            self.lasers.remove(laser) # Laser disappears after hitting a brick
-                            self.score += 10 * self.level
-                            self._play_sound(self.brick_break_sound)
-                            break # Laser can only hit one brick
+                    self.laser_pool.release(laser)
+            profiler.lap('update.lasers')
 
             # Check win condition (level complete)
             if not self.bricks:
                 self._next_level()
 
         elif self.game_state == self.GAME_STATE_LEVEL_COMPLETE:
-            self.level_complete_timer -= 1
+            self.level_complete_timer -= dt
             if self.level_complete_timer <= 0:
                 self.game_state = self.GAME_STATE_PLAYING
 
         # Update message timer (active in all states)
         if self.message_timer > 0:
-            self.message_timer -= 1
+            self.message_timer -= dt
             
+        profiler.lap('update.other')
+
         # Update particles (active in all states for continuous effects)
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.size <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
+        profiler.lap('update.particles')
 
         # Firework logic for win screen
         if self.game_state == self.GAME_STATE_WIN:
-            self.firework_timer -= 1
+            self.firework_timer -= dt
             if self.firework_timer <= 0:
-                self.fireworks.append(Firework(self.screen_width, self.screen_height))
-                self.firework_timer = random.randint(20, 50) # Spawn new firework every 0.3-0.8 seconds
+                self.fireworks.append(Firework(self.screen_width, self.screen_height, self.particles, self.rng_fireworks))
+                self.firework_timer = self.rng_fireworks.randint(20, 50) # Spawn new firework every 0.3-0.8 seconds
             
             for firework in self.fireworks[:]:
-                firework.update()
+                firework.update(dt)
                 if firework.is_dead():
                     self.fireworks.remove(firework)
+            profiler.lap('update.fireworks')
+
+    def _draw_elements(self, alpha=1.0):
+        """
+        Draws all game elements to the screen based on the current game state.
+        alpha is how far the frame lies between the previous and the current tick.
+        """
+        if self.renderer is not None:
+            self._draw_elements_dirty(alpha)
+            return
 
-    def _draw_elements(self):
-        """Draws all game elements to the screen based on the current game state."""
-        self.screen.fill(self.BG_COLOR) # Fill background
+        self._draw_static_layer()
+        self._draw_moving_elements(alpha)
+        pygame.display.flip() # Update the full display Surface to the screen
+        self.surfaces.end_frame()
+        self.profiler.lap('draw.flip')
+
+    def _draw_elements_dirty(self, alpha):
+        """Dirty-rectangle variant of _draw_elements: only changed areas reach the display."""
+        key = self._static_layer_key()
+        if self.renderer.needs_background(key):
+            self._draw_static_layer()
+            self.renderer.capture_background(key)
+        else:
+            self.renderer.restore() # Erase last frame's sprites
+            self.profiler.lap('draw.background')
+        rects = self._draw_moving_elements(alpha)
+        self.renderer.present(rects)
+        self.surfaces.end_frame()
+        self.profiler.lap('draw.flip')
+
+    def _static_layer_key(self):
+        """Summarizes everything the static layer shows; the cached layer is redrawn when it changes."""
+        message = self.display_message if self.message_timer > 0 else None
+        key = (self.game_state, self.sound_enabled, message)
+        if self.game_state in [self.GAME_STATE_PLAYING, self.GAME_STATE_LEVEL_COMPLETE]:
+            key += (id(self.bricks), self.bricks.version) + self.hud.key(self)
+        elif self.game_state in [self.GAME_STATE_GAME_OVER, self.GAME_STATE_WIN]:
+            key += (self.score,)
+        return key
+
+    def _draw_static_layer(self):
+        """Draws the parts of the frame that only change on game events (screens, bricks, HUD, button)."""
+        cached = self.game_state in [self.GAME_STATE_LEVEL_COMPLETE, self.GAME_STATE_GAME_OVER, self.GAME_STATE_WIN]
+        if not cached:
+            self.screen.fill(self.BG_COLOR) # Fill background (cached screens cover all of it)
+        self.profiler.lap('draw.background')
 
         # Draw elements based on game state
         if self.game_state == self.GAME_STATE_TITLE:
             self._draw_title_screen()
         elif self.game_state == self.GAME_STATE_PLAYING:
-            self._draw_playing_screen()
-        elif self.game_state == self.GAME_STATE_LEVEL_COMPLETE:
-            self._draw_level_complete_screen()
-        elif self.game_state in [self.GAME_STATE_GAME_OVER, self.GAME_STATE_WIN]:
-            self._draw_end_screen()
-        
-        # Draw elements that are always visible (like particles, messages)
-        for particle in self.particles:
-            particle.draw(self.screen)
+            self._draw_playing_static()
+        elif cached:
+            self._draw_cached_screen()
+        self.profiler.lap('draw.screens')
 
         # Draw mute button (always visible)
         self._draw_mute_button()
 
         if self.message_timer > 0:
-            message_surface = self.message_font.render(self.display_message, True, (255, 255, 255))
+            message_surface = self.text_cache.render(self.message_font, self.display_message, (255, 255, 255))
             message_rect = message_surface.get_rect(center=(self.screen_width / 2, self.screen_height - 60))
-            self.screen.blit(message_surface, message_rect)
+            self.render_queue.push(RenderQueue.UI, message_surface, message_rect.topleft)
+        self.profiler.lap('draw.hud')
+        self.render_queue.flush()
+        self.profiler.lap('draw.flush')
 
-        pygame.display.flip() # Update the full display Surface to the screen
+    def _draw_cached_screen(self):
+        """
+        Queues the level-complete or end screen from a composed copy. The copy is built
+        on the first frame of the state and reused until the state, level or score
+        changes or the window is resized, so the overlay and its texts are not
+        allocated and drawn again every frame.
+        """
+        key = (self.game_state, self.level, self.score, self.screen.get_size())
+        if key != self._screen_cache_key:
+            self.screen.fill(self.BG_COLOR)
+            if self.game_state == self.GAME_STATE_LEVEL_COMPLETE:
+                self._draw_level_complete_screen() # Nothing moves underneath the overlay
+            else:
+                self._draw_end_screen()
+            self.render_queue.flush()
+            if self._screen_cache is None or self._screen_cache.get_size() != self.screen.get_size():
+                self._screen_cache = self.surfaces.prepare(pygame.Surface(self.screen.get_size()), rle=False)
+            self._screen_cache.blit(self.screen, (0, 0))
+            self._screen_cache_key = key
+        else:
+            self.render_queue.push(RenderQueue.WORLD, self._screen_cache, (0, 0))
+
+    def _invalidate_screen_caches(self):
+        """Drops every cached layer sized for the window, so the next frame rebuilds them (e.g. after a resize)."""
+        self._screen_cache_key = None
+        self._overlay_tint = None
+        self.hud.invalidate()
+        if self.renderer is not None:
+            self.renderer.invalidate()
+        self._redraw = True
+
+    def _draw_moving_elements(self, alpha):
+        """Draws everything that moves every tick and returns the areas drawn."""
+        queue = self.render_queue
+        rects = []
+        if self.game_state == self.GAME_STATE_PLAYING:
+            rects.extend(self._draw_playing_sprites(alpha))
+        elif self.game_state == self.GAME_STATE_WIN:
+            rocket = self.atlas.get(Firework.tile_name)
+            for firework in self.fireworks:
+                if not firework.exploded:
+                    position = (int(firework.x) - firework.radius, int(firework.y) - firework.radius)
+                    queue.push(RenderQueue.SPRITES, rocket, position)
+                    rects.append(pygame.Rect(position, rocket.get_size()))
+        self.profiler.lap('draw.sprites')
+
+        # Particles are always visible for continuous effects
+        rects.append(self.particles.draw(queue.layer(RenderQueue.PARTICLES)))
+        self.profiler.lap('draw.particles')
+
+        if self.profiler.overlay_visible:
+            pools = (self.ball_pool, self.power_up_pool, self.laser_pool)
+            rects.append(self.profiler.draw_overlay(queue.layer(RenderQueue.DEBUG), self.profiler_font,
+                                                    [pool.summary() for pool in pools] +
+                                                    [self.hud.summary(), self.surfaces.summary(),
+                                                     self.sounds.summary()]))
+            self.profiler.lap('draw.profiler')
+        queue.flush()
+        self.profiler.lap('draw.flush')
+        return rects
 
     def _draw_title_screen(self):
         """Draws the title screen elements."""
-        title_surface = self.title_font.render("ARKANOID", True, (255, 255, 255))
+        screen = self.render_queue.layer(RenderQueue.WORLD)
+        title_surface = self.text_cache.render(self.title_font, "ARKANOID", (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 100))
-        self.screen.blit(title_surface, title_rect)
+        screen.blit(title_surface, title_rect)
         
-        subtitle_surface = self.game_font.render("Python Arkanoid Game", True, (200, 200, 200))
+        subtitle_surface = self.text_cache.render(self.game_font, "Python Arkanoid Game", (200, 200, 200))
         subtitle_rect = subtitle_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 50))
-        self.screen.blit(subtitle_surface, subtitle_rect)
+        screen.blit(subtitle_surface, subtitle_rect)
         
-        start_surface = self.game_font.render("Press SPACE to Start", True, (255, 255, 255))
+        start_surface = self.text_cache.render(self.game_font, "Press SPACE to Start", (255, 255, 255))
         start_rect = start_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 + 20))
-        self.screen.blit(start_surface, start_rect)
+        screen.blit(start_surface, start_rect)
         
         controls_text = [
             "Controls:",
@@ -399,100 +783,73 @@ class Game:
         
         for i, line in enumerate(controls_text):
             color = (255, 255, 255) if i == 0 else (200, 200, 200)
-            font = self.message_font if i == 0 else pygame.font.Font(None, 24)
-            text_surface = font.render(line, True, color)
+            font = self.message_font if i == 0 else self.controls_font
+            text_surface = self.text_cache.render(font, line, color)
             text_rect = text_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 + 80 + i * 25))
-            self.screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, text_rect)
 
-    def _draw_playing_screen(self):
+    def _draw_playing_screen(self, alpha=1.0):
         """Draws elements specific to the 'playing' state."""
-        self.paddle.draw(self.screen)
-        
-        # Draw all balls
-        for ball in self.balls:
-            ball.draw(self.screen)
-            
-        for brick in self.bricks:
-            brick.draw(self.screen)
-        for power_up in self.power_ups:
-            power_up.draw(self.screen)
-        for laser in self.lasers:
-            laser.draw(self.screen)
-        
-        # Improved UI Layout - Professional game UI
-        ui_margin = 15
-        ui_top = 15
-        ui_font_size = 32
-        ui_font = pygame.font.Font(None, ui_font_size)
-        
-        # Score (top-left)
-        score_text = ui_font.render(f"SCORE: {self.score:,}", True, (255, 255, 255))
-        self.screen.blit(score_text, (ui_margin, ui_top))
-        
-        # Level (top-center)
-        level_text = ui_font.render(f"LEVEL: {self.level}", True, (255, 255, 255))
-        level_rect = level_text.get_rect(centerx=self.screen_width // 2, y=ui_top)
-        self.screen.blit(level_text, level_rect)
-        
-        # Lives (top-right) - Fixed positioning above bricks
-        lives_text = ui_font.render(f"LIVES: {self.lives}", True, (255, 255, 255))
-        lives_rect = lives_text.get_rect(topright=(self.screen_width - ui_margin, ui_top))
-        self.screen.blit(lives_text, lives_rect)
-        
-        # Multi-ball indicator
-        if len(self.balls) > 1:
-            multi_ball_text = self.message_font.render(f"BALLS: {len(self.balls)}", True, (255, 255, 0))
-            multi_ball_rect = multi_ball_text.get_rect(topright=(self.screen_width - ui_margin, ui_top + 40))
-            self.screen.blit(multi_ball_text, multi_ball_rect)
+        self._draw_playing_static()
+        self._draw_playing_sprites(alpha)
+
+    def _draw_playing_sprites(self, alpha=1.0):
+        """Queues the paddle, balls, power-ups and lasers from the sprite atlas; returns the areas they cover."""
+        atlas = self.atlas
+        queue = self.render_queue
+        rects = []
+        sprites = [self.paddle] if self.mega_balls else [self.paddle] + self.balls
+        for sprite in sprites + self.power_ups + self.lasers:
+            tile = atlas.get(sprite.tile_name)
+            if tile is None:
+                rects.append(sprite.draw(self.screen, alpha)) # No tile for this size (e.g. resized in a test)
+            else:
+                rect = sprite.interpolated_rect(alpha)
+                queue.push(RenderQueue.SPRITES, tile, rect.topleft)
+                rects.append(rect)
+        if self.mega_balls:
+            rects.extend(self.balls.draw(queue.layer(RenderQueue.SPRITES), alpha, atlas.get('ball')))
+        return rects
+
+    def _draw_playing_static(self):
+        """Draws the brick wall and the HUD of the 'playing' state."""
+        self.bricks.draw(self.render_queue.layer(RenderQueue.WORLD)) # Single blit of the pre-rendered wall
+        self.profiler.lap('draw.bricks')
         
-        # Power-up indicators (right side, below lives)
-        indicator_y = ui_top + 70
-        if self.paddle.has_laser:
-            laser_indicator = self.message_font.render("⚡ LASER", True, (255, 60, 60))
-            laser_rect = laser_indicator.get_rect(topright=(self.screen_width - ui_margin, indicator_y))
-            self.screen.blit(laser_indicator, laser_rect)
-            indicator_y += 25
-        if self.paddle.has_glue:
-            glue_indicator = self.message_font.render("🔗 CATCH", True, (60, 255, 60))
-            glue_rect = glue_indicator.get_rect(topright=(self.screen_width - ui_margin, indicator_y))
-            self.screen.blit(glue_indicator, glue_rect)
-            indicator_y += 25
-        if self.paddle.power_up_timers['grow'] > 0:
-            grow_indicator = self.message_font.render("📏 GROW", True, (60, 60, 255))
-            grow_rect = grow_indicator.get_rect(topright=(self.screen_width - ui_margin, indicator_y))
-            self.screen.blit(grow_indicator, grow_rect)
+        # Score bar and power-up indicators, recomposited only when their values change
+        self.hud.draw(self.render_queue.layer(RenderQueue.HUD), self)
+        self.profiler.lap('draw.hud')
 
     def _draw_level_complete_screen(self):
         """Draws the level complete screen."""
         self._draw_playing_screen()  # Draw game elements in background
         
         # Semi-transparent overlay with better styling
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(160)
-        overlay.fill((0, 0, 50))  # Dark blue tint
-        self.screen.blit(overlay, (0, 0))
+        screen = self.render_queue.layer(RenderQueue.SCREEN_OVERLAY)
+        if self._overlay_tint is None:
+            tint = pygame.Surface((self.screen_width, self.screen_height))
+            tint.fill((0, 0, 50))  # Dark blue tint
+            self._overlay_tint = self.surfaces.prepare(tint, alpha=160)
+        screen.blit(self._overlay_tint, (0, 0))
         
         # Stylized level complete text
-        level_complete_text = self.game_font.render(f"LEVEL {self.level - 1} COMPLETE!", True, (255, 215, 0))  # Gold
+        level_complete_text = self.text_cache.render(self.game_font, f"LEVEL {self.level - 1} COMPLETE!", (255, 215, 0))  # Gold
         level_complete_rect = level_complete_text.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 40))
-        self.screen.blit(level_complete_text, level_complete_rect)
+        screen.blit(level_complete_text, level_complete_rect)
         
         # Score bonus display
         bonus_score = 100 * (self.level - 1)
-        bonus_text = self.message_font.render(f"Level Bonus: +{bonus_score} points", True, (100, 255, 100))
+        bonus_text = self.text_cache.render(self.message_font, f"Level Bonus: +{bonus_score} points", (100, 255, 100))
         bonus_rect = bonus_text.get_rect(center=(self.screen_width / 2, self.screen_height / 2))
-        self.screen.blit(bonus_text, bonus_rect)
+        screen.blit(bonus_text, bonus_rect)
         
-        next_level_text = self.message_font.render(f"Preparing Level {self.level}...", True, (200, 200, 200))
+        next_level_text = self.text_cache.render(self.message_font, f"Preparing Level {self.level}...", (200, 200, 200))
         next_level_rect = next_level_text.get_rect(center=(self.screen_width / 2, self.screen_height / 2 + 40))
-        self.screen.blit(next_level_text, next_level_rect)
+        screen.blit(next_level_text, next_level_rect)
 
     def _draw_end_screen(self):
-        """Draws elements for 'game over' or 'you win' screens."""
-        if self.game_state == self.GAME_STATE_WIN:
-            for firework in self.fireworks:
-                firework.draw(self.screen)
-
+        """Draws elements for 'game over' or 'you win' screens (fireworks are drawn as moving elements)."""
+        screen = self.render_queue.layer(RenderQueue.WORLD)
         if self.game_state == self.GAME_STATE_GAME_OVER:
             message = "GAME OVER"
             color = (255, 100, 100)  # Red
@@ -500,61 +857,214 @@ class Game:
             message = "CONGRATULATIONS!"
             color = (100, 255, 100)  # Green
             
-        text_surface = self.game_font.render(message, True, color)
+        text_surface = self.text_cache.render(self.game_font, message, color)
         text_rect = text_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 50))
-        self.screen.blit(text_surface, text_rect)
+        screen.blit(text_surface, text_rect)
         
         if self.game_state == self.GAME_STATE_WIN:
-            win_text = self.message_font.render("You completed all levels!", True, (255, 255, 255))
+            win_text = self.text_cache.render(self.message_font, "You completed all levels!", (255, 255, 255))
             win_rect = win_text.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 10))
-            self.screen.blit(win_text, win_rect)
+            screen.blit(win_text, win_rect)
         
-        score_text = self.message_font.render(f"Final Score: {self.score}", True, (255, 255, 255))
+        score_text = self.text_cache.render(self.message_font, f"Final Score: {self.score}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(self.screen_width / 2, self.screen_height / 2 + 20))
-        self.screen.blit(score_text, score_rect)
+        screen.blit(score_text, score_rect)
         
-        restart_surface = self.message_font.render("Press SPACE to return to Title", True, (200, 200, 200))
+        restart_surface = self.text_cache.render(self.message_font, "Press SPACE to return to Title", (200, 200, 200))
         restart_rect = restart_surface.get_rect(center=(self.screen_width / 2, self.screen_height / 2 + 60))
-        self.screen.blit(restart_surface, restart_rect)
+        screen.blit(restart_surface, restart_rect)
 
     def _draw_mute_button(self):
-        """Draws the mute button with improved styling."""
-        # Enhanced mute button styling
-        button_color = (70, 130, 180) if self.sound_enabled else (220, 20, 60)  # Steel blue or crimson
-        border_color = (255, 255, 255)
-        
-        # Draw button with rounded corners effect
-        pygame.draw.rect(self.screen, button_color, self.mute_button_rect)
-        pygame.draw.rect(self.screen, border_color, self.mute_button_rect, 2)
-        
-        # Add subtle shadow effect
-        shadow_rect = pygame.Rect(self.mute_button_rect.x + 2, self.mute_button_rect.y + 2, 
-                                  self.mute_button_rect.width, self.mute_button_rect.height)
-        pygame.draw.rect(self.screen, (0, 0, 0, 100), shadow_rect)
-        pygame.draw.rect(self.screen, button_color, self.mute_button_rect)
-        pygame.draw.rect(self.screen, border_color, self.mute_button_rect, 2)
+        """Queues the mute button (rendered once per state) and its label."""
+        button = self._mute_button_surfaces.get(self.sound_enabled)
+        if button is None:
+            button = self._mute_button_surfaces[self.sound_enabled] = self._render_mute_button(self.sound_enabled)
+        self.render_queue.push(RenderQueue.UI, button, self.mute_button_rect.topleft)
         
         # Better button text
         button_text = "🔊 ON" if self.sound_enabled else "🔇 OFF"
-        font_size = 18
-        button_font = pygame.font.Font(None, font_size)
-        text_surface = button_font.render(button_text, True, (255, 255, 255))
+        text_surface = self.text_cache.render(self.button_font, button_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.mute_button_rect.center)
-        self.screen.blit(text_surface, text_rect)
+        self.render_queue.push(RenderQueue.UI, text_surface, text_rect.topleft)
+
+    def _render_mute_button(self, sound_enabled):
+        """Renders the mute button and its shadow onto a colorkeyed surface."""
+        # Enhanced mute button styling
+        button_color = (70, 130, 180) if sound_enabled else (220, 20, 60)  # Steel blue or crimson
+        border_color = (255, 255, 255)
+        key_color = (255, 0, 255) # Transparent: the corners the shadow leaves uncovered
+        rect = pygame.Rect(0, 0, self.mute_button_rect.width, self.mute_button_rect.height)
+        surface = pygame.Surface((rect.width + 2, rect.height + 2))
+        surface.fill(key_color)
+
+        # Subtle shadow effect under the button
+        pygame.draw.rect(surface, (0, 0, 0), rect.move(2, 2))
+        pygame.draw.rect(surface, button_color, rect)
+        pygame.draw.rect(surface, border_color, rect, 2)
+        return self.surfaces.prepare(surface, colorkey=key_color)
+
+    def step(self, inputs=(), presses=None):
+        """
+        Advances the game by exactly one tick using scripted input.
+        inputs is the collection of key constants held during this tick. presses are
+        the keys pressed (KEYDOWN) at the start of the tick; if None, keys that were
+        not held on the previous tick are treated as fresh presses.
+        """
+        keys = KeyState(inputs)
+        if presses is None:
+            presses = sorted(keys - self._held_keys)
+        self.profiler.begin_frame()
+        with self.profiler.section('update'):
+            self._tick(keys, presses)
+        if self.render:
+            with self.profiler.section('draw'):
+                self._draw_elements()
+        self.profiler.end_frame()
+
+    def _tick(self, keys, presses):
+        """Runs one simulation tick: key presses first, then the game logic."""
+        if self.recorder is not None:
+            self.recorder.record(keys, presses)
+        self.sounds.begin_tick(self.tick_count * self.sim_dt)
+        for key in presses:
+            self._handle_key_down(key)
+        self._held_keys = keys
+        self._update_game_logic(keys)
+        self.tick_count += 1
+
+    def _is_idle(self):
+        """True while nothing on screen moves: a static screen with no particles, input or overlay pending."""
+        return (self.game_state in [self.GAME_STATE_TITLE, self.GAME_STATE_GAME_OVER, self.GAME_STATE_LEVEL_COMPLETE]
+                and not self.particles and not self._pending_presses and not self.profiler.overlay_visible)
+
+    def _frame_rate(self):
+        """Frame cap for the next frame: lowered while the screen is idle or the window is in the background."""
+        rate = self.fps_cap
+        if self.headless:
+            return rate
+        for reduced, applies in [(self.idle_fps, self._is_idle()), (self.background_fps, not self.has_focus)]:
+            if applies:
+                rate = min(rate, reduced) if rate else reduced # 0 is uncapped
+        return rate
+
+    def _frame_due(self):
+        """
+        False if the frame would draw exactly what the screen already shows. Only idle
+        frames are compared (by static layer key); everything else always draws.
+        """
+        if self._is_idle():
+            key = self._static_layer_key()
+            if key == self._drawn_key and not self._redraw:
+                return False
+            self._drawn_key = key
+        else:
+            self._drawn_key = None
+        self._redraw = False
+        return True
+
+    def _wait_for_next_frame(self):
+        """
+        Caps the frame rate. At the full rate Clock.tick sleeps; at a reduced rate the loop
+        waits in the event queue instead, so a key press, click or focus change wakes it at once.
+        """
+        rate = self._frame_rate()
+        if rate == self.fps_cap:
+            self.clock.tick(rate)
+        else:
+            timeout = self._last_wake + 1000 // rate - pygame.time.get_ticks()
+            if timeout > 0:
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    self._wake_events.append(event)
+            self.clock.tick() # Keeps the clock's frame times current
+        self._last_wake = pygame.time.get_ticks()
 
     def run(self):
-        """The main game loop."""
-        while self.running:
-            self._handle_input() # Process user input
-            self._update_game_logic() # Update game state
-            self._draw_elements() # Render graphics
-            self.clock.tick(60) # Control frame rate to 60 FPS
+        """
+        The main game loop.
+        The simulation advances in fixed sim_dt ticks fed by an accumulator of real
+        time, so a slow frame is caught up with extra ticks instead of slowing the
+        game, and rendering runs at its own rate with interpolated positions.
+        Static screens render at idle_fps and skip frames that would not change, and
+        an unfocused window renders at background_fps; ticks keep their pace either way.
+        Headless runs skip the accumulator and advance one tick per loop, uncapped.
+        A recording is saved when the loop ends, whether by quitting or by an exception.
+        """
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        try:
+            while self.running:
+                self.profiler.begin_frame()
+                with self.profiler.section('input'):
+                    self._handle_input() # Process user input
+                    pressed = pygame.key.get_pressed()
+                    keys = KeyState(key for key in HELD_KEYS if pressed[key])
 
+                if self.headless:
+                    ticks_due = 1
+                else:
+                    current_time = time.perf_counter()
+                    accumulator += min(current_time - previous_time, self.max_frame_time)
+                    previous_time = current_time
+                    ticks_due = int(accumulator / self.sim_dt)
+                    accumulator -= ticks_due * self.sim_dt
+
+                with self.profiler.section('update'):
+                    for _ in range(ticks_due):
+                        self._tick(keys, self._take_pending_presses()) # Update game state
+
+                if self.render and self._frame_due():
+                    with self.profiler.section('draw'):
+                        # Leftover time is the fraction of the next tick already elapsed
+                        self._draw_elements(accumulator / self.sim_dt) # Render graphics
+                    self.frames_drawn += 1
+                elif self.render:
+                    self.frames_skipped += 1
+                with self.profiler.section('idle'):
+                    self._wait_for_next_frame() # Render rate cap, uncapped when headless
+                self.profiler.end_frame()
+        finally:
+            if self.recorder is not None:
+                self.recorder.save(self) # Also after a crash, so the session can be replayed up to it
+        self.profiler.close() # Writes the CSV when profiling to a file
         pygame.quit() # Uninitialize Pygame modules
         sys.exit() # Exit the program
 
+def _seed_arg(text):
+    """argparse type of --seed: recordings store the seed as an unsigned 64-bit integer."""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: {text!r}")
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {2 ** 64 - 1}")
+    return seed
+
 # Main execution block
 if __name__ == "__main__":
-    game = Game() # Create an instance of the Game class
+    parser = argparse.ArgumentParser(description="PyGame Arkanoid")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="only redraw changed screen areas (for slow software-rendered displays)")
+    parser.add_argument('--seed', type=_seed_arg, help="seed for all random streams (random if omitted)")
+    parser.add_argument('--record', metavar='PATH',
+                        help="record every tick's input to PATH for replay.py")
+    parser.add_argument('--mega-balls', type=int, default=0, metavar='N',
+                        help="stress mode: launching or a multi-ball power-up releases N balls at once")
+    parser.add_argument('--ball-collisions', action='store_true',
+                        help="balls bounce off each other")
+    parser.add_argument('--profile', metavar='CSV',
+                        help="time every frame phase and write the timings to CSV on exit (F3 shows the overlay)")
+    args = parser.parse_args()
+    if args.mega_balls < 0:
+        parser.error("--mega-balls must not be negative")
+
+    game = Game(dirty_rects=args.dirty_rects, seed=args.seed, mega_balls=args.mega_balls,
+                ball_collisions=args.ball_collisions) # Create an instance of the Game class
+    if args.record:
+        from replay import InputRecorder
+        game.recorder = InputRecorder(args.record, game.seed, game.sim_rate, game.mega_balls,
+                                      game.ball_collider is not None)
+    if args.profile:
+        game.profiler = FrameProfiler(enabled=True, csv_path=args.profile)
     game.run() # Start the game loop
 
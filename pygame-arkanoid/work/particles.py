@@ -0,0 +1,127 @@
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays particle engine for explosions, sparks and fireworks.
+    Every particle lives in a slot of preallocated NumPy arrays; the live
+    particles always occupy slots [0, count), so updates are a handful of
+    vectorized array operations and dead particles are removed by swapping
+    survivors from the tail into their slots.
+    """
+    SHRINK_RATE = 0.1 # Size lost per reference tick, particles die at size 0
+
+    def __init__(self, capacity=4096, rng=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._sprites = {} # (r, g, b, radius) -> pre-rendered circle Surface
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Removes all particles (the arrays are kept for reuse)."""
+        self.count = 0
+
+    def spawn(self, x, y, color, count, min_size, max_size, min_speed, max_speed, gravity):
+        """
+        Emits count particles from (x, y) in random directions.
+        Sizes are whole numbers in [min_size, max_size], speeds uniform in
+        [min_speed, max_speed) and gravity is added to vy every reference tick.
+        """
+        start = self.count
+        end = start + count
+        if end > self.capacity:
+            self._grow(end)
+
+        angle = self.rng.uniform(0.0, 2.0 * np.pi, count)
+        speed = self.rng.uniform(min_speed, max_speed, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = speed * np.cos(angle)
+        self.vy[start:end] = speed * np.sin(angle)
+        self.size[start:end] = self.rng.integers(min_size, max_size, count, endpoint=True)
+        self.gravity[start:end] = gravity
+        self.color[start:end] = color
+        self.count = end
+
+    def _grow(self, needed):
+        """Reallocates every array with at least needed slots (doubling)."""
+        capacity = max(self.capacity, 1) # An empty system has nothing to double
+        while capacity < needed:
+            capacity *= 2
+        for name in ('x', 'y', 'vx', 'vy', 'size', 'gravity', 'color'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def update(self, dt=1.0):
+        """Moves, accelerates and shrinks every live particle, then compacts out the dead."""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vy[:n] += self.gravity[:n] * dt
+        self.size[:n] -= self.SHRINK_RATE * dt
+
+        alive = self.size[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors == n:
+            return
+        # Swap-compaction: live particles beyond the new end fill the dead slots before it
+        holes = np.flatnonzero(~alive[:survivors])
+        movers = survivors + np.flatnonzero(alive[survivors:])
+        for name in ('x', 'y', 'vx', 'vy', 'size', 'gravity', 'color'):
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        self.count = survivors
+
+    def draw(self, screen):
+        """
+        Draws every visible particle with one Surface.blits call.
+        Returns the bounding rect of everything drawn, or None if nothing was.
+        """
+        n = self.count
+        if n == 0:
+            return None
+        radius = self.size[:n].astype(np.int64)
+        visible = np.flatnonzero(radius > 0) # A circle of radius 0 draws nothing
+        if visible.size == 0:
+            return None
+        radius = radius[visible]
+        color = self.color[visible].astype(np.int64)
+        keys = (color[:, 0] << 24) | (color[:, 1] << 16) | (color[:, 2] << 8) | radius
+        for key in np.unique(keys).tolist():
+            if key not in self._sprites:
+                self._sprites[key] = self._render_sprite(key)
+
+        sprites = self._sprites
+        left = self.x[visible].astype(np.int64) - radius
+        top = self.y[visible].astype(np.int64) - radius
+        screen.blits([(sprites[key], (px, py)) for key, px, py in zip(keys.tolist(), left.tolist(), top.tolist())],
+                     doreturn=False)
+        bounds = pygame.Rect(int(left.min()), int(top.min()), 0, 0)
+        bounds.width = int((left + 2 * radius).max()) - bounds.x
+        bounds.height = int((top + 2 * radius).max()) - bounds.y
+        return bounds.clip(screen.get_rect())
+
+    @staticmethod
+    def _render_sprite(key):
+        """Pre-renders the circle for a packed (r, g, b, radius) key."""
+        radius = key & 0xFF
+        color = ((key >> 24) & 0xFF, (key >> 16) & 0xFF, (key >> 8) & 0xFF)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return sprite
@@ -0,0 +1,69 @@
+class ObjectPool:
+    """
+    Free list of reusable game objects of one kind.
+    acquire(*args) hands out a released object re-initialised with its reset(*args),
+    or builds a new one with factory(*args) when the free list is empty; release()
+    puts an object back once the game has dropped it. The pool grows to the largest
+    number of objects alive at once and from then on a session allocates none.
+    """
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+        self._free = []
+        self._free_ids = set() # id() of every object in _free, to catch double releases
+
+        # Statistics
+        self.created = 0 # Objects built by the factory
+        self.reused = 0 # Acquisitions served from the free list
+        self.in_use = 0 # Acquired and not yet released
+        self.peak_in_use = 0
+
+    def acquire(self, *args):
+        """Returns an object initialised with args, recycled if possible."""
+        if self._free:
+            obj = self._free.pop()
+            self._free_ids.discard(id(obj))
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.factory(*args)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+
+    def release(self, obj):
+        """
+        Returns an object the game no longer uses to the free list.
+        Releasing it again before it is re-acquired raises ValueError: two later
+        acquire() calls would hand out the same object.
+        """
+        if id(obj) in self._free_ids:
+            raise ValueError(f"{self.name} pool: object released twice")
+        if self.in_use <= 0:
+            raise ValueError(f"{self.name} pool: more objects released than acquired")
+        self.in_use -= 1
+        self._free.append(obj)
+        self._free_ids.add(id(obj))
+
+    def release_all(self, objects):
+        """Releases every object of a list and empties it."""
+        for obj in objects:
+            self.release(obj)
+        objects.clear()
+
+    @property
+    def free(self):
+        """Objects waiting in the free list."""
+        return len(self._free)
+
+    def occupancy(self):
+        """Fraction of the pooled objects currently in use."""
+        total = self.in_use + len(self._free)
+        return self.in_use / total if total else 0.0
+
+    def summary(self):
+        """One line of statistics, for the profiler overlay."""
+        return (f"{self.name} pool: {self.in_use}/{self.in_use + len(self._free)} in use "
+                f"(peak {self.peak_in_use}), {self.created} built, {self.reused} reused")
@@ -0,0 +1,147 @@
+import csv
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+
+
+class _Section:
+    """Context manager timing one named phase of a frame (reused across frames)."""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.start = self.profiler._last = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        profiler = self.profiler
+        if profiler.enabled:
+            now = perf_counter_ns()
+            profiler._add(self.name, now - self.start)
+            profiler._last = now
+        return False
+
+
+class FrameProfiler:
+    """
+    Per-subsystem frame profiler.
+    Top-level phases are timed with section(name) blocks; inside a phase, lap(name)
+    charges the time since the previous lap (or the start of the phase) to a
+    sub-phase. Timings are taken with perf_counter_ns, kept per frame, summarized
+    as rolling percentiles over the last window frames, optionally drawn as an
+    overlay and written to CSV when the profiler is closed. While disabled every
+    call returns immediately.
+    """
+    OVERLAY_REFRESH = 15 # Frames between overlay redraws, so the overlay itself stays cheap
+
+    def __init__(self, enabled=False, csv_path=None, window=300, max_rows=100_000):
+        self.enabled = enabled
+        self.csv_path = csv_path
+        self.window = window
+        self.overlay_visible = False
+        self.frame_count = 0
+        self._series = {} # name -> deque of the last window timings in ns (first-seen order)
+        self._sections = {} # name -> reusable _Section
+        self._frame = {} # name -> ns accumulated this frame
+        self._rows = deque(maxlen=max_rows) # Per-frame timings for the CSV dump
+        self._frame_start = 0
+        self._last = 0
+        self._overlay = None
+        self._overlay_age = 0
+
+    def toggle_overlay(self):
+        """Shows or hides the overlay; showing it switches profiling on."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+
+    def begin_frame(self):
+        """Starts timing a new frame."""
+        if self.enabled:
+            self._frame = {}
+            self._frame_start = self._last = perf_counter_ns()
+
+    def section(self, name):
+        """Returns a context manager that times the enclosed phase as name."""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def lap(self, name):
+        """Charges the time since the last lap or section start to name."""
+        if self.enabled:
+            now = perf_counter_ns()
+            self._add(name, now - self._last)
+            self._last = now
+
+    def _add(self, name, elapsed):
+        self._frame[name] = self._frame.get(name, 0) + elapsed
+
+    def end_frame(self):
+        """Closes the frame: records its total and pushes every timing into the rolling windows."""
+        if not self.enabled or not self._frame_start:
+            return
+        self._frame['frame'] = perf_counter_ns() - self._frame_start
+        for name, elapsed in self._frame.items():
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = deque(maxlen=self.window)
+            series.append(elapsed)
+        self._rows.append((self.frame_count, self._frame))
+        self.frame_count += 1
+
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Returns the given percentiles of name over the rolling window, in milliseconds."""
+        series = self._series.get(name)
+        if not series:
+            return tuple(0.0 for _ in points)
+        ordered = sorted(series)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, point * len(ordered) // 100)] / 1e6 for point in points)
+
+    def names(self):
+        """Names of every timed phase and sub-phase, in the order they first appeared."""
+        return list(self._series)
+
+    def draw_overlay(self, screen, font, extra_lines=()):
+        """Draws the percentile table (followed by extra_lines) in the top-left corner and returns its rect."""
+        if self._overlay is None or self._overlay_age >= self.OVERLAY_REFRESH:
+            self._overlay = self._render_overlay(font, extra_lines)
+            self._overlay_age = 0
+        self._overlay_age += 1
+        return screen.blit(self._overlay, (10, 60))
+
+    def _render_overlay(self, font, extra_lines=()):
+        lines = [f"{'phase':<22}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name in sorted(self._series, key=lambda name: (name != 'frame', name)):
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<22}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        lines.extend(extra_lines)
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 12
+        overlay = pygame.Surface((width, line_height * len(lines) + 8))
+        overlay.set_alpha(200)
+        for index, line in enumerate(lines):
+            overlay.blit(font.render(line, True, (0, 255, 0)), (6, 4 + index * line_height))
+        return overlay
+
+    def write_csv(self, path):
+        """Writes one row per recorded frame with every phase in milliseconds."""
+        names = self.names()
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame'] + [f"{name}_ms" for name in names])
+            for frame, timings in self._rows:
+                writer.writerow([frame] + [f"{timings.get(name, 0) / 1e6:.4f}" for name in names])
+
+    def close(self):
+        """Dumps the CSV if a path was given (called when the game exits)."""
+        if self.csv_path and self._rows:
+            self.write_csv(self.csv_path)
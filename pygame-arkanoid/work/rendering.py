@@ -0,0 +1,157 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Presents only the parts of the display that changed since the last frame.
+    Everything that does not move (background colour, bricks, HUD, static screen
+    text) is kept in a cached background surface identified by a key. Each frame
+    the areas covered by moving sprites in the previous frame are restored from
+    the background, the sprites are drawn again and only the union of old and new
+    areas is sent to the display with pygame.display.update(rects).
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.background = pygame.Surface(screen.get_size())
+        self.background_key = None # Identifies what the background currently shows
+        self._previous_rects = [] # Areas covered by moving sprites last frame
+        self._full_update = True
+
+        # Statistics
+        self.full_presents = 0
+        self.partial_presents = 0
+
+    def needs_background(self, key):
+        """True if the cached background does not show the static layer for key."""
+        return key != self.background_key
+
+    def capture_background(self, key):
+        """
+        Stores the static layer that was just drawn to the screen as the background.
+        The next present() updates the whole display.
+        """
+        self.background.blit(self.screen, (0, 0))
+        self.background_key = key
+        self._previous_rects = []
+        self._full_update = True
+
+    def invalidate(self):
+        """Forces the static layer to be redrawn on the next frame (e.g. after a resize)."""
+        self.background_key = None
+
+    def restore(self):
+        """Erases last frame's moving sprites by copying the background over them."""
+        for rect in self._previous_rects:
+            self.screen.blit(self.background, rect, rect)
+
+    def present(self, rects):
+        """Sends this frame's changes to the display; rects are the areas sprites were drawn to."""
+        rects = [rect for rect in rects if rect]
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+            self.full_presents += 1
+        else:
+            pygame.display.update(self._previous_rects + rects)
+            self.partial_presents += 1
+        self._previous_rects = rects
+
+
+class _LayerTarget:
+    """
+    Stand-in for the screen that queues blits on one layer of a RenderQueue, so
+    drawing code written against a Surface (blit/blits) can feed the queue.
+    Returned rects are the unclipped destination areas.
+    """
+    def __init__(self, queue, layer):
+        self._queue = queue
+        self._layer = layer
+
+    def blit(self, source, dest, area=None):
+        self._queue.push(self._layer, source, dest, area)
+        size = pygame.Rect(area).size if area is not None else source.get_size()
+        return pygame.Rect((dest[0], dest[1]), size)
+
+    def blits(self, sequence, doreturn=True):
+        commands = self._queue.extend(self._layer, sequence)
+        if doreturn:
+            return [pygame.Rect(dest, source.get_size()) for source, dest in commands]
+        return None
+
+    def get_rect(self):
+        return self._queue.target.get_rect()
+
+
+class RenderQueue:
+    """
+    Draw command buffer for one frame.
+    Drawing code pushes (surface, position) pairs, tagged with a layer, instead of
+    blitting them one by one. flush() draws the layers in ascending order with a
+    single Surface.blits call each (fblits where pygame provides it and no command
+    blits only part of its source), so the per-call interpreter and wrapper
+    overhead is paid per layer, not per sprite. Commands within a layer keep
+    the order they were pushed in.
+    """
+    # Layers, back to front
+    WORLD = 0 # Bricks and screen text
+    HUD = 10
+    SPRITES = 20 # Paddle, balls, power-ups, lasers, fireworks
+    PARTICLES = 30
+    SCREEN_OVERLAY = 40 # Tint and text over a paused playfield
+    UI = 50 # Mute button, power-up messages
+    DEBUG = 60 # Profiler overlay
+
+    def __init__(self, target):
+        self.target = target
+        self._layers = {} # layer -> [(surface, position) or (surface, position, area)]
+        self._partial = set() # Layers holding commands with an area
+        self.surfaces = None # SurfaceFactory counting unconverted blits in its debug mode, if any
+
+        # Statistics
+        self.commands = 0 # Commands flushed
+        self.calls = 0 # blits/fblits calls made
+
+    def push(self, layer, surface, position, area=None):
+        """Queues one blit of surface at position (optionally only its area)."""
+        commands = self._layers.get(layer)
+        if commands is None:
+            commands = self._layers[layer] = []
+        if area is None:
+            commands.append((surface, position))
+        else:
+            commands.append((surface, position, area))
+            self._partial.add(layer)
+
+    def extend(self, layer, commands):
+        """Queues a sequence of (surface, position) pairs; returns them as a list."""
+        commands = list(commands)
+        queued = self._layers.get(layer)
+        if queued is None:
+            self._layers[layer] = commands[:]
+        else:
+            queued.extend(commands)
+        return commands
+
+    def layer(self, layer):
+        """A Surface-like target whose blit/blits calls are queued on layer."""
+        return _LayerTarget(self, layer)
+
+    def flush(self):
+        """Draws every queued command onto the target, layer by layer, and empties the queue."""
+        target = self.target
+        fblits = getattr(target, 'fblits', None)
+        audit = self.surfaces is not None and self.surfaces.debug
+        for layer in sorted(self._layers):
+            commands = self._layers[layer]
+            if not commands:
+                continue
+            if audit:
+                self.surfaces.count_unconverted(commands)
+            if fblits is not None and layer not in self._partial:
+                fblits(commands)
+            else:
+                target.blits(commands, doreturn=False)
+            self.commands += len(commands)
+            self.calls += 1
+        self._layers.clear()
+        self._partial.clear()
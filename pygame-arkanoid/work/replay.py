@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Deterministic input recording and replay.
+
+A session is fully determined by its seed, its simulation rate, its game
+options (the mega-ball count and ball collisions) and the keys fed into each tick, so that is all
+a recording stores: a small header, the
+hash of the final game state, and one byte of key state per tick (zlib
+compressed). Replaying re-runs the session headlessly at maximum speed and
+checks that it ends in exactly the same state.
+
+    python main.py --record session.arkr
+    python replay.py session.arkr
+"""
+
+import argparse
+import hashlib
+import struct
+import sys
+import zlib
+
+import pygame
+
+from main import Game, KeyState, HELD_KEYS, PRESS_KEYS
+
+MAGIC = b'ARKR'
+FORMAT_VERSION = 3
+# magic, format version, simulation rate, seed, mega balls, ball collisions, tick count,
+# final state hash (SHA-256)
+HEADER = struct.Struct('<4sBHQI?I32s')
+
+
+def encode_tick(keys, presses):
+    """Packs one tick's input into a byte: bits 0-2 held keys, bits 3-5 presses."""
+    bits = 0
+    for bit, key in enumerate(HELD_KEYS):
+        if keys[key]:
+            bits |= 1 << bit
+    for bit, key in enumerate(PRESS_KEYS, start=len(HELD_KEYS)):
+        if key in presses:
+            bits |= 1 << bit
+    return bits
+
+
+def decode_tick(bits):
+    """Unpacks a byte from encode_tick into (KeyState of held keys, list of presses)."""
+    keys = KeyState(key for bit, key in enumerate(HELD_KEYS) if bits & (1 << bit))
+    presses = [key for bit, key in enumerate(PRESS_KEYS, start=len(HELD_KEYS)) if bits & (1 << bit)]
+    return keys, presses
+
+
+def state_hash(game):
+    """SHA-256 of everything that determines how the session continues."""
+    state = (
+        game.tick_count, game.game_state, game.score, game.lives, game.level,
+        game.sound_enabled, tuple(game.paddle.rect), sorted(game.paddle.power_up_timers.items()),
+        [(tuple(ball.rect), ball.x, ball.y, ball.speed_x, ball.speed_y, ball.is_glued, ball.slow_timer)
+         for ball in game.balls],
+        [tuple(brick.rect) for brick in game.bricks],
+        [(tuple(power_up.rect), power_up.type) for power_up in game.power_ups],
+        [tuple(laser.rect) for laser in game.lasers],
+        len(game.particles),
+    )
+    return hashlib.sha256(repr(state).encode()).digest()
+
+
+class InputRecorder:
+    """Collects the input of every tick and writes the recording when the session ends."""
+    def __init__(self, path, seed, sim_rate, mega_balls=0, ball_collisions=False):
+        self.path = path
+        self.seed = seed
+        self.sim_rate = sim_rate
+        self.mega_balls = mega_balls
+        self.ball_collisions = ball_collisions
+        self.ticks = bytearray()
+
+    def record(self, keys, presses):
+        """Appends one tick's input."""
+        self.ticks.append(encode_tick(keys, presses))
+
+    def save(self, game):
+        """Writes the recording, ending with the hash of the game's current state."""
+        with open(self.path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.sim_rate, self.seed,
+                                   self.mega_balls, self.ball_collisions, len(self.ticks), state_hash(game)))
+            file.write(zlib.compress(bytes(self.ticks), 9))
+
+
+class InputLog:
+    """A loaded recording."""
+    def __init__(self, seed, sim_rate, ticks, final_hash, mega_balls=0, ball_collisions=False):
+        self.seed = seed
+        self.sim_rate = sim_rate
+        self.mega_balls = mega_balls
+        self.ball_collisions = ball_collisions
+        self.ticks = ticks
+        self.final_hash = final_hash
+
+    @classmethod
+    def load(cls, path):
+        """Reads a recording written by InputRecorder.save."""
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, sim_rate, seed, mega_balls, ball_collisions, tick_count, final_hash = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an Arkanoid input recording")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} uses recording format {version}, expected {FORMAT_VERSION}")
+        ticks = zlib.decompress(data[HEADER.size:])
+        if len(ticks) != tick_count:
+            raise ValueError(f"{path} is truncated: {len(ticks)} of {tick_count} ticks")
+        return cls(seed, sim_rate, ticks, final_hash, mega_balls, ball_collisions)
+
+
+def replay(log):
+    """
+    Re-runs a recorded session headlessly, without rendering, as fast as possible.
+    Returns (matches, game): whether the final state hash equals the recorded one,
+    and the game in its final state for inspection.
+    """
+    game = Game(headless=True, render=False, sim_rate=log.sim_rate, seed=log.seed, mega_balls=log.mega_balls,
+                ball_collisions=log.ball_collisions)
+    for bits in log.ticks:
+        keys, presses = decode_tick(bits)
+        game.step(keys, presses)
+    return state_hash(game) == log.final_hash, game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Arkanoid session and verify its final state.")
+    parser.add_argument('recording', help="file written by main.py --record")
+    args = parser.parse_args()
+
+    log = InputLog.load(args.recording)
+    matches, game = replay(log)
+    print(f"Replayed {len(log.ticks)} ticks (seed {log.seed}, {log.sim_rate} Hz): "
+          f"state={game.game_state} score={game.score} lives={game.lives} level={game.level}")
+    if matches:
+        print("✅ Final state hash matches the recording")
+    else:
+        print("❌ Final state hash differs from the recording")
+    pygame.quit()
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
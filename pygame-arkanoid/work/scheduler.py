@@ -0,0 +1,210 @@
+import heapq
+import itertools
+import math
+
+import pygame
+
+from collision import swept_circle_aabb, swept_circle_walls
+
+
+class _Track:
+    """A free ball's straight-line flight since its last bounce."""
+    def __init__(self, ball, time, cx, cy):
+        self.ball = ball
+        self.time = time # When the ball was at (cx, cy)
+        self.cx = cx
+        self.cy = cy
+        self.speed_x = ball.speed_x
+        self.speed_y = ball.speed_y
+        self.end_time = math.inf # Time of the next wall/brick impact (or of leaving the screen)
+        self.version = 0 # Versions of the queued wall/brick and paddle events still valid
+        self.paddle_version = 0
+        self.placed = None # rect position the scheduler last gave the ball
+
+    def center_at(self, time):
+        """Centre of the ball at time, which must lie before the next impact."""
+        elapsed = time - self.time
+        return self.cx + self.speed_x * elapsed, self.cy + self.speed_y * elapsed
+
+    def changed_externally(self, ball):
+        """True if the game moved the ball or changed its speed since the last tick."""
+        return ((ball.speed_x, ball.speed_y) != (self.speed_x, self.speed_y)
+                or (ball.rect.x, ball.rect.y) != self.placed)
+
+
+class CollisionScheduler:
+    """
+    Event-driven ball physics, an alternative to sweeping every ball every tick.
+    Between bounces a ball flies in a straight line, so its next impact (wall,
+    brick or paddle) is computed once, analytically, and queued by time in a heap.
+    A tick only pops the impacts that fall inside it and places every ball on its
+    line, so the collision cost follows the number of bounces, not of ticks.
+    Queue entries are invalidated lazily: each carries the version of the flight
+    it was computed for, an impact on a brick that has disappeared since is flown
+    straight through, and when the paddle moves only the paddle impacts of falling
+    balls are recomputed.
+    """
+    TIME_EPSILON = 1e-9 # Impacts this close after the end of a tick still belong to it (rounding in the time sums)
+
+    def __init__(self):
+        self.time = 0.0 # Simulated time in reference ticks
+        self.bricks = None # BrickField the queued impacts were computed against
+        self._tracks = {} # Ball -> _Track for every free ball
+        self._queue = [] # (time, sequence, track, version, obstacle, contact)
+        self._sequence = itertools.count() # Keeps simultaneous events in the order they were queued
+        self._versions = itertools.count(1)
+        self._paddle_rect = None
+
+        # Statistics
+        self.events = 0 # Impacts processed
+        self.stale_events = 0 # Queue entries dropped because the flight or the brick changed
+        self.schedules = 0 # Flights computed
+
+    def reset(self, bricks):
+        """Forgets every flight, e.g. for a new brick wall."""
+        self.bricks = bricks
+        self._tracks.clear()
+        self._queue.clear()
+
+    def update(self, balls, paddle, bricks, launch_ball=False, dt=1.0):
+        """
+        Advances every ball by one tick of dt reference ticks.
+        Returns one (status, collision_object, bricks_hit) per ball, like Ball.update.
+        """
+        if bricks is not self.bricks:
+            self.reset(bricks)
+        start = self.time
+        end = start + dt
+        paddle_moved = paddle.rect != self._paddle_rect
+        if paddle_moved:
+            self._paddle_rect = paddle.rect.copy()
+
+        results = {}
+        for ball in balls:
+            track = self._tracks.get(ball)
+            if ball.is_glued:
+                if track is not None:
+                    del self._tracks[ball]
+                results[ball] = ball.update(paddle, launch_ball, dt) # Follows the paddle, maybe launches
+                continue
+            results[ball] = [None, []]
+            if ball.update_slow_timer(dt) or track is None or track.changed_externally(ball):
+                self._start(ball, start, paddle)
+            elif paddle_moved and track.speed_y > 0:
+                self._schedule_paddle(track, start, paddle) # Only falling balls can meet the paddle
+        for ball in [ball for ball in self._tracks if ball not in results]:
+            del self._tracks[ball] # Removed from play by the game
+
+        contacts = dict.fromkeys(self._tracks, 0)
+        while self._queue and self._queue[0][0] <= end + self.TIME_EPSILON:
+            time, _, track, version, obstacle, contact = heapq.heappop(self._queue)
+            ball = track.ball
+            if self._tracks.get(ball) is not track or version != (
+                    track.paddle_version if obstacle is paddle else track.version):
+                self.stale_events += 1
+                continue
+            self._place(track, time)
+            if obstacle not in ('wall', paddle) and obstacle not in self.bricks:
+                self.stale_events += 1 # Broken since: nothing in the way any more
+                self._start(ball, time, paddle)
+                continue
+
+            self.events += 1
+            result = results[ball]
+            if obstacle is paddle:
+                ball.bounce_off_paddle(paddle)
+                result[0] = 'paddle'
+                if ball.is_glued:
+                    del self._tracks[ball] # Caught: the ball rides the paddle from now on
+                    continue
+            else:
+                ball.reflect(contact)
+                if obstacle == 'wall':
+                    result[0] = result[0] or 'wall'
+                else:
+                    result[1].append(obstacle)
+            contacts[ball] += 1
+            if contacts[ball] >= ball.MAX_CONTACTS_PER_TICK:
+                self._start(ball, end, paddle) # Same cap as Ball.update: the rest of this tick's motion is dropped
+            else:
+                self._start(ball, time, paddle, obstacle if obstacle not in ('wall', paddle) else None)
+
+        self.time = end
+        for track in self._tracks.values():
+            self._place(track, end)
+            track.placed = (track.ball.rect.x, track.ball.rect.y)
+
+        outcome = []
+        for ball in balls:
+            result = results[ball]
+            if isinstance(result, tuple):
+                outcome.append(result) # From Ball.update
+            elif ball.rect.top > ball.screen_height:
+                self._tracks.pop(ball, None)
+                outcome.append(('lost', None, result[1]))
+            else:
+                outcome.append(('playing', result[0], result[1]))
+        return outcome
+
+    def _place(self, track, time):
+        """Moves the ball to where its flight puts it at time."""
+        ball = track.ball
+        cx, cy = track.center_at(time)
+        ball.move_to(cx - ball.radius, cy - ball.radius)
+
+    def _start(self, ball, time, paddle, ignored=None):
+        """
+        Starts a new flight from the ball's current position and speed at time and
+        queues its first impact. ignored is a brick just bounced off.
+        """
+        self.schedules += 1
+        x, y = ball.position()
+        radius = ball.radius
+        track = _Track(ball, time, x + radius, y + radius)
+        track.version = next(self._versions)
+        self._tracks[ball] = track
+
+        speed = max(abs(track.speed_x), abs(track.speed_y))
+        if speed == 0:
+            return
+        # Long enough to reach a wall from anywhere, cut short once a falling ball has left the screen
+        horizon = 2 * (ball.screen_width + ball.screen_height) / speed
+        if track.speed_y > 0:
+            horizon = min(horizon, (ball.screen_height + radius + 1 - track.cy) / track.speed_y)
+        dx = track.speed_x * horizon
+        dy = track.speed_y * horizon
+
+        first = swept_circle_walls(track.cx, track.cy, radius, dx, dy, ball.screen_width)
+        obstacle = 'wall'
+        reach = first.time if first is not None else 1.0
+        # Only bricks in the cells the flight crosses before that can be hit first
+        swept = pygame.Rect(math.floor(min(x, x + dx * reach)) - 1, math.floor(min(y, y + dy * reach)) - 1,
+                            math.ceil(abs(dx * reach)) + 2 * radius + 3, math.ceil(abs(dy * reach)) + 2 * radius + 3)
+        for brick in self.bricks.bricks_overlapping(swept):
+            if brick is ignored:
+                continue
+            contact = swept_circle_aabb(track.cx, track.cy, radius, dx, dy, brick.rect)
+            if contact is not None and (first is None or contact.time < first.time):
+                first, obstacle = contact, brick
+
+        if first is None:
+            track.end_time = time + horizon
+        else:
+            track.end_time = time + first.time * horizon
+            self._push(track.end_time, track, track.version, obstacle, first)
+        self._schedule_paddle(track, time, paddle)
+
+    def _schedule_paddle(self, track, time, paddle):
+        """Queues the impact on the paddle where it stands now, if the flight reaches it before its next impact."""
+        track.paddle_version = next(self._versions)
+        span = track.end_time - time
+        if track.speed_y <= 0 or span <= 0:
+            return
+        cx, cy = track.center_at(time)
+        contact = swept_circle_aabb(cx, cy, track.ball.radius, track.speed_x * span, track.speed_y * span,
+                                    paddle.rect)
+        if contact is not None:
+            self._push(time + contact.time * span, track, track.paddle_version, paddle, contact)
+
+    def _push(self, time, track, version, obstacle, contact):
+        heapq.heappush(self._queue, (time, next(self._sequence), track, version, obstacle, contact))
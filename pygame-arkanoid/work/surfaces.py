@@ -0,0 +1,78 @@
+import pygame
+
+
+class SurfaceFactory:
+    """
+    Single way in for the surfaces the game blits over and over: rendered text,
+    generated sprites and loaded images. prepare() converts a surface to the
+    display's pixel format (convert_alpha() if it has per-pixel alpha) and picks
+    RLE acceleration for whatever transparency it uses - colorkey, surface alpha
+    or per-pixel alpha - so blits skip transparent runs instead of converting and
+    blending pixel by pixel. Without a display surface, surfaces are returned as
+    they are (the display format is not known yet).
+    With debug on, count_unconverted() tallies blits of surfaces in any other
+    format; the game feeds it every command its RenderQueue flushes.
+    """
+    def __init__(self):
+        self.debug = False
+        self._formats = None # (bitsize, masks) of the opaque and per-pixel alpha display formats
+        self._unconverted = 0 # Unconverted blits so far this frame
+
+        # Statistics
+        self.prepared = 0 # Surfaces converted
+        self.unconverted_last_frame = 0 # In debug mode: blits of surfaces not in a display format
+
+    def prepare(self, surface, colorkey=None, alpha=None, rle=True):
+        """
+        Returns surface in the display format with RLE transparency.
+        colorkey or alpha (0-255, for the whole surface) set that kind of transparency;
+        otherwise a per-pixel alpha or an existing colorkey is kept. rle=False leaves
+        RLE off, for surfaces that will be drawn on or cut into subsurfaces.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        flags = pygame.RLEACCEL if rle else 0
+        if colorkey is None and alpha is None and surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+            if rle:
+                surface.set_alpha(255, flags) # Keeps the per-pixel alpha, adds RLE
+        else:
+            colorkey = surface.get_colorkey() if colorkey is None else colorkey
+            surface = surface.convert()
+            if colorkey is not None:
+                surface.set_colorkey(colorkey, flags)
+            if alpha is not None:
+                surface.set_alpha(alpha, flags)
+        self.prepared += 1
+        return surface
+
+    def render(self, font, text, color, antialias=True):
+        """Renders text with font, ready to blit."""
+        return self.prepare(font.render(text, antialias, color))
+
+    def load(self, path, colorkey=None, alpha=None):
+        """Loads an image file, ready to blit."""
+        return self.prepare(pygame.image.load(path), colorkey, alpha)
+
+    def is_display_format(self, surface):
+        """True if blitting surface to the display needs no pixel format conversion."""
+        if self._formats is None:
+            alpha = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            display = pygame.display.get_surface()
+            self._formats = {(display.get_bitsize(), display.get_masks()), (alpha.get_bitsize(), alpha.get_masks())}
+        return (surface.get_bitsize(), surface.get_masks()) in self._formats
+
+    def count_unconverted(self, commands):
+        """Adds the blit commands ((surface, position, ...) tuples) whose surface is in another format."""
+        for command in commands:
+            if not self.is_display_format(command[0]):
+                self._unconverted += 1
+
+    def end_frame(self):
+        """Closes the frame's unconverted-blit count."""
+        self.unconverted_last_frame = self._unconverted
+        self._unconverted = 0
+
+    def summary(self):
+        """One line of statistics, for the profiler overlay."""
+        return f"surfaces: {self.prepared} prepared, {self.unconverted_last_frame} unconverted blits/frame"
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the sprite atlas of pre-rendered game sprites and the glyph atlas for counters.
+"""
+
+import pygame
+import pytest
+
+from atlas import GlyphAtlas, SpriteAtlas
+from game_objects import Laser, PowerUp
+from main import Game
+
+
+def _drawn(draw, size=(200, 100)):
+    surface = pygame.Surface(size)
+    surface.fill((30, 30, 30))
+    draw(surface)
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def test_tiles_match_primitive_drawing():
+    game = Game(headless=True, seed=1)
+    game._reset_game()
+    game.paddle.rect.topleft = (10, 20)
+    game.balls[0].rect.topleft = (120, 30)
+    sprites = [game.paddle, game.balls[0], Laser(150, 40)]
+    for sprite in sprites:
+        sprite.save_previous()
+        tile = game.atlas.get(sprite.tile_name)
+        assert _drawn(lambda surface: sprite.draw(surface)) == \
+            _drawn(lambda surface: surface.blit(tile, sprite.rect.topleft)), sprite.tile_name
+
+
+def test_every_power_up_and_paddle_size_has_a_tile():
+    game = Game(headless=True, seed=1)
+    for type, properties in PowerUp.PROPERTIES.items():
+        tile = game.atlas.get(PowerUp(0, 0, type).tile_name)
+        assert tile.get_size() == (PowerUp.width, PowerUp.height)
+        assert tile.get_at((0, 0))[:3] == properties['color']
+    game.paddle.activate_power_up('grow')
+    assert game.atlas.get(game.paddle.tile_name).get_width() == 150
+
+
+def test_tiles_share_two_sheets():
+    atlas = SpriteAtlas({'a': pygame.Surface((4, 4)), 'b': pygame.Surface((6, 2)),
+                         'c': pygame.Surface((3, 3), pygame.SRCALPHA)})
+    a, b, c = atlas.get('a'), atlas.get('b'), atlas.get('c')
+    assert a.get_parent() is b.get_parent() is not c.get_parent()
+    assert b.get_size() == (6, 2) and b.get_offset() == (5, 0)
+    assert atlas.get('missing') is None
+
+
+def test_playing_frame_draws_sprites_from_the_atlas():
+    game = Game(headless=True, seed=1)
+    game.step({pygame.K_SPACE}) # Start
+    game.power_ups.append(game.power_up_pool.acquire(300, 300, 'laser'))
+    game.screen.fill((0, 0, 0))
+    game._draw_playing_sprites()
+    game.render_queue.flush()
+    tile = game.atlas.get(('power_up', 'laser'))
+    drawn = game.screen.subsurface(pygame.Rect(300, 300, PowerUp.width, PowerUp.height))
+    assert pygame.image.tobytes(drawn, 'RGB') == pygame.image.tobytes(tile, 'RGB')
+
+
+def test_glyph_atlas_lays_out_labels_and_tabular_digits():
+    pygame.font.init()
+    font = pygame.font.Font(None, 32)
+    glyphs = GlyphAtlas(font, (255, 255, 255), ("SCORE: ",))
+    assert glyphs.size("1,111")[0] == glyphs.size("8,808")[0] # Digits share one advance
+    assert glyphs.size("SCORE: 5") == (font.size("SCORE: ")[0] + glyphs.size("5")[0], font.get_height())
+    cells = glyphs.cells("SCORE: 12", (10, 20))
+    assert len(cells) == 3 and cells[0][1] == (10, 20) # The label is one cell
+    assert cells[1][0].get_parent() is cells[2][0].get_parent() # All cells share one sheet
+    with pytest.raises(ValueError):
+        glyphs.size("LIVES: 3")
+
+
+if __name__ == "__main__":
+    test_tiles_match_primitive_drawing()
+    test_every_power_up_and_paddle_size_has_a_tile()
+    test_tiles_share_two_sheets()
+    test_playing_frame_draws_sprites_from_the_atlas()
+    test_glyph_atlas_lays_out_labels_and_tabular_digits()
+    print("✅ Sprite atlas tests passed")
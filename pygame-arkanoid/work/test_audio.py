@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the sound manager's channels, merging, rate limiting and voice stealing.
+"""
+
+import pygame
+import pytest
+
+from audio import SoundManager
+from main import Game
+
+
+def _manager(**categories):
+    """A manager on the dummy audio driver, with long silent sounds so channels stay busy."""
+    Game(headless=True, render=False) # Sets up the dummy drivers and the mixer
+    pygame.mixer.stop() # Silence voices left over from other tests
+    manager = SoundManager(categories)
+    sounds = [pygame.mixer.Sound(buffer=bytes(88200 * 4)) for _ in range(3)] # Seconds of silence
+    return manager, sounds
+
+
+def test_same_tick_plays_are_merged_and_fast_repeats_dropped():
+    manager, (bounce, brick, _) = _manager(impacts=4)
+    manager.register(bounce, 'impacts', min_interval=0.1)
+    manager.register(brick, 'impacts')
+    manager.begin_tick(0.0)
+    assert manager.play(bounce) is not None
+    assert manager.play(bounce) is None and manager.play(bounce) is None
+    assert manager.play(brick) is not None # Other sounds are not merged with it
+    manager.begin_tick(1 / 60)
+    assert manager.play(bounce) is None # Within its 0.1 s interval
+    manager.begin_tick(0.2)
+    assert manager.play(bounce) is not None
+    assert (manager.played, manager.merged, manager.dropped) == (3, 2, 1)
+
+
+def test_full_category_steals_its_oldest_voice():
+    manager, (bounce, laser, jingle) = _manager(impacts=2, events=1)
+    manager.register(bounce, 'impacts')
+    manager.register(laser, 'impacts')
+    manager.register(jingle, 'events')
+    manager.begin_tick(0.0)
+    first = manager.play(bounce)
+    manager.begin_tick(0.1)
+    second = manager.play(laser)
+    manager.begin_tick(0.2)
+    assert manager.play(bounce) is first and manager.stolen == 1
+    assert manager.play(laser) is second and manager.stolen == 2
+    assert manager.play(jingle) not in (first, second) # Events keep their own channel
+    assert manager.summary() == "sound: 5 played, 0 merged, 0 dropped, 2 stolen"
+    with pytest.raises(ValueError):
+        manager.register(bounce, 'music')
+
+
+def test_mute_and_volume_go_through_channel_volume():
+    game = Game(headless=True, render=False)
+    channels = [channel for group in game.sounds._channels.values() for channel in group]
+    game.step({pygame.K_SPACE})
+    game.step(set(), [pygame.K_m])
+    assert not game.sound_enabled and all(channel.get_volume() == 0 for channel in channels)
+    assert game.sounds.play(game.bounce_sound) is None # Muted sounds don't take a channel
+    game.step(set(), [pygame.K_m])
+    game.sounds.set_volume('master', 0.5)
+    game.sounds.set_volume('sfx', 0.5)
+    assert all(abs(channel.get_volume() - 0.25) < 0.01 for channel in channels) # Mixer volume steps are 1/128
+    assert abs(pygame.mixer.music.get_volume() - 0.5) < 0.01
+    with pytest.raises(ValueError):
+        game.sounds.set_volume('voice', 1.0)
+
+
+class _StubChannel:
+    """Records the calls SoundManager makes on a mixer channel."""
+    def __init__(self):
+        self.calls = []
+
+    def get_busy(self):
+        return False
+
+    def play(self, sound, fade_ms=0):
+        self.calls.append(('play', sound, fade_ms))
+
+    def fadeout(self, ms):
+        self.calls.append(('fadeout', ms))
+
+
+def test_fades_are_left_to_the_mixer():
+    manager, (sound, _, _) = _manager(impacts=2)
+    manager.register(sound, 'impacts')
+    stubs = manager._channels['impacts'] = [_StubChannel(), _StubChannel()]
+    manager.begin_tick(0.0)
+    assert manager.play(sound, fade_ms=50) is stubs[0]
+    manager.fade_out('sfx', 10)
+    assert stubs[0].calls == [('play', sound, 50), ('fadeout', 10)]
+    assert stubs[1].calls == [('fadeout', 10)]
+    with pytest.raises(ValueError):
+        manager.fade_out('master', 10)
+
+
+if __name__ == "__main__":
+    test_same_tick_plays_are_merged_and_fast_repeats_dropped()
+    test_full_category_steals_its_oldest_voice()
+    test_mute_and_volume_go_through_channel_volume()
+    test_fades_are_left_to_the_mixer()
+    print("✅ Sound manager tests passed")
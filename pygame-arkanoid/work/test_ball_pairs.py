@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for ball-to-ball collisions and their sort-and-sweep broadphase.
+"""
+
+import numpy as np
+import pygame
+
+from ball_pairs import BallCollider
+from main import Game
+
+
+def _arrays(*balls):
+    """x, y, speed_x, speed_y arrays for balls given as (x, y, speed x, speed y)."""
+    return [np.array(column, dtype=float) for column in zip(*balls)]
+
+
+def test_candidates_match_all_pairs():
+    rng = np.random.default_rng(3)
+    x = rng.uniform(0, 800, 300)
+    collider = BallCollider()
+    for _ in range(3): # Fresh sort, then incremental updates after small moves
+        first, second = collider.candidate_pairs(x, 20)
+        found = {tuple(sorted(pair)) for pair in zip(first.tolist(), second.tolist())}
+        expected = {(i, j) for i in range(x.size) for j in range(i + 1, x.size) if abs(x[i] - x[j]) < 20}
+        assert found == expected
+        x += rng.uniform(-6, 6, x.size)
+
+
+def test_head_on_balls_swap_speeds():
+    x, y, speed_x, speed_y = _arrays((100, 100, 4, 0), (118, 100, -2, 0), (400, 100, 0, 0))
+    assert BallCollider().resolve(x, y, speed_x, speed_y, 20) == 1
+    assert speed_x.tolist() == [-2, 4, 0]
+    assert x[1] - x[0] == 20 # Pushed apart to touching
+
+
+def test_separating_and_inactive_balls_are_left_alone():
+    x, y, speed_x, speed_y = _arrays((100, 100, -4, 0), (118, 100, 4, 0))
+    assert BallCollider().resolve(x, y, speed_x, speed_y, 20) == 0
+    x, y, speed_x, speed_y = _arrays((100, 100, 4, 0), (118, 100, -4, 0))
+    assert BallCollider().resolve(x, y, speed_x, speed_y, 20, np.array([True, False])) == 0
+    assert speed_x.tolist() == [4, -4]
+
+
+def test_order_survives_removed_balls():
+    collider = BallCollider()
+    collider.candidate_pairs(np.array([50.0, 10.0, 30.0, 70.0]), 20)
+    first, second = collider.candidate_pairs(np.array([10.0, 25.0]), 20) # Two balls lost, indices shifted
+    assert (first.tolist(), second.tolist()) == ([0], [1])
+
+
+def test_mega_mode_with_ball_collisions():
+    game = Game(headless=True, seed=4, mega_balls=200, ball_collisions=True)
+    game.step({pygame.K_SPACE}) # Start
+    game.step(set(), [pygame.K_SPACE]) # Launch
+    for _ in range(80):
+        game.step({pygame.K_LEFT})
+    assert game.ball_collider.collisions > 0
+    # Well under the 19900 pairs per tick of testing every pair, even with the swarm launched from one spot
+    assert game.ball_collider.candidates < 80 * 19900 // 4
+    assert all(0 <= x <= 780 for x in game.balls.x[:len(game.balls)])
+
+
+if __name__ == "__main__":
+    test_candidates_match_all_pairs()
+    test_head_on_balls_swap_speeds()
+    test_separating_and_inactive_balls_are_left_alone()
+    test_order_survives_removed_balls()
+    test_mega_mode_with_ball_collisions()
+    print("✅ Ball collision tests passed")
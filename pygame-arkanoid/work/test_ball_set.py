@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized BallSet and the mega multi-ball mode.
+"""
+
+import math
+import random
+
+import numpy as np
+import pygame
+
+from ball_set import BallSet
+from game_objects import Ball, Brick, BrickField, Paddle
+from main import Game
+
+
+def _ball_set(*balls):
+    """A BallSet holding free balls given as (centre x, centre y, speed x, speed y)."""
+    ball_set = BallSet(800, 600, random.Random(1))
+    for cx, cy, speed_x, speed_y in balls:
+        ball_set.add(cx - 10, cy - 10, speed_x, speed_y)
+    return ball_set
+
+
+def test_walls_reflect_and_report_bounces():
+    balls = _ball_set((12, 300, -6, 0), (400, 300, 0, 6), (400, 14, 3, -6))
+    events = balls.update(Paddle(800, 600))
+    assert [kind for kind, _, _ in events.bounces] == ['wall', 'wall']
+    assert balls.speed_x[0] == 6 and balls.x[0] == 4 # 6 px step mirrored at x = 10 (the radius)
+    assert balls.speed_y[2] == 6 and balls.y[2] == 2
+    assert balls.speed_y[1] == 6 # Untouched
+
+
+def test_paddle_bounce_matches_ball():
+    paddle = Paddle(800, 600)
+    balls = _ball_set((paddle.rect.centerx + 30, paddle.rect.top - 12, 0, 6))
+    events = balls.update(paddle)
+    assert [kind for kind, _, _ in events.bounces] == ['paddle']
+
+    ball = Ball(800, 600, random.Random(1))
+    ball.is_glued = False
+    ball.rect.center = (paddle.rect.centerx + 30, paddle.rect.top - 12)
+    ball.speed_x, ball.speed_y = 0, 6
+    ball.update(paddle)
+    assert math.isclose(balls.speed_x[0], ball.speed_x) and math.isclose(balls.speed_y[0], ball.speed_y)
+    assert balls[0].rect == ball.rect
+
+
+def test_paddle_side_and_corner_hits_match_ball():
+    paddle = Paddle(800, 600)
+    left, top = paddle.rect.left, paddle.rect.top
+    cases = [(left - 12, top + 5, 6, 1), # Side
+             (left - 9, top - 9, 4, 4), # Corner
+             (paddle.rect.right + 11, top + 2, -5, 2), # Other side
+             (left + 3, top - 14, 1, 6)] # Top, near the edge
+    for glue in (False, True):
+        paddle.has_glue = glue
+        for case in cases:
+            balls = _ball_set(case)
+            events = balls.update(paddle)
+            ball = Ball(800, 600, random.Random(1))
+            ball.is_glued = False
+            ball.move_to(case[0] - 10, case[1] - 10)
+            ball.speed_x, ball.speed_y = case[2], case[3]
+            _, collision_object, _ = ball.update(paddle)
+            assert collision_object == 'paddle', case
+            assert [kind for kind, _, _ in events.bounces] == ['paddle'], case
+            assert math.isclose(balls.speed_x[0], ball.speed_x) and math.isclose(balls.speed_y[0], ball.speed_y), case
+            assert balls[0].rect == ball.rect and balls[0].is_glued == ball.is_glued == glue, case
+
+
+def test_lost_balls_are_removed_in_order():
+    balls = _ball_set((100, 595, 0, 6), (200, 300, 1, 1), (300, 609, 0, 6))
+    events = balls.update(Paddle(800, 600))
+    assert events.lost == 1
+    assert len(balls) == 2
+    assert [round(ball.x) for ball in balls] == [90, 191]
+
+
+def test_brick_hits_are_swept():
+    bricks = BrickField(1, 1, 80, 25, 360, 200)
+    brick = Brick(360, 200, 75, 20, (255, 0, 0))
+    bricks.add(brick)
+    balls = _ball_set((400, 300, 0, -10), (100, 300, 0, -10))
+    events = balls.update(Paddle(800, 600), dt=15, bricks=bricks) # 150 px: would jump the brick
+    assert events.bricks_hit == [brick]
+    assert balls.speed_y[0] == 10 and balls.y[0] >= brick.rect.bottom
+    assert balls.speed_y[1] == -10
+
+
+def test_views_read_and_write_ball_state():
+    balls = _ball_set((400, 300, 4, -4))
+    view = balls[0]
+    view.is_glued = True
+    assert balls.glued[0] and view.is_glued is True
+    view.activate_power_up('slow')
+    assert (view.speed_x, view.speed_y, view.is_slowed) == (2, -2, True)
+
+
+def test_mega_mode_launch_releases_swarm():
+    game = Game(headless=True, seed=4, mega_balls=300)
+    game.step({pygame.K_SPACE}) # Start
+    game.step(set(), [pygame.K_SPACE]) # Launch
+    assert len(game.balls) == 301
+    for _ in range(90):
+        game.step({pygame.K_LEFT})
+    assert game.score > 0
+
+
+def test_mega_mode_relaunching_caught_balls_releases_no_swarm():
+    game = Game(headless=True, seed=4, mega_balls=50)
+    game.step({pygame.K_SPACE}) # Start
+    game.step(set(), [pygame.K_SPACE]) # Serve: releases the swarm
+    assert len(game.balls) == 51
+    game.paddle.activate_power_up('glue')
+    game.balls.glued[:3] = True # Caught by the catch paddle
+    game.step({pygame.K_SPACE}) # Relaunched by holding SPACE
+    assert len(game.balls) == 51 and not game.balls.glued[:game.balls.count].any()
+    game.balls.glued[:3] = True
+    game.step(set(), [pygame.K_SPACE]) # Relaunched by a press
+    assert len(game.balls) == 51 and not game.balls.glued[:game.balls.count].any()
+
+
+def test_mega_mode_slow_power_up_slows_every_ball():
+    game = Game(headless=True, seed=4, mega_balls=300)
+    game.step({pygame.K_SPACE}) # Start
+    game.step(set(), [pygame.K_SPACE]) # Launch
+    game.balls.slowed[:5] = True # Already slowed: left as they are
+    speeds = np.hypot(game.balls.speed_x, game.balls.speed_y)[:game.balls.count].copy()
+    game.power_ups.append(game.power_up_pool.acquire(game.paddle.rect.x, game.paddle.rect.y, 'slow'))
+    game.step()
+    slowed = np.hypot(game.balls.speed_x, game.balls.speed_y)[:game.balls.count]
+    assert game.balls.slowed[:game.balls.count].all()
+    assert np.allclose(slowed[5:], speeds[5:] / 2) and np.allclose(slowed[:5], speeds[:5])
+
+
+if __name__ == "__main__":
+    test_walls_reflect_and_report_bounces()
+    test_paddle_bounce_matches_ball()
+    test_paddle_side_and_corner_hits_match_ball()
+    test_lost_balls_are_removed_in_order()
+    test_brick_hits_are_swept()
+    test_views_read_and_write_ball_state()
+    test_mega_mode_launch_releases_swarm()
+    test_mega_mode_relaunching_caught_balls_releases_no_swarm()
+    test_mega_mode_slow_power_up_slows_every_ball()
+    print("✅ BallSet tests passed")
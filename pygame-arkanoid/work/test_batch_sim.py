@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the balancing batch simulator.
+"""
+
+from batch_sim import play_game, run_batch, summarize
+
+
+def test_games_are_reproducible_from_their_seed():
+    first = play_game(3, 0.8, 0.5, {})
+    second = play_game(3, 0.8, 0.5, {})
+    assert first == second
+    assert first['outcome'] in ('win', 'game_over', 'timeout')
+    assert first['ticks'] <= 0.5 * 60 * 60
+
+
+def test_settings_override_balancing_attributes():
+    never = play_game(5, 0.8, 0.5, {'power_up_chance': 0.0, 'power_up_chance_per_level': 0.0})
+    assert never['power_ups_dropped'] == 0
+
+
+def test_summary_aggregates_results():
+    results = run_batch(3, 10, 0.8, 0.5, {}, jobs=1)
+    assert [result['seed'] for result in results] == [10, 11, 12]
+    summary = summarize(results)
+    assert summary['games'] == 3
+    assert sum(summary['outcomes'].values()) == 3
+    assert summary['score']['count'] == 3
+    assert 0.0 <= summary['power_ups']['pickup_rate'] <= 1.0
+
+
+def test_process_pool_matches_a_single_process():
+    settings = {'power_up_chance': 0.5} # Pickled for the workers along with the rest of each work item
+    in_pool = run_batch(4, 20, 0.8, 0.2, settings, jobs=2)
+    assert in_pool == run_batch(4, 20, 0.8, 0.2, settings, jobs=1)
+    assert [result['seed'] for result in in_pool] == [20, 21, 22, 23]
+
+
+if __name__ == "__main__":
+    test_games_are_reproducible_from_their_seed()
+    test_settings_override_balancing_attributes()
+    test_summary_aggregates_results()
+    test_process_pool_matches_a_single_process()
+    print("✅ Batch simulator tests passed")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the BrickField uniform-grid spatial index.
+"""
+
+import pygame
+
+from game_objects import Brick, BrickField
+
+
+def _make_field():
+    """Builds a 3x4 field with the same pitch as the real brick wall."""
+    field = BrickField(3, 4, 80, 25, 10, 50)
+    for row in range(3):
+        for col in range(4):
+            field.add(Brick(10 + col * 80, 50 + row * 25, 75, 20, (255, 255, 255)))
+    return field
+
+
+def test_overlap_query_only_returns_touched_bricks():
+    field = _make_field()
+    ball_rect = pygame.Rect(80, 52, 20, 15) # Straddles columns 0 and 1 of row 0
+    hits = field.bricks_overlapping(ball_rect)
+    assert [brick.rect.x for brick in hits] == [10, 90]
+
+
+def test_gap_between_bricks_is_not_a_hit():
+    field = _make_field()
+    assert field.bricks_overlapping(pygame.Rect(85, 50, 5, 20)) == []
+
+
+def test_rect_outside_grid_returns_nothing():
+    field = _make_field()
+    assert field.bricks_overlapping(pygame.Rect(0, 0, 20, 20)) == []
+    assert field.bricks_overlapping(pygame.Rect(400, 500, 20, 20)) == []
+
+
+def test_remove_updates_length_and_queries():
+    field = _make_field()
+    brick = field.bricks_overlapping(pygame.Rect(20, 60, 5, 5))[0]
+    field.remove(brick)
+    assert len(field) == 11
+    assert brick not in list(field)
+    assert field.bricks_overlapping(pygame.Rect(20, 60, 5, 5)) == []
+
+
+def test_layer_matches_brick_by_brick_drawing():
+    field = _make_field()
+    field.remove(field.bricks_overlapping(pygame.Rect(100, 80, 5, 5))[0])
+    expected = pygame.Surface((400, 200))
+    for brick in field:
+        brick.draw(expected)
+
+    field.build_layer((0, 0, 0))
+    actual = pygame.Surface((400, 200))
+    field.draw(actual)
+    assert pygame.image.tobytes(actual, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+
+def test_removing_a_brick_erases_only_its_cell():
+    field = _make_field()
+    field.build_layer((0, 0, 0))
+    field.remove(field.bricks_overlapping(pygame.Rect(100, 80, 5, 5))[0]) # Row 1, col 1
+    screen = pygame.Surface((400, 200))
+    field.draw(screen)
+    assert screen.get_at((100, 80))[:3] == (0, 0, 0)
+    assert screen.get_at((20, 80))[:3] == (255, 255, 255)
+    assert screen.get_at((100, 55))[:3] == (255, 255, 255)
+
+
+def test_column_index_tracks_lowest_brick():
+    field = _make_field()
+    assert field.lowest_overlapping(20, 25).rect.topleft == (10, 100) # Bottom row
+    assert field.lowest_overlapping(85, 90) is None # In the padding between columns
+    field.remove(field.lowest_overlapping(20, 25))
+    field.remove(field.bricks_overlapping(pygame.Rect(20, 80, 5, 5))[0])
+    assert field.lowest_overlapping(20, 25).rect.topleft == (10, 50) # Next one up
+    assert field.lowest_overlapping(88, 93).rect.topleft == (90, 100) # Straddling: the lower of both columns
+    field.remove(field.lowest_overlapping(20, 25))
+    assert field.lowest_overlapping(20, 25) is None
+
+
+if __name__ == "__main__":
+    test_overlap_query_only_returns_touched_bricks()
+    test_gap_between_bricks_is_not_a_hit()
+    test_rect_outside_grid_returns_nothing()
+    test_remove_updates_length_and_queries()
+    test_layer_matches_brick_by_brick_drawing()
+    test_removing_a_brick_erases_only_its_cell()
+    test_column_index_tracks_lowest_brick()
+    print("✅ BrickField tests passed")
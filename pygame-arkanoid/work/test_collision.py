@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for swept circle collision and ball movement with large steps.
+"""
+
+import math
+import random
+
+import pygame
+
+from collision import swept_circle_aabb, swept_circle_walls
+from game_objects import Ball, Brick, BrickField, Paddle
+
+
+def test_face_hit_reports_time_and_normal():
+    rect = pygame.Rect(100, 100, 80, 20)
+    contact = swept_circle_aabb(140, 50, 10, 0, 100, rect) # Falling onto the top face
+    assert math.isclose(contact.time, 0.4) # Centre travels 40 px of 100 to reach y = 90
+    assert (contact.normal_x, contact.normal_y) == (0, -1)
+
+    contact = swept_circle_aabb(50, 110, 10, 100, 0, rect) # Moving right into the left face
+    assert math.isclose(contact.time, 0.4)
+    assert (contact.normal_x, contact.normal_y) == (-1, 0)
+
+
+def test_corner_hit_and_near_miss():
+    rect = pygame.Rect(100, 100, 80, 20)
+    contact = swept_circle_aabb(80, 80, 10, 20, 20, rect) # Diagonally onto the top-left corner
+    assert contact is not None
+    assert math.isclose(contact.normal_x, -math.sqrt(0.5)) and math.isclose(contact.normal_y, -math.sqrt(0.5))
+    # Passes the corner inside the grown rect's square but outside its rounded edge
+    assert swept_circle_aabb(85, 97, 10, 20, -20, rect) is None # Closest approach 12.7 px from the corner
+
+
+def test_no_hit_when_moving_away_or_stopping_short():
+    rect = pygame.Rect(100, 100, 80, 20)
+    assert swept_circle_aabb(140, 50, 10, 0, -100, rect) is None
+    assert swept_circle_aabb(140, 50, 10, 0, 30, rect) is None
+    assert swept_circle_aabb(140, 90, 10, 0, 5, rect) is not None # Touching and moving in
+
+
+def test_walls_bounce_circle_at_first_contact():
+    contact = swept_circle_walls(30, 30, 10, -40, -10, 800)
+    assert math.isclose(contact.time, 0.5) # Left wall at x = 10 comes before the top wall at y = 10
+    assert (contact.normal_x, contact.normal_y) == (1, 0)
+    assert swept_circle_walls(400, 500, 10, 0, 50, 800) is None # Bottom is open
+
+
+def test_fast_ball_does_not_tunnel_through_bricks():
+    bricks = BrickField(1, 1, 80, 25, 360, 200)
+    brick = Brick(360, 200, 75, 20, (255, 0, 0))
+    bricks.add(brick)
+    paddle = Paddle(800, 600)
+    ball = Ball(800, 600, random.Random(1))
+    ball.is_glued = False
+    ball.rect.center = (400, 300)
+    ball.speed_x, ball.speed_y = 0, -10
+    # One step of 150 px would jump straight over the 20 px brick without sweeping
+    status, collision_object, bricks_hit = ball.update(paddle, dt=15, bricks=bricks)
+    assert bricks_hit == [brick]
+    assert ball.speed_y > 0
+    assert ball.rect.top >= brick.rect.bottom
+
+
+def test_fast_ball_bounces_off_paddle():
+    paddle = Paddle(800, 600)
+    ball = Ball(800, 600, random.Random(1))
+    ball.is_glued = False
+    ball.rect.center = (paddle.rect.centerx, 450)
+    ball.speed_x, ball.speed_y = 0, 10
+    status, collision_object, _ = ball.update(paddle, dt=20) # 200 px step through a 10 px paddle
+    assert (status, collision_object) == ('playing', 'paddle')
+    assert ball.speed_y < 0
+    assert ball.rect.bottom <= paddle.rect.top
+
+
+if __name__ == "__main__":
+    test_face_hit_reports_time_and_normal()
+    test_corner_hit_and_near_miss()
+    test_no_hit_when_moving_away_or_stopping_short()
+    test_walls_bounce_circle_at_first_contact()
+    test_fast_ball_does_not_tunnel_through_bricks()
+    test_fast_ball_bounces_off_paddle()
+    print("✅ Swept collision tests passed")
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Tests for frame scheduling: idle screens and an unfocused window render at reduced rates.
+"""
+
+import pygame
+
+from main import Game
+
+
+def test_static_screens_and_background_window_render_slower():
+    game = Game(headless=True, seed=1)
+    game.headless, game.fps_cap = False, 60 # Schedule frames as a windowed run would
+    assert game._frame_rate() == game.idle_fps # Title screen
+    assert game._frame_due() and not game._frame_due() # Drawn once, then skipped until it changes
+    game._pending_presses.append(pygame.K_SPACE)
+    assert game._frame_rate() == 60 # A press is handled at the full rate
+    game.step(set(), game._take_pending_presses())
+    assert game._frame_rate() == 60 and game._frame_due() and game._frame_due() # Playing draws every frame
+    pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    game._handle_input()
+    assert game._frame_rate() == game.background_fps
+    pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED))
+    game._handle_input()
+    assert game._frame_rate() == 60
+
+
+if __name__ == "__main__":
+    test_static_screens_and_background_window_render_slower()
+    print("✅ Frame scheduling tests passed")
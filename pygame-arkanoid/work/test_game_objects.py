@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact, slotted game object classes.
+"""
+
+import random
+
+import pytest
+
+from game_objects import Ball, Brick, Firework, Laser, Paddle, PowerUp, World
+
+
+def _instances():
+    return [Paddle(800, 600), Ball(800, 600, random.Random(1)), Brick(0, 0, 75, 20, (255, 0, 0)),
+            PowerUp(0, 0, 'grow'), Laser(0, 0), Firework(800, 600, None, random.Random(1))]
+
+
+def test_objects_have_no_instance_dict():
+    for obj in _instances():
+        assert not hasattr(obj, '__dict__'), type(obj).__name__
+        with pytest.raises(AttributeError):
+            obj.misspelt_attribute = 1
+
+
+def test_screen_size_is_shared_through_one_world():
+    paddle, ball = Paddle(800, 600), Ball(800, 600)
+    assert paddle.world is ball.world is World.of(800, 600)
+    assert (ball.screen_width, ball.screen_height) == (800, 600)
+    assert Ball(640, 480).world is not ball.world
+
+
+if __name__ == "__main__":
+    test_objects_have_no_instance_dict()
+    test_screen_size_is_shared_through_one_world()
+    print("✅ Game object tests passed")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for headless simulation mode and the step() API.
+"""
+
+import pygame
+
+from main import Game
+
+
+def test_headless_game_starts_from_scripted_input():
+    game = Game(headless=True, render=False)
+    assert game.game_state == game.GAME_STATE_TITLE
+    game.step({pygame.K_SPACE}) # Press: title -> playing
+    assert game.game_state == game.GAME_STATE_PLAYING
+    assert game.tick_count == 1
+
+
+def test_only_fresh_presses_trigger_key_down():
+    game = Game(headless=True, render=False)
+    game.step({pygame.K_m}) # Press: mute
+    assert not game.sound_enabled
+    game.step({pygame.K_m}) # Still held: no second toggle
+    assert not game.sound_enabled
+    game.step()
+    game.step({pygame.K_m}) # Fresh press: unmute
+    assert game.sound_enabled
+
+
+def test_held_keys_move_the_paddle():
+    game = Game(headless=True, render=False)
+    game.step({pygame.K_SPACE})
+    start_x = game.paddle.rect.x
+    for _ in range(10):
+        game.step({pygame.K_LEFT})
+    assert game.paddle.rect.x == start_x - 10 * game.paddle.speed
+
+
+def test_headless_rendering_draws_to_dummy_display():
+    game = Game(headless=True, render=True)
+    game.step({pygame.K_SPACE})
+    for _ in range(60):
+        game.step()
+    assert game.screen.get_size() == (game.screen_width, game.screen_height)
+
+
+def test_thousands_of_ticks_run_headless():
+    game = Game(headless=True, render=False)
+    game.step({pygame.K_SPACE})
+    for tick in range(3000):
+        game.step({pygame.K_SPACE} if tick % 30 == 0 else ())
+    assert game.tick_count == 3001
+
+
+if __name__ == "__main__":
+    test_headless_game_starts_from_scripted_input()
+    test_only_fresh_presses_trigger_key_down()
+    test_held_keys_move_the_paddle()
+    test_headless_rendering_draws_to_dummy_display()
+    test_thousands_of_ticks_run_headless()
+    print("✅ Headless mode tests passed")
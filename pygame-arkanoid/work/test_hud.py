@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached HUD layer.
+"""
+
+import numpy as np
+import pygame
+
+from main import Game
+from rendering import RenderQueue
+
+
+def _hud_pixels(game, draw):
+    """Pixels of the top of the screen after draw() queued the HUD (the HUD never reaches lower)."""
+    game.screen.fill(game.BG_COLOR)
+    draw()
+    game.render_queue.flush()
+    return pygame.surfarray.array3d(game.screen.subsurface((0, 0, game.screen_width, 200))).astype(int)
+
+
+def test_hud_is_rebuilt_only_when_its_values_change():
+    game = Game(headless=True, seed=2)
+    game.step({pygame.K_SPACE})
+    rebuilds = game.hud.rebuilds
+    for _ in range(20):
+        game.step({pygame.K_LEFT})
+    assert game.hud.rebuilds == rebuilds
+    game.paddle.activate_power_up('grow')
+    game.step()
+    for _ in range(20):
+        game.step() # The grow timer runs down without touching the HUD
+    game.score += 10
+    game.step()
+    assert game.hud.rebuilds == rebuilds + 2
+    assert game.hud.summary().startswith(f"hud: {game.hud.rebuilds} rebuilds")
+
+
+def test_composed_hud_matches_label_by_label_drawing():
+    game = Game(headless=True, seed=2)
+    game.step({pygame.K_SPACE})
+    game._spawn_multi_ball(2)
+    for power_up in ('laser', 'glue', 'grow'):
+        game.paddle.activate_power_up(power_up)
+    game.score = 12345
+    composed = _hud_pixels(game, lambda: game.hud.draw(game.render_queue.layer(RenderQueue.HUD), game))
+    assert len(game.hud._commands) == 2 # Score bar and indicator panel
+
+    def draw_labels():
+        # The layout of the HUD, label by label
+        render = game.text_cache.render
+        counters, ball_counter = game.hud.counters, game.hud.ball_counter
+        game.screen.blits(counters.cells("SCORE: 12,345", (15, 15)))
+        level = pygame.Rect((0, 0), counters.size("LEVEL: 1"))
+        game.screen.blits(counters.cells("LEVEL: 1", level.move(400 - level.centerx, 15).topleft))
+        game.screen.blits(counters.cells("LIVES: 3", (785 - counters.size("LIVES: 3")[0], 15)))
+        game.screen.blits(ball_counter.cells("BALLS: 3", (785 - ball_counter.size("BALLS: 3")[0], 55)))
+        for index, (text, color) in enumerate([("⚡ LASER", (255, 60, 60)), ("🔗 CATCH", (60, 255, 60)),
+                                               ("📏 GROW", (60, 60, 255))]):
+            indicator = render(game.message_font, text, color)
+            game.screen.blit(indicator, indicator.get_rect(topright=(785, 85 + index * 25)))
+    # The composed surfaces are RLE-accelerated, whose blending may round one level differently
+    assert np.abs(composed - _hud_pixels(game, draw_labels)).max() <= 1
+
+
+def test_score_updates_rasterize_no_text():
+    game = Game(headless=True, seed=2)
+    game.step({pygame.K_SPACE})
+    misses = game.text_cache.misses
+    for points in range(0, 5000, 10):
+        game.score = points
+        game._draw_static_layer()
+    assert game.text_cache.misses == misses
+    assert game.hud.rebuilds >= 500
+
+
+if __name__ == "__main__":
+    test_hud_is_rebuilt_only_when_its_values_change()
+    test_composed_hud_matches_label_by_label_drawing()
+    test_score_updates_rasterize_no_text()
+    print("✅ HUD tests passed")
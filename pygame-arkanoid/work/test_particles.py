@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the array-backed ParticleSystem.
+"""
+
+import numpy as np
+import pygame
+
+from particles import ParticleSystem
+
+
+def test_spawn_grows_past_initial_capacity():
+    particles = ParticleSystem(capacity=8, rng=np.random.default_rng(1))
+    particles.spawn(100, 100, (255, 0, 0), 20, 1, 4, 1, 4, 0.05)
+    assert len(particles) == 20
+    assert particles.capacity >= 20
+    assert set(particles.size[:20]) <= {1.0, 2.0, 3.0, 4.0}
+
+
+def test_spawn_grows_from_zero_capacity():
+    particles = ParticleSystem(capacity=0, rng=np.random.default_rng(1))
+    particles.spawn(100, 100, (255, 0, 0), 3, 1, 4, 1, 4, 0.05)
+    assert len(particles) == 3
+    assert particles.capacity >= 3
+
+
+def test_dead_particles_are_compacted_out():
+    particles = ParticleSystem(rng=np.random.default_rng(2))
+    particles.spawn(0, 0, (255, 255, 0), 50, 1, 1, 1, 3, 0) # Live for 10 ticks
+    particles.spawn(0, 0, (0, 255, 0), 50, 3, 3, 1, 3, 0) # Live for 30 ticks
+    for _ in range(11):
+        particles.update()
+    assert len(particles) == 50
+    assert (particles.color[:50] == (0, 255, 0)).all()
+    assert (particles.size[:50] > 0).all()
+
+
+def test_update_matches_particle_motion():
+    particles = ParticleSystem()
+    particles.spawn(10, 20, (255, 255, 255), 1, 4, 4, 2, 2, 0.5)
+    vx, vy = particles.vx[0], particles.vy[0]
+    particles.update()
+    assert np.isclose(particles.x[0], 10 + vx)
+    assert np.isclose(particles.y[0], 20 + vy)
+    assert np.isclose(particles.vy[0], vy + 0.5)
+    assert np.isclose(particles.size[0], 3.9)
+
+
+def test_draw_blits_visible_particles():
+    screen = pygame.Surface((200, 200))
+    particles = ParticleSystem()
+    particles.spawn(100, 100, (255, 0, 0), 10, 3, 3, 0, 0, 0) # Stationary
+    particles.draw(screen)
+    assert screen.get_at((100, 100))[:3] == (255, 0, 0)
+
+
+if __name__ == "__main__":
+    test_spawn_grows_past_initial_capacity()
+    test_spawn_grows_from_zero_capacity()
+    test_dead_particles_are_compacted_out()
+    test_update_matches_particle_motion()
+    test_draw_blits_visible_particles()
+    print("✅ ParticleSystem tests passed")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the object pools recycling balls, power-ups and lasers.
+"""
+
+import pygame
+import pytest
+
+from game_objects import Laser, PowerUp
+from main import Game
+from pools import ObjectPool
+
+
+def test_released_objects_are_reset_and_reused():
+    pool = ObjectPool('laser', Laser)
+    laser = pool.acquire(100, 300)
+    laser.update()
+    laser.target = object()
+    pool.release(laser)
+    again = pool.acquire(200, 400)
+    assert again is laser
+    assert again.rect.topleft == (200, 400) and again.interpolated_rect(0.0).topleft == (200, 400)
+    assert again.target is None
+    assert (pool.created, pool.reused, pool.in_use, pool.free) == (1, 1, 1, 0)
+
+
+def test_power_up_takes_its_new_type():
+    pool = ObjectPool('power-up', PowerUp)
+    pool.release(pool.acquire(10, 10, 'grow'))
+    power_up = pool.acquire(50, 60, 'laser')
+    assert (power_up.type, power_up.char, power_up.color) == ('laser', 'L', PowerUp.PROPERTIES['laser']['color'])
+    assert pool.occupancy() == 1.0
+
+
+def test_release_all_empties_the_list():
+    pool = ObjectPool('laser', Laser)
+    lasers = [pool.acquire(0, 0) for _ in range(3)]
+    pool.release_all(lasers)
+    assert lasers == [] and pool.free == 3 and pool.in_use == 0 and pool.peak_in_use == 3
+
+
+def test_double_release_is_refused():
+    pool = ObjectPool('laser', Laser)
+    laser = pool.acquire(0, 0)
+    pool.release(laser)
+    with pytest.raises(ValueError):
+        pool.release(laser)
+    with pytest.raises(ValueError):
+        pool.release(Laser(0, 0)) # Never acquired
+    assert (pool.in_use, pool.free) == (0, 1)
+    first, second = pool.acquire(0, 0), pool.acquire(0, 0)
+    assert first is not second
+
+
+def test_long_session_stops_allocating():
+    game = Game(headless=True, render=False, seed=3)
+    game._reset_game()
+    game.paddle.activate_power_up('laser')
+    built = []
+    for tick in range(1200):
+        if tick % 300 == 0:
+            game.paddle.activate_power_up('laser') # Keep the cannons on
+            built.append(game.laser_pool.created)
+        game.step(set(), [pygame.K_f] if tick % 10 == 0 else [])
+    assert game.laser_pool.reused > game.laser_pool.created
+    assert built[-1] == built[-2] # Warm pool: no new lasers built from tick 600 to 900
+    assert game.laser_pool.in_use == len(game.lasers)
+
+
+if __name__ == "__main__":
+    test_released_objects_are_reset_and_reused()
+    test_power_up_takes_its_new_type()
+    test_release_all_empties_the_list()
+    test_double_release_is_refused()
+    test_long_session_stops_allocating()
+    print("✅ Object pool tests passed")
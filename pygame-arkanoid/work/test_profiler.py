@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-subsystem frame profiler.
+"""
+
+import csv
+import os
+import tempfile
+
+import pygame
+
+from main import Game
+from profiler import FrameProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    with profiler.section('update'):
+        profiler.lap('update.ball_physics')
+    profiler.end_frame()
+    assert profiler.names() == []
+    assert profiler.frame_count == 0
+
+
+def test_sections_and_laps_feed_rolling_percentiles():
+    profiler = FrameProfiler(enabled=True, window=10)
+    for _ in range(25):
+        profiler.begin_frame()
+        with profiler.section('update'):
+            sum(range(1000))
+            profiler.lap('update.ball_physics')
+        profiler.end_frame()
+    assert sorted(profiler.names()) == ['frame', 'update', 'update.ball_physics']
+    assert len(profiler._series['frame']) == 10 # Only the last window frames are kept
+    p50, p95, p99 = profiler.percentiles('frame')
+    assert 0 < p50 <= p95 <= p99
+    assert profiler.percentiles('update.ball_physics')[0] <= profiler.percentiles('update')[0]
+
+
+def test_game_profile_covers_subsystems_and_dumps_csv():
+    game = Game(headless=True, seed=3)
+    path = os.path.join(tempfile.mkdtemp(), 'profile.csv')
+    game.profiler = FrameProfiler(enabled=True, csv_path=path)
+    game.profiler.toggle_overlay()
+    game.step({pygame.K_SPACE})
+    for _ in range(30):
+        game.step({pygame.K_LEFT})
+    game.profiler.close()
+
+    names = game.profiler.names()
+    for name in ['update.ball_physics', 'update.brick_collision', 'update.power_ups', 'update.lasers',
+                 'update.particles', 'draw.hud', 'draw.flip', 'draw.profiler', 'frame']:
+        assert name in names
+    with open(path, newline='') as file:
+        rows = list(csv.reader(file))
+    assert rows[0][0] == 'frame' and 'draw.hud_ms' in rows[0]
+    assert len(rows) == 1 + 31
+
+
+if __name__ == "__main__":
+    test_disabled_profiler_records_nothing()
+    test_sections_and_laps_feed_rolling_percentiles()
+    test_game_profile_covers_subsystems_and_dumps_csv()
+    print("✅ FrameProfiler tests passed")
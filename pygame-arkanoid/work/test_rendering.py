@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the dirty-rectangle renderer.
+"""
+
+import random
+
+import numpy as np
+import pygame
+
+from main import Game
+from rendering import RenderQueue
+
+
+def _play(dirty_rects):
+    """Plays a short scripted session and returns the final frame's pixels."""
+    random.seed(7)
+    game = Game(headless=True, dirty_rects=dirty_rects)
+    game.particles.rng = np.random.default_rng(7)
+    game.step({pygame.K_SPACE})
+    for tick in range(400):
+        game.step({pygame.K_LEFT} if tick % 50 < 20 else {pygame.K_RIGHT})
+    return game, pygame.image.tobytes(game.screen, 'RGB')
+
+
+def test_dirty_rect_frames_match_full_redraw():
+    _, full_frame = _play(dirty_rects=False)
+    game, dirty_frame = _play(dirty_rects=True)
+    assert dirty_frame == full_frame
+    assert game.renderer.partial_presents > game.renderer.full_presents
+
+
+def test_static_screen_only_presents_once():
+    game = Game(headless=True, dirty_rects=True)
+    for _ in range(30):
+        game.step()
+    assert game.renderer.full_presents == 1
+
+
+def test_render_queue_draws_layers_back_to_front():
+    screen = pygame.Surface((20, 10))
+    queue = RenderQueue(screen)
+    red, green = pygame.Surface((10, 10)), pygame.Surface((10, 10))
+    red.fill((255, 0, 0))
+    green.fill((0, 255, 0))
+    queue.push(RenderQueue.SPRITES, green, (5, 0)) # Pushed first, but on the upper layer
+    hud = queue.layer(RenderQueue.HUD)
+    assert hud.blit(red, (0, 0)) == pygame.Rect(0, 0, 10, 10)
+    hud.blits([(red, (10, 0))], doreturn=False)
+    assert screen.get_at((7, 5)) == (0, 0, 0) # Nothing drawn before the flush
+    queue.flush()
+    assert screen.get_at((2, 5))[:3] == (255, 0, 0)
+    assert screen.get_at((7, 5))[:3] == (0, 255, 0)
+    assert screen.get_at((17, 5))[:3] == (255, 0, 0)
+    assert (queue.calls, queue.commands) == (2, 3) # One call per layer
+
+
+def test_playing_frame_batches_blits_per_layer():
+    game = Game(headless=True, seed=2)
+    game.step({pygame.K_SPACE})
+    for _ in range(60):
+        game.step({pygame.K_LEFT})
+    calls, commands = game.render_queue.calls, game.render_queue.commands
+    game._draw_elements()
+    assert game.render_queue.calls - calls <= 6
+    assert game.render_queue.commands - commands > game.render_queue.calls - calls
+
+
+def test_level_complete_screen_is_composed_once_per_entry():
+    game = Game(headless=True, seed=1)
+    game.step({pygame.K_SPACE})
+    game._next_level()
+    game.particles.clear()
+    game.step()
+    frame = pygame.image.tobytes(game.screen, 'RGB')
+    cache, lookups = game._screen_cache, game.text_cache.hits + game.text_cache.misses
+    for _ in range(10):
+        game.step()
+    assert game._screen_cache is cache
+    assert game.text_cache.hits + game.text_cache.misses == lookups + 10 # Only the mute button label
+    assert pygame.image.tobytes(game.screen, 'RGB') == frame
+    game._invalidate_screen_caches() # As on a window resize
+    game.step()
+    assert game._screen_cache is cache and pygame.image.tobytes(game.screen, 'RGB') == frame
+    assert game.text_cache.hits + game.text_cache.misses > lookups + 11 # Composed again
+
+
+if __name__ == "__main__":
+    test_dirty_rect_frames_match_full_redraw()
+    test_static_screen_only_presents_once()
+    test_render_queue_draws_layers_back_to_front()
+    test_playing_frame_batches_blits_per_layer()
+    test_level_complete_screen_is_composed_once_per_entry()
+    print("✅ Dirty-rect renderer tests passed")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for seeded random streams and deterministic input recording/replay.
+"""
+
+import argparse
+import os
+import tempfile
+
+import pygame
+
+from main import Game, _seed_arg
+from replay import InputLog, InputRecorder, decode_tick, encode_tick, replay
+
+
+def _record_session(path, seed=1234, ticks=1500, mega_balls=0, ball_collisions=False):
+    """Plays a scripted session with recording on and saves it to path."""
+    game = Game(headless=True, render=False, seed=seed, mega_balls=mega_balls, ball_collisions=ball_collisions)
+    game.recorder = InputRecorder(path, game.seed, game.sim_rate, game.mega_balls, ball_collisions)
+    game.step({pygame.K_SPACE})
+    for tick in range(ticks):
+        held = {pygame.K_LEFT} if (tick // 40) % 2 else {pygame.K_RIGHT}
+        if tick % 90 == 0:
+            held.add(pygame.K_SPACE)
+        game.step(held, [pygame.K_f] if tick % 25 == 0 else None)
+    game.recorder.save(game)
+    return game
+
+
+def test_same_seed_builds_the_same_session():
+    first = Game(headless=True, render=False, seed=99)
+    second = Game(headless=True, render=False, seed=99)
+    first.level = second.level = 4 # Gaps only appear from level 3 on
+    assert [tuple(b.rect) for b in first._create_brick_wall()] == [tuple(b.rect) for b in second._create_brick_wall()]
+
+
+def test_tick_encoding_round_trips():
+    keys, presses = decode_tick(encode_tick({pygame.K_LEFT: True, pygame.K_RIGHT: False, pygame.K_SPACE: True},
+                                            [pygame.K_m]))
+    assert keys == {pygame.K_LEFT, pygame.K_SPACE}
+    assert presses == [pygame.K_m]
+
+
+def test_replay_reproduces_recorded_session():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.arkr')
+        recorded = _record_session(path)
+        log = InputLog.load(path)
+        assert len(log.ticks) == recorded.tick_count
+        assert os.path.getsize(path) < recorded.tick_count # Well under a byte per tick once compressed
+
+        matches, replayed = replay(log)
+        assert matches
+        assert replayed.score == recorded.score
+
+
+def test_replay_restores_mega_ball_mode_and_ball_collisions():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.arkr')
+        recorded = _record_session(path, ticks=600, mega_balls=20, ball_collisions=True)
+        assert recorded.ball_collider.collisions > 0
+        log = InputLog.load(path)
+        assert (log.mega_balls, log.ball_collisions) == (20, True)
+        matches, replayed = replay(log)
+        assert matches
+        assert replayed.score == recorded.score
+
+
+def test_replay_detects_diverging_input():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.arkr')
+        _record_session(path)
+        log = InputLog.load(path)
+        ticks = bytearray(log.ticks)
+        for tick in range(10, 400):
+            ticks[tick] = encode_tick({pygame.K_LEFT: True, pygame.K_RIGHT: False, pygame.K_SPACE: False}, [])
+        log.ticks = bytes(ticks)
+        matches, _ = replay(log)
+        assert not matches
+
+
+def test_recording_survives_a_crash():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'session.arkr')
+        game = Game(headless=True, render=False, seed=77)
+        game.recorder = InputRecorder(path, game.seed, game.sim_rate)
+        update = game._update_game_logic
+        def crash_at_tick_50(keys):
+            if game.tick_count == 50:
+                raise RuntimeError("crash")
+            update(keys)
+        game._update_game_logic = crash_at_tick_50
+        try:
+            game.run()
+        except RuntimeError:
+            pass
+        log = InputLog.load(path)
+        assert log.seed == 77
+        assert len(log.ticks) == 51 # Up to and including the tick that crashed
+
+
+def test_seed_option_rejects_seeds_a_recording_cannot_store():
+    assert _seed_arg('42') == 42
+    assert _seed_arg(str(2 ** 64 - 1)) == 2 ** 64 - 1
+    for text in ('-1', str(2 ** 64), 'abc'):
+        try:
+            _seed_arg(text)
+        except argparse.ArgumentTypeError:
+            pass
+        else:
+            raise AssertionError(f"--seed {text} was accepted")
+
+
+if __name__ == "__main__":
+    test_same_seed_builds_the_same_session()
+    test_tick_encoding_round_trips()
+    test_replay_reproduces_recorded_session()
+    test_replay_restores_mega_ball_mode_and_ball_collisions()
+    test_replay_detects_diverging_input()
+    test_recording_survives_a_crash()
+    test_seed_option_rejects_seeds_a_recording_cannot_store()
+    print("✅ Replay tests passed")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-driven collision scheduler.
+"""
+
+import random
+
+import pygame
+
+from batch_sim import TrackingPolicy
+from game_objects import Ball, Brick, BrickField, Paddle
+from main import Game
+from scheduler import CollisionScheduler
+
+
+def _free_ball(center, speed):
+    ball = Ball(800, 600, random.Random(1))
+    ball.is_glued = False
+    ball.rect.center = center
+    ball.speed_x, ball.speed_y = speed
+    return ball
+
+
+def _trace(event_physics, ticks):
+    game = Game(headless=True, render=False, seed=1, event_physics=event_physics)
+    policy = TrackingPolicy(1, 0.8)
+    trace = []
+    for _ in range(ticks):
+        game.step(*policy.inputs(game))
+        trace.append((game.score, game.lives, len(game.bricks), [tuple(ball.rect) for ball in game.balls]))
+    return trace, game
+
+
+def test_matches_per_tick_sweeps():
+    swept, _ = _trace(False, 3000)
+    scheduled, game = _trace(True, 3000)
+    assert scheduled == swept
+    assert game.scheduler.events < 3000 // 5 # Work follows the bounces, not the ticks
+
+
+def test_long_step_processes_only_bounces():
+    scheduler = CollisionScheduler()
+    paddle = Paddle(800, 600)
+    paddle.rect.x = 0 # Out of the ball's way
+    paddle.rect.width = 10
+    ball = _free_ball((400, 100), (6, 0)) # Bounces between the side walls forever
+    [(status, collision_object, _)] = scheduler.update([ball], paddle, BrickField(0, 0, 1, 1, 0, 0), dt=1000)
+    assert (status, collision_object) == ('playing', 'wall')
+    assert scheduler.events == 8 # Capped like Ball.update: the rest of the step is dropped
+    scheduler.update([ball], paddle, scheduler.bricks, dt=200)
+    assert scheduler.events == 8 + 1 # One 780 px crossing takes 130 ticks
+
+
+def test_broken_brick_is_flown_through():
+    bricks = BrickField(1, 1, 80, 25, 360, 100)
+    brick = Brick(360, 100, 75, 20, (255, 0, 0))
+    bricks.add(brick)
+    paddle = Paddle(800, 600)
+    ball = _free_ball((400, 300), (0, -6))
+    scheduler = CollisionScheduler()
+    scheduler.update([ball], paddle, bricks)
+    bricks.remove(brick) # Broken (by a laser, say) before the ball gets there
+    for _ in range(40):
+        [(_, _, bricks_hit)] = scheduler.update([ball], paddle, bricks)
+        assert bricks_hit == []
+    assert ball.rect.top < 100
+    assert scheduler.stale_events == 1
+
+
+def test_paddle_moving_into_path_is_hit():
+    paddle = Paddle(800, 600)
+    paddle.rect.x = 0
+    ball = _free_ball((600, 400), (0, 6))
+    scheduler = CollisionScheduler()
+    bricks = BrickField(0, 0, 1, 1, 0, 0)
+    scheduler.update([ball], paddle, bricks) # Falling past the paddle
+    paddle.rect.centerx = 600 # Moved under the ball
+    for _ in range(30):
+        [(status, collision_object, _)] = scheduler.update([ball], paddle, bricks)
+        if collision_object == 'paddle':
+            break
+    assert (status, collision_object) == ('playing', 'paddle')
+    assert ball.speed_y < 0
+
+
+if __name__ == "__main__":
+    test_matches_per_tick_sweeps()
+    test_long_step_processes_only_bounces()
+    test_broken_brick_is_flown_through()
+    test_paddle_moving_into_path_is_hit()
+    print("✅ CollisionScheduler tests passed")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for the surface factory converting surfaces to the display format.
+"""
+
+import pygame
+
+from main import Game
+from rendering import RenderQueue
+
+RLE = pygame.RLEACCEL | pygame.RLEACCELOK # RLEACCELOK until the first blit encodes the surface
+
+
+def test_prepare_converts_and_picks_rle_transparency():
+    game = Game(headless=True, seed=1)
+    surfaces = game.surfaces
+    image = pygame.Surface((20, 20), depth=24) # Like a loaded RGB image
+    assert not surfaces.is_display_format(image)
+    assert surfaces.is_display_format(surfaces.prepare(image))
+
+    keyed = surfaces.prepare(pygame.Surface((20, 20), depth=24), colorkey=(255, 0, 255))
+    assert keyed.get_colorkey()[:3] == (255, 0, 255) and keyed.get_flags() & RLE
+    tinted = surfaces.prepare(pygame.Surface((20, 20)), alpha=160)
+    assert tinted.get_alpha() == 160 and tinted.get_flags() & RLE
+    text = game.text_cache.render(game.game_font, "GAME OVER", (255, 100, 100))
+    assert text.get_flags() & pygame.SRCALPHA and text.get_flags() & RLE
+    assert not surfaces.prepare(pygame.Surface((20, 20), pygame.SRCALPHA), rle=False).get_flags() & RLE
+
+
+def test_debug_mode_counts_unconverted_blits():
+    game = Game(headless=True, seed=1)
+    game.step({pygame.K_SPACE})
+    game.surfaces.debug = True
+    game.step()
+    assert game.surfaces.unconverted_last_frame == 0 # Everything drawn was prepared
+
+    image = pygame.Surface((20, 20), depth=24)
+    game.render_queue.push(RenderQueue.UI, image, (0, 0))
+    game.step()
+    assert game.surfaces.unconverted_last_frame == 1
+    assert "1 unconverted" in game.surfaces.summary()
+
+
+if __name__ == "__main__":
+    test_prepare_converts_and_picks_rle_transparency()
+    test_debug_mode_counts_unconverted_blits()
+    print("✅ Surface factory tests passed")
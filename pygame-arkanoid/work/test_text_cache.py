@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the font and rendered-text cache.
+"""
+
+import pygame
+
+from text_cache import TextCache
+
+
+def _make_cache(**kwargs):
+    """Creates a cache, (re)initializing the font module other tests may have shut down."""
+    pygame.font.init()
+    return TextCache(**kwargs)
+
+
+def test_fonts_are_loaded_once_per_name_and_size():
+    cache = _make_cache()
+    assert cache.font(None, 24) is cache.font(None, 24)
+    assert cache.font(None, 24) is not cache.font(None, 30)
+
+
+def test_unchanged_text_is_served_from_cache():
+    cache = _make_cache()
+    font = cache.font(None, 24)
+    first = cache.render(font, "SCORE: 10", (255, 255, 255))
+    assert cache.render(font, "SCORE: 10", pygame.Color(255, 255, 255)) is first
+    assert cache.render(font, "SCORE: 20", (255, 255, 255)) is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_surface_is_evicted():
+    cache = _make_cache(max_surfaces=2)
+    font = cache.font(None, 24)
+    a = cache.render(font, "A", (255, 255, 255))
+    cache.render(font, "B", (255, 255, 255))
+    cache.render(font, "A", (255, 255, 255)) # A is now most recent
+    cache.render(font, "C", (255, 255, 255)) # Evicts B
+    assert cache.evictions == 1
+    assert cache.render(font, "A", (255, 255, 255)) is a
+    misses = cache.misses
+    cache.render(font, "B", (255, 255, 255))
+    assert cache.misses == misses + 1
+
+
+if __name__ == "__main__":
+    test_fonts_are_loaded_once_per_name_and_size()
+    test_unchanged_text_is_served_from_cache()
+    test_least_recently_used_surface_is_evicted()
+    print("✅ TextCache tests passed")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the fixed-timestep simulation: rate independence and interpolation.
+"""
+
+import pygame
+
+from game_objects import Laser
+from main import Game
+
+
+def _paddle_travel(sim_rate, seconds):
+    game = Game(headless=True, render=False, sim_rate=sim_rate)
+    game.step({pygame.K_SPACE})
+    start_x = game.paddle.rect.x
+    for _ in range(int(seconds * sim_rate)):
+        game.step({pygame.K_LEFT})
+    return start_x - game.paddle.rect.x
+
+
+def test_paddle_speed_does_not_depend_on_sim_rate():
+    travel_60 = _paddle_travel(60, 0.5)
+    assert travel_60 == _paddle_travel(120, 0.5)
+    assert abs(travel_60 - _paddle_travel(144, 0.5)) <= 1
+
+
+def test_power_up_lasts_ten_seconds_at_any_rate():
+    for sim_rate in (30, 60, 144):
+        game = Game(headless=True, render=False, sim_rate=sim_rate)
+        game._reset_game() # Ball stays glued to the paddle, so no life is lost meanwhile
+        game.paddle.activate_power_up('laser')
+        for _ in range(10 * sim_rate - 1):
+            game.step()
+        assert game.paddle.has_laser
+        game.step()
+        assert not game.paddle.has_laser
+
+
+def test_interpolated_rect_lies_between_ticks():
+    laser = Laser(100, 300)
+    laser.save_previous()
+    laser.update()
+    assert laser.interpolated_rect(0.0).y == 300
+    assert laser.interpolated_rect(0.5).y == 296
+    assert laser.interpolated_rect(1.0).y == laser.rect.y == 292
+
+
+def test_lasers_do_not_skip_bricks_at_low_rates():
+    # At 6 Hz a laser moves 80 px per tick, four times a brick's height; at 4 Hz one tick
+    # can carry it from below the top row to above the screen
+    for sim_rate, row in ((6, max), (4, min), (5, min), (6, min)):
+        game = Game(headless=True, render=False, sim_rate=sim_rate)
+        game._reset_game()
+        kept = row(brick.rect.y for brick in game.bricks)
+        for brick in [brick for brick in game.bricks if brick.rect.y != kept]:
+            game.bricks.remove(brick) # Leave one row: a 20 px target
+        game.paddle.activate_power_up('laser')
+        game.step(set(), [pygame.K_f])
+        bricks = len(game.bricks)
+        for _ in range(12):
+            game.step()
+        assert len(game.bricks) == bricks - 2, (sim_rate, row.__name__)
+        assert not game.lasers
+
+
+if __name__ == "__main__":
+    test_paddle_speed_does_not_depend_on_sim_rate()
+    test_power_up_lasts_ten_seconds_at_any_rate()
+    test_interpolated_rect_lies_between_ticks()
+    test_lasers_do_not_skip_bricks_at_low_rates()
+    print("✅ Fixed-timestep tests passed")
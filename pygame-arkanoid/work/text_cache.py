@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+import pygame
+
+from atlas import GlyphAtlas
+
+
+class TextCache:
+    """
+    Cache for fonts and rendered text surfaces.
+    Fonts are loaded once per (name, size); rendered surfaces are kept in an
+    LRU keyed by (font, text, color, antialias), so unchanged labels are never
+    rasterized twice. Returned surfaces are shared and must not be drawn on.
+    Given a SurfaceFactory, text is rendered through it (display format, RLE).
+    Text that changes all the time (scores, counters) is better drawn from a
+    GlyphAtlas (glyphs()), built once per font and colour.
+    """
+    def __init__(self, max_surfaces=256, surfaces=None):
+        self.max_surfaces = max_surfaces
+        self.surfaces = surfaces # SurfaceFactory rendering the text, if any
+        self._fonts = {} # (name, size) -> Font
+        self._surfaces = OrderedDict() # (font, text, color, antialias) -> Surface, oldest first
+        self._glyphs = {} # (font, color, labels) -> GlyphAtlas
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, name, size):
+        """Returns the Font for (name, size), loading it on first use (name None = default font)."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """Returns text rendered with font, rasterizing it only on a cache miss."""
+        key = (font, text, tuple(pygame.Color(color)), antialias) # Color() so (r, g, b) == Color(r, g, b)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if self.surfaces is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = self.surfaces.render(font, text, color, antialias)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def glyphs(self, font, color, labels=()):
+        """Returns the GlyphAtlas of font in color with labels, rasterizing it on first use."""
+        key = (font, tuple(pygame.Color(color)), tuple(labels))
+        atlas = self._glyphs.get(key)
+        if atlas is None:
+            atlas = self._glyphs[key] = GlyphAtlas(font, color, labels)
+        return atlas
+
+    @property
+    def hit_rate(self):
+        """Fraction of render() calls served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Returns a snapshot of the cache counters."""
+        return {
+            'fonts': len(self._fonts),
+            'surfaces': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }